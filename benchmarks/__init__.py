@@ -0,0 +1,4 @@
+"""Performance benchmarks for moviebox-api
+
+Run any of the modules using `python -m benchmarks.<module-name>`
+"""
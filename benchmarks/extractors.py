@@ -0,0 +1,302 @@
+"""Benchmarks the item details extractors over the recorded pages and
+regenerates `assets/data/extractors_benchmark.json`.
+
+Reports:
+- Total seconds taken to extract details from 0, 10, ... pages by
+  `TagDetailsExtractor` & `JsonDetailsExtractor` and their `*Model` variants.
+  Saved (`--output`) in the schema of `assets/data/extractors_benchmark.json`.
+- Median time of each phase - loading/parsing, resolving/extracting and
+  pydantic validation - per recorded page. The nuxt payloads recorded in
+  `assets/recons` only go through the json phases after loading.
+- Peak memory allocated (tracemalloc) by each extractor per page.
+
+A run can be compared against a previous one (`--compare`) and exits with
+status 1 when any extractor got slower than `--threshold`.
+
+Usage:
+    python -m benchmarks.extractors [--pages 90] [--step 10] [--repeat 5]
+        [--output assets/data/extractors_benchmark.json] [--report path]
+        [--compare previous.json] [--threshold 0.1]
+    python -m benchmarks.extractors --compare previous.json current.json
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from itertools import cycle, islice
+from pathlib import Path
+from statistics import median
+
+from moviebox_api.v1.extractor._core import (
+    JsonDetailsExtractor,
+    JsonDetailsExtractorModel,
+    TagDetailsExtractor,
+    TagDetailsExtractorModel,
+)
+from moviebox_api.v1.extractor.models.json import ItemJsonDetailsModel
+from moviebox_api.v1.extractor.models.tag import ItemTagDetailsModel
+
+ASSETS_DIR = Path(__file__).parents[1] / "assets"
+PAGES_DIR = ASSETS_DIR / "data"
+PAYLOADS_DIR = ASSETS_DIR / "recons" / "nuxt.js"
+
+EXTRACTORS = {
+    "tag_extractor": lambda content: TagDetailsExtractor(content).extract_all(),
+    "json_extractor": lambda content: JsonDetailsExtractor(content).details,
+    "tag_extractor_model": lambda content: (
+        TagDetailsExtractorModel(content).details
+    ),
+    "json_extractor_model": lambda content: (
+        JsonDetailsExtractorModel(content).details
+    ),
+}
+"""Name of the extractor mapped to a call extracting all details of a page"""
+
+SCHEMA_EXTRACTORS = ("tag_extractor", "json_extractor")
+"""Extractors saved in `extractors_benchmark.json`"""
+
+
+def load_pages() -> dict[str, str]:
+    """Recorded item pages (html)"""
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(PAGES_DIR.glob("*.page"))
+    }
+
+
+def load_payloads() -> dict[str, list]:
+    """Recorded nuxt payloads that are valid item details"""
+    payloads = {}
+    for path in sorted(PAYLOADS_DIR.glob("**/*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"), strict=False)
+            JsonDetailsExtractor.from_data(data)
+        except Exception:
+            continue
+
+        payloads[str(path.relative_to(PAYLOADS_DIR))] = data
+
+    return payloads
+
+
+def timeit(function, repeat: int) -> float:
+    """Median seconds taken by a call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def measure_peak_memory(function) -> int:
+    """Peak bytes allocated by a call"""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_totals(
+    pages: dict[str, str], total_pages: int, step: int
+) -> dict[str, dict[str, float]]:
+    """Total seconds taken by each extractor over increasing number of pages"""
+    totals = {}
+    for total in range(0, total_pages + 1, step):
+        contents = list(islice(cycle(pages.values()), total))
+        totals[str(total)] = {}
+
+        for name, extract in EXTRACTORS.items():
+            start = time.perf_counter()
+            for content in contents:
+                extract(content)
+            totals[str(total)][name] = time.perf_counter() - start
+
+    return totals
+
+
+def measure_page_phases(content: str, repeat: int) -> dict[str, float]:
+    """Median seconds of each extraction phase of a page"""
+    data = JsonDetailsExtractor.load_json_script(content)
+    tag_extractor = TagDetailsExtractor(content)
+    tag_details = tag_extractor.extract_all()
+
+    def extract_tags():
+        tag_extractor.__dict__.pop("_results", None)  # Results are cached
+        tag_extractor.extract_all()
+
+    return {
+        "json.load": timeit(
+            lambda: JsonDetailsExtractor.load_json_script(content), repeat
+        ),
+        **measure_payload_phases(data, repeat),
+        "tag.parse": timeit(lambda: TagDetailsExtractor(content), repeat),
+        "tag.extract": timeit(extract_tags, repeat),
+        "tag.validate": timeit(
+            lambda: ItemTagDetailsModel(**tag_details), repeat
+        ),
+    }
+
+
+def measure_payload_phases(data: list, repeat: int) -> dict[str, float]:
+    """Median seconds of the json phases that follow loading of the payload"""
+    details = JsonDetailsExtractor.from_data(data).details
+    return {
+        "json.resolve": timeit(
+            lambda: JsonDetailsExtractor.from_data(data).details, repeat
+        ),
+        "json.validate": timeit(lambda: ItemJsonDetailsModel(**details), repeat),
+    }
+
+
+def measure_memory(pages: dict[str, str]) -> dict[str, dict[str, int]]:
+    """Peak bytes allocated by each extractor per page"""
+    return {
+        page: {
+            name: measure_peak_memory(lambda: extract(content))
+            for name, extract in EXTRACTORS.items()
+        }
+        for page, content in pages.items()
+    }
+
+
+def load_totals(path: Path) -> dict[str, dict[str, float]]:
+    """Totals of a run saved using either `--output` or `--report`"""
+    saved = json.loads(path.read_text())
+    return saved.get("totals", saved)
+
+
+def compare(
+    previous: dict[str, dict[str, float]],
+    current: dict[str, dict[str, float]],
+    threshold: float,
+) -> bool:
+    """Prints changes of the totals at the largest common number of pages
+
+    Returns:
+        bool: Whether any extractor got slower than `threshold`
+    """
+    common = sorted(set(previous) & set(current), key=int)
+
+    if not common or common[-1] == "0":
+        print("Nothing to compare")
+        return False
+
+    total = common[-1]
+    regressed = False
+    print(f"\nComparison at {total} pages (threshold {threshold:.0%})")
+
+    for name in current[total]:
+        if name not in previous[total]:
+            continue
+
+        before, after = previous[total][name], current[total][name]
+        change = (after - before) / before
+        status = "ok"
+
+        if change > threshold:
+            status = "REGRESSION"
+            regressed = True
+
+        print(
+            f"{name:<22}{before:>10.3f}s{after:>10.3f}s{change:>+10.1%}  {status}"
+        )
+
+    return regressed
+
+
+def print_table(title: str, rows: dict[str, dict], unit: str, scale: float):
+    columns = list(next(iter(rows.values())))
+    print(f"\n{title}")
+    print(f"{'':<30}" + "".join(f"{column:>22}" for column in columns))
+    for row, values in rows.items():
+        print(
+            f"{row:<30}"
+            + "".join(
+                f"{values[column] * scale:>20.2f}{unit}" for column in columns
+            )
+        )
+
+
+def main(args: argparse.Namespace) -> int:
+    if len(args.compare) == 2:
+        previous, current = (load_totals(path) for path in args.compare)
+        return int(compare(previous, current, args.threshold))
+
+    pages = load_pages()
+    payloads = load_payloads()
+
+    totals = measure_totals(pages, args.pages, args.step)
+    print_table("Total time per number of pages", totals, "s", 1)
+
+    phases = {
+        page: measure_page_phases(content, args.repeat)
+        for page, content in pages.items()
+    }
+    print_table("Median time per phase", phases, "ms", 1000)
+
+    payload_phases = {
+        name: measure_payload_phases(data, args.repeat)
+        for name, data in payloads.items()
+    }
+    if payload_phases:
+        print_table(
+            "Median time per phase (recorded payloads)",
+            payload_phases,
+            "ms",
+            1000,
+        )
+
+    memory = measure_memory(pages)
+    print_table("Peak memory allocated per page", memory, "KiB", 1 / 1024)
+
+    schema_totals = {
+        total: {name: secs[name] for name in SCHEMA_EXTRACTORS}
+        for total, secs in totals.items()
+    }
+
+    if args.output is not None:
+        args.output.write_text(json.dumps(schema_totals, indent=4))
+        print(f"\nSaved totals to {args.output}")
+
+    if args.report is not None:
+        report = {
+            "totals": totals,
+            "phases": phases | payload_phases,
+            "peak_memory": memory,
+        }
+        args.report.write_text(json.dumps(report, indent=4) + "\n")
+        print(f"Saved report to {args.report}")
+
+    if args.compare:
+        return int(compare(load_totals(args.compare[0]), totals, args.threshold))
+
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--pages", type=int, default=90)
+    parser.add_argument("--step", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--output",
+        type=Path,
+        help="Totals in the schema of extractors_benchmark.json",
+    )
+    parser.add_argument("--report", type=Path, help="Totals, phases & memory")
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="Previous run (and optionally current one)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.1)
+    sys.exit(main(parser.parse_args()))
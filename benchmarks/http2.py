@@ -0,0 +1,129 @@
+"""Compares throughput of concurrent metadata calls made by `Session` over
+HTTP/1.1 against HTTP/2 using a local h2-capable stub server.
+
+The stub speaks cleartext HTTP/2 (h2c) so the HTTP/2 run uses prior knowledge
+(`http1=False`); real hosts negotiate it over TLS (ALPN) instead.
+
+Requires `hypercorn` and `h2` - `uv sync --group bench --extra http2`
+
+Usage:
+    python -m benchmarks.http2 [--requests 200] [--rounds 5] [--latency 0.02]
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import threading
+import time
+
+from hypercorn.asyncio import serve
+from hypercorn.config import Config
+
+from moviebox_api.v1.requests import Session
+
+BODY = json.dumps(
+    {"code": 0, "message": "ok", "data": {"items": [], "pager": {}}}
+).encode()
+
+
+def make_app(latency: float):
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+
+        await asyncio.sleep(latency)  # upstream processing time
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": BODY})
+
+    return app
+
+
+class H2StubServer:
+    """Runs a hypercorn server, speaking both HTTP/1.1 and h2c, in a
+    background thread"""
+
+    def __init__(self, latency: float):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+
+        self._config = Config()
+        self._config.bind = [f"127.0.0.1:{self.port}"]
+        self._config.loglevel = "ERROR"
+        self._app = make_app(latency)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._started = threading.Event()
+
+    def _run(self):
+        async def main():
+            self._loop = asyncio.get_running_loop()
+            self._stop = asyncio.Event()
+            self._started.set()
+            await serve(self._app, self._config, shutdown_trigger=self._stop.wait)
+
+        asyncio.run(main())
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        self._started.wait()
+        time.sleep(0.5)  # let it bind
+        return f"http://127.0.0.1:{self.port}"
+
+    def __exit__(self, *args):
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join(timeout=5)
+
+
+async def run(session: Session, url: str, total: int) -> tuple[float, str]:
+    start = time.perf_counter()
+    await asyncio.gather(*(session.get_from_api(url) for _ in range(total)))
+    elapsed = time.perf_counter() - start
+
+    response = await session.get(url)
+    return total / elapsed, response.http_version
+
+
+async def main(total: int, rounds: int, latency: float):
+    results = {}
+
+    with H2StubServer(latency) as base_url:
+        urls = [
+            f"{base_url}/wefeed-h5-bff/web/subject/trending?page={round_}"
+            for round_ in range(rounds)
+        ]
+
+        for name, options in (
+            ("h1", {"http2": False}),
+            ("h2", {"http2": True, "http1": False}),
+        ):
+            async with Session(headers={}, coalesce=False, **options) as session:
+                await run(session, urls[0], 10)  # warm-up
+                samples = []
+                for url in urls:
+                    throughput, http_version = await run(session, url, total)
+                    samples.append(throughput)
+
+            results[name] = (max(samples), http_version)
+
+    print(f"{'concurrent requests':<20}: {total} x {rounds} rounds")
+    print(f"{'server latency':<20}: {latency * 1000:.0f} ms")
+    for name, (throughput, http_version) in results.items():
+        label = f"{name} ({http_version})"
+        print(f"{label:<20}: {throughput:10.1f} req/s")
+    print(f"{'speedup':<20}: {results['h2'][0] / results['h1'][0]:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rounds, args.latency))
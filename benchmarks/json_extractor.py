@@ -0,0 +1,71 @@
+"""Compares `JsonDetailsExtractor.extract` with its json script located by
+slicing the page (fast path) against parsing the whole page with
+`BeautifulSoup` (previous approach) over the sample item pages.
+
+Usage:
+    python -m benchmarks.json_extractor [--repeat 20]
+"""
+
+import argparse
+import time
+from json import loads
+from pathlib import Path
+from statistics import median
+from unittest import mock
+
+from moviebox_api.v1.extractor import _core
+from moviebox_api.v1.extractor._core import JsonDetailsExtractor
+from moviebox_api.v1.extractor.helpers import find_json_script, souper
+
+PAGES_DIR = Path(__file__).parents[1] / "assets" / "data"
+PAGES = ("avatar.page", "shannara-chronicles.page")
+
+
+def timeit(function, repeat: int) -> float:
+    """Median seconds taken by a call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def main(repeat: int):
+    print(f"{'page':<26}{'phase':<10}{'soup':>10}{'fast':>10}{'speedup':>10}")
+
+    for page in PAGES:
+        content = (PAGES_DIR / page).read_text(encoding="utf-8")
+
+        soup_locate = timeit(
+            lambda: loads(
+                souper(content).find("script", {"type": "application/json"}).text
+            ),
+            repeat,
+        )
+        fast_locate = timeit(lambda: loads(find_json_script(content)), repeat)
+
+        with mock.patch.object(_core, "find_json_script", return_value=None):
+            soup_extract = timeit(
+                lambda: JsonDetailsExtractor.extract(content), repeat
+            )
+
+        fast_extract = timeit(
+            lambda: JsonDetailsExtractor.extract(content), repeat
+        )
+
+        for phase, soup, fast in (
+            ("locate", soup_locate, fast_locate),
+            ("extract", soup_extract, fast_extract),
+        ):
+            print(
+                f"{page:<26}{phase:<10}{soup * 1000:>8.2f}ms{fast * 1000:>8.2f}ms"
+                f"{soup / fast:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,107 @@
+"""Compares `resolve_nuxt_payload` against the previous recursive resolver
+over the recorded nuxt payloads in `assets/recons/nuxt.js/*` and the sample
+item pages in `assets/data`.
+
+Usage:
+    python -m benchmarks.nuxt_resolver [--repeat 50]
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+from statistics import median
+
+from moviebox_api.v1.extractor.helpers import (
+    find_json_script,
+    resolve_nuxt_payload,
+)
+
+ASSETS_DIR = Path(__file__).parents[1] / "assets"
+
+
+def resolve_nuxt_payload_recursively(data: list) -> dict | None:
+    """The previous resolver - resolves references afresh every time and
+    every top-level object"""
+    extracts = []
+
+    def resolve_value(value):
+        if type(value) is list:
+            return [
+                resolve_value(data[index] if type(index) is int else index)
+                for index in value
+            ]
+
+        elif type(value) is dict:
+            processed_value = {}
+            for k, v in value.items():
+                processed_value[k] = resolve_value(data[v])
+            return processed_value
+
+        return value
+
+    for entry in data:
+        if type(entry) is dict:
+            details = {}
+            for key, index in entry.items():
+                details[key] = resolve_value(data[index])
+
+            extracts.append(details)
+
+    return extracts[0] if extracts else None
+
+
+def load_payloads() -> dict[str, list]:
+    """Raw nuxt payloads - arrays whose first entry is a reference"""
+    payloads = {}
+
+    for path in sorted((ASSETS_DIR / "recons" / "nuxt.js").glob("*/*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"), strict=False)
+        except ValueError:
+            continue
+
+        if type(data) is list and data and type(data[0]) is list:
+            payloads[f"{path.parent.name}/{path.name}"] = data
+
+    for path in sorted((ASSETS_DIR / "data").glob("*.page")):
+        content = path.read_text(encoding="utf-8")
+        payloads[path.name] = json.loads(find_json_script(content))
+
+    return payloads
+
+
+def timeit(function, repeat: int) -> float:
+    """Median seconds taken by a call"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return median(timings)
+
+
+def main(repeat: int):
+    print(
+        f"{'payload':<30}{'entries':>8}{'recursive':>12}{'memoized':>12}"
+        f"{'speedup':>9}"
+    )
+
+    for name, data in load_payloads().items():
+        assert resolve_nuxt_payload(data) == resolve_nuxt_payload_recursively(
+            data
+        ), f"Mismatched resolution of {name}"
+
+        before = timeit(lambda: resolve_nuxt_payload_recursively(data), repeat)
+        after = timeit(lambda: resolve_nuxt_payload(data), repeat)
+        print(
+            f"{name:<30}{len(data):>8}{before * 1000:>10.2f}ms"
+            f"{after * 1000:>10.2f}ms{before / after:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,60 @@
+"""Compares requests/sec of `Session.get_from_api` against the previous
+per-call `httpx.AsyncClient` approach using a local stub server.
+
+Usage:
+    python -m benchmarks.session_pool [--requests 2000] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+
+from benchmarks.stub_server import StubServer
+from moviebox_api.v1.helpers import process_api_response
+from moviebox_api.v1.requests import Session
+
+
+async def per_call_client_get(url: str) -> dict:
+    """Replicates the old `Session.get` - a fresh client for every call.
+    The client is closed here so that leaked sockets do not skew the run."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url)
+        response.raise_for_status()
+        return process_api_response(response)
+
+
+async def run(fetch, url: str, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker():
+        async with semaphore:
+            await fetch(url)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(total)))
+    return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int):
+    with StubServer() as base_url:
+        url = f"{base_url}/wefeed-h5-bff/web/home"
+
+        before = await run(per_call_client_get, url, total, concurrency)
+
+        async with Session(headers={}) as session:
+            after = await run(session.get_from_api, url, total, concurrency)
+
+    print(f"requests      : {total} (concurrency {concurrency})")
+    print(f"per-call client: {before:10.1f} req/s")
+    print(f"pooled session : {after:10.1f} req/s")
+    print(f"speedup        : {after / before:10.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
@@ -0,0 +1,71 @@
+"""Local stub of the moviebox API for benchmarking the transports offline"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_DATA = {"items": [], "pager": {"hasMore": False}}
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves a successful api response for any GET or POST request"""
+
+    protocol_version = "HTTP/1.1"
+    """Keep-alive is only possible in HTTP/1.1"""
+
+    data: dict = DEFAULT_DATA
+
+    def _send_ok(self):
+        body = json.dumps({"code": 0, "message": "ok", "data": self.data})
+        encoded_body = body.encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(encoded_body)))
+        self.end_headers()
+        self.wfile.write(encoded_body)
+
+    def do_GET(self):
+        self._send_ok()
+
+    def do_POST(self):
+        length = int(self.headers.get("content-length", 0))
+        self.rfile.read(length)
+        self._send_ok()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """Runs `StubRequestHandler` in a background thread
+
+    ```python
+    with StubServer() as base_url:
+        ...
+    ```
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        handler_class: type[BaseHTTPRequestHandler] = StubRequestHandler,
+    ):
+        self._server = ThreadingHTTPServer((host, port), handler_class)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        return self.base_url
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
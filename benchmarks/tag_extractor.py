@@ -0,0 +1,79 @@
+"""Compares `TagDetailsExtractor` across html parser backends, with and
+without scoped parsing, over the sample item pages.
+
+Timings are total seconds taken to extract all details from a number of pages
+- the schema of `assets/data/extractors_benchmark.json`.
+
+Usage:
+    python -m benchmarks.tag_extractor [--pages 90] [--step 10] [--output path]
+"""
+
+import argparse
+import json
+import time
+from importlib.util import find_spec
+from itertools import cycle, islice
+from pathlib import Path
+
+from moviebox_api.v1.extractor._core import TagDetailsExtractor
+
+PAGES_DIR = Path(__file__).parents[1] / "assets" / "data"
+PAGES = ("avatar.page", "shannara-chronicles.page")
+PARSERS = ("html.parser", "lxml")
+
+
+def get_variants() -> dict[str, dict]:
+    """Installed parsers, each unscoped and scoped"""
+    variants = {}
+    for parser in PARSERS:
+        if parser != "html.parser" and find_spec(parser) is None:
+            print(f"Skipping {parser!r} - not installed")
+            continue
+
+        variants[parser] = {"parser": parser, "scoped": False}
+        variants[f"{parser}+scoped"] = {"parser": parser, "scoped": True}
+
+    return variants
+
+
+def run(contents: list[str], options: dict) -> float:
+    """Total seconds taken to extract all details of the pages"""
+    start = time.perf_counter()
+    for content in contents:
+        TagDetailsExtractor(content, **options).extract_all()
+    return time.perf_counter() - start
+
+
+def main(pages: int, step: int, output: Path | None):
+    samples = [(PAGES_DIR / page).read_text(encoding="utf-8") for page in PAGES]
+    variants = get_variants()
+    results: dict[str, dict[str, float]] = {}
+
+    print(f"{'pages':<8}" + "".join(f"{name:>20}" for name in variants))
+
+    for total in range(0, pages + 1, step):
+        contents = list(islice(cycle(samples), total))
+        results[str(total)] = {
+            name: run(contents, options) for name, options in variants.items()
+        }
+        print(
+            f"{total:<8}"
+            + "".join(f"{secs:>19.3f}s" for secs in results[str(total)].values())
+        )
+
+    baseline = results[str(total)]["html.parser"]
+    for name, secs in results[str(total)].items():
+        print(f"{name:<20}: {baseline / secs:6.2f}x faster than html.parser")
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=4))
+        print(f"Saved to {output}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=90)
+    parser.add_argument("--step", type=int, default=10)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args()
+    main(args.pages, args.step, args.output)
@@ -0,0 +1,649 @@
+"""
+Caching of parsed api responses with time-to-live set per endpoint.
+
+```python
+from moviebox_api.v1 import Session
+from moviebox_api.v1.cache import ResponseCache, SQLiteCacheBackend
+
+session = Session(cache=ResponseCache())
+# or persist on disk
+session = Session(cache=ResponseCache(SQLiteCacheBackend()))
+```
+
+Parsed item details are cached process-wide by `ItemDetailsCache`.
+"""
+
+import contextvars
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import typing as t
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from moviebox_api.v1.constants import (
+    DEFAULT_DETAILS_CACHE_MAX_BYTES,
+    DEFAULT_DETAILS_CACHE_MAX_ENTRIES,
+    DEFAULT_DETAILS_CACHE_PATH,
+    DEFAULT_DETAILS_CACHE_TTL,
+    DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_PATH,
+    DEFAULT_RESPONSE_CACHE_TTLS,
+    ENVIRONMENT_DETAILS_CACHE_KEY,
+)
+from moviebox_api.v1.helpers import assert_instance
+from moviebox_api.v1.logger import logger
+
+__all__ = [
+    "CacheStats",
+    "ResponseCache",
+    "BaseCacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
+    "ItemDetailsCache",
+    "get_default_item_details_cache",
+]
+
+_bypass_cache: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "bypass_cache", default=False
+)
+
+
+class BaseCacheBackend(ABC):
+    """Storage of serialized responses"""
+
+    @abstractmethod
+    def get(self, key: str) -> str | None:
+        """Unexpired value of the key"""
+        raise NotImplementedError("Function needs to be implemented in subclass.")
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: float) -> None:
+        """Stores value of the key for `ttl` seconds"""
+        raise NotImplementedError("Function needs to be implemented in subclass.")
+
+    @abstractmethod
+    def delete(self, pattern: str | None = None) -> int:
+        """Deletes keys containing `pattern` or all when None and returns
+        number of keys deleted"""
+        raise NotImplementedError("Function needs to be implemented in subclass.")
+
+    def __len__(self) -> int:
+        raise NotImplementedError("Function needs to be implemented in subclass.")
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """In-memory LRU bounded by both number of entries and their total size"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    ):
+        """Constructor for `MemoryCacheBackend`
+
+        Args:
+            max_entries (int, optional): Maximum number of entries. Defaults to DEFAULT_RESPONSE_CACHE_MAX_ENTRIES.
+            max_bytes (int, optional): Maximum total size of values. Defaults to DEFAULT_RESPONSE_CACHE_MAX_BYTES.
+        """  # noqa: E501
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached values"""
+        return self._size
+
+    def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            self._pop(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        if len(value) > self.max_bytes:
+            return
+
+        self._pop(key)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._size += len(value)
+
+        while (
+            len(self._entries) > self.max_entries or self._size > self.max_bytes
+        ):
+            self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._size -= len(entry[1])
+
+    def delete(self, pattern: str | None = None) -> int:
+        keys = [key for key in self._entries if pattern is None or pattern in key]
+
+        for key in keys:
+            self._pop(key)
+
+        return len(keys)
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """On-disk cache that persists across invocations and processes"""
+
+    def __init__(self, path: Path | str = DEFAULT_RESPONSE_CACHE_PATH):
+        """Constructor for `SQLiteCacheBackend`
+
+        Args:
+            path (Path | str, optional): Database file. Defaults to DEFAULT_RESPONSE_CACHE_PATH.
+        """  # noqa: E501
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+            "value TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+
+    def __repr__(self):
+        return rf"<SQLiteCacheBackend path='{self.path}'>"
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchone()
+        return count
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM responses WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+
+    def delete(self, pattern: str | None = None) -> int:
+        with self._lock:
+            if pattern is None:
+                cursor = self._connection.execute("DELETE FROM responses")
+            else:
+                cursor = self._connection.execute(
+                    "DELETE FROM responses WHERE instr(key, ?) > 0", (pattern,)
+                )
+        return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Deletes expired entries and returns their number"""
+        with self._lock:
+            cursor = self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass
+class CacheStats:
+    """Response cache usage counters"""
+
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    """Lookups skipped using `ResponseCache.bypass()`"""
+    uncacheable: int = 0
+    """Requests to endpoints without time-to-live"""
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResponseCache:
+    """Caches parsed api responses keyed by the canonical request
+
+    - The key is made of method, url path, sorted query parameters and body.
+    Request headers, including signatures and timestamps, are not part of it.
+    - Only endpoints matching a pattern in `ttls` are cached.
+    - Every hit returns a fresh copy so callers can't corrupt the cache.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+    ):
+        """Constructor for `ResponseCache`
+
+        Args:
+            backend (BaseCacheBackend | None, optional): Storage. Defaults to MemoryCacheBackend().
+            ttls (dict[str, float] | None, optional): Url path regex patterns mapped to their time-to-live in seconds. Updates DEFAULT_RESPONSE_CACHE_TTLS.
+        """  # noqa: E501
+        backend = MemoryCacheBackend() if backend is None else backend
+        assert_instance(backend, BaseCacheBackend, "backend")
+
+        self.backend = backend
+        self.ttls = {**DEFAULT_RESPONSE_CACHE_TTLS, **(ttls or {})}
+        self._ttl_patterns = [
+            (re.compile(pattern), ttl) for pattern, ttl in self.ttls.items()
+        ]
+        self.stats = CacheStats()
+
+    def __repr__(self):
+        return rf"<ResponseCache backend={self.backend!r} stats={self.stats}>"
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        body: t.Any = None,
+        scope: str | None = None,
+    ) -> str:
+        """Canonical representation of a request
+
+        Args:
+            method (str): Http method.
+            url (str): Absolute url or path with optional query.
+            params (dict[str, t.Any] | None, optional): Query parameters.
+            body (t.Any, optional): JSON-serializable request body.
+            scope (str | None, optional): Kind of client making the request
+                e.g `cookies` - its responses may differ from the rest.
+
+        Returns:
+            str: Cache key
+        """
+        parsed_url = urlsplit(url)
+        query = parse_qsl(parsed_url.query, keep_blank_values=True)
+        query.extend(
+            (str(key), str(value)) for key, value in (params or {}).items()
+        )
+
+        key = f"{method.upper()} {parsed_url.netloc}{parsed_url.path}"
+
+        if query:
+            key += "?" + urlencode(sorted(query))
+
+        if body is not None:
+            serialized_body = json.dumps(
+                body, sort_keys=True, separators=(",", ":")
+            )
+            key += " " + hashlib.sha1(serialized_body.encode()).hexdigest()
+
+        if scope is not None:
+            key += f" @{scope}"
+
+        return key
+
+    def get_ttl(self, url: str) -> float:
+        """Time-to-live of responses from the url's endpoint. 0 means
+        the endpoint is not cached."""
+        path = urlsplit(url).path
+
+        for pattern, ttl in self._ttl_patterns:
+            if pattern.search(path):
+                return ttl
+
+        return 0
+
+    async def aget_or_fetch(
+        self,
+        method: str,
+        url: str,
+        fetch: t.Callable[[], t.Awaitable[dict | list]],
+        params: dict[str, t.Any] | None = None,
+        body: t.Any = None,
+        scope: str | None = None,
+    ) -> dict | list:
+        """Get cached response data or fetch and cache it
+
+        Args:
+            method (str): Http method.
+            url (str): Absolute url or path.
+            fetch (t.Callable[[], t.Awaitable[dict | list]]): Performs the
+                actual request and returns the parsed data.
+            params (dict[str, t.Any] | None, optional): Query parameters.
+            body (t.Any, optional): JSON-serializable request body.
+            scope (str | None, optional): Kind of client making the request.
+
+        Returns:
+            dict | list: Response data
+        """
+        ttl = self.get_ttl(url)
+
+        if ttl <= 0:
+            self.stats.uncacheable += 1
+            return await fetch()
+
+        key = self.make_key(method, url, params, body, scope)
+
+        if _bypass_cache.get():
+            self.stats.bypasses += 1
+
+        else:
+            cached_value = self.backend.get(key)
+
+            if cached_value is not None:
+                self.stats.hits += 1
+                return json.loads(cached_value)
+
+            self.stats.misses += 1
+
+        data = await fetch()
+        self.backend.set(key, json.dumps(data), ttl)
+        return data
+
+    @staticmethod
+    @contextmanager
+    def bypass() -> t.Iterator[None]:
+        """Skip cache lookups within the context (of the current task) while
+        still storing the fresh responses
+
+        ```python
+        with ResponseCache.bypass():
+            await search.get_content()
+        ```
+        """
+        token = _bypass_cache.set(True)
+        try:
+            yield
+        finally:
+            _bypass_cache.reset(token)
+
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Removes cached responses
+
+        Args:
+            pattern (str | None, optional): Only remove keys containing this
+                e.g url path. Defaults to None (all).
+
+        Returns:
+            int: Number of removed entries
+        """
+        removed = self.backend.delete(pattern)
+        logger.debug(f"Invalidated {removed} cached responses - {pattern!r}")
+        return removed
+
+
+class ItemDetailsCache:
+    """LRU of parsed item details keyed by their detail path
+
+    - Holds the parsed objects so hits cost neither a request nor parsing.
+    Cached values must therefore not be modified.
+    - Models validated from a cached value can be kept alongside it in memory
+    (`set_model`) so hits skip validation too.
+    - Bounded by both number of entries and their total size - the length of
+    the body they were parsed from when known otherwise of their serialization.
+    - Optionally persisted using `backend` e.g `SQLiteCacheBackend`.
+    - Shared by the threads and event loops of the process.
+    """
+
+    _shared: "ItemDetailsCache | None" = None
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_DETAILS_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_DETAILS_CACHE_MAX_BYTES,
+        ttl: float = DEFAULT_DETAILS_CACHE_TTL,
+        backend: BaseCacheBackend | None = None,
+    ):
+        """Constructor for `ItemDetailsCache`
+
+        Args:
+            max_entries (int, optional): Maximum number of entries in memory. Defaults to DEFAULT_DETAILS_CACHE_MAX_ENTRIES.
+            max_bytes (int, optional): Maximum total size of entries in memory. Defaults to DEFAULT_DETAILS_CACHE_MAX_BYTES.
+            ttl (float, optional): Seconds an entry is considered fresh. Defaults to DEFAULT_DETAILS_CACHE_TTL.
+            backend (BaseCacheBackend | None, optional): Persistent storage. Defaults to None.
+        """  # noqa: E501
+        if backend is not None:
+            assert_instance(backend, BaseCacheBackend, "backend")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.backend = backend
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[float, int, t.Any]] = OrderedDict()
+        self._models: dict[str, t.Any] = {}
+        """Models validated from the values of the entries"""
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            rf"<ItemDetailsCache entries={len(self._entries)} "
+            rf"size={self._size} stats={self.stats}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size of entries in memory"""
+        return self._size
+
+    @classmethod
+    def shared(
+        cls, backend: BaseCacheBackend | None = None
+    ) -> "ItemDetailsCache":
+        """Process-wide item details cache
+
+        Args:
+            backend (BaseCacheBackend | None, optional): Persistent storage of the cache - only used when creating it.
+        """  # noqa: E501
+        if cls._shared is None:
+            cls._shared = cls(backend=backend)
+        return cls._shared
+
+    @staticmethod
+    def make_key(detail_path: str, namespace: str) -> str:
+        """Normalized cache key
+
+        Args:
+            detail_path (str): Item page url or its detail path e.g `/detail/avatar-WLDIi21IUBa`
+            namespace (str): Kind of cached details e.g `v1`
+
+        Returns:
+            str: Cache key
+        """  # noqa: E501
+        path = urlsplit(detail_path).path.strip("/")
+        return f"{namespace}:{path.rsplit('/', 1)[-1].lower()}"
+
+    def get(self, key: str) -> t.Any | None:
+        """Unexpired value of the key"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires_at, _, value = entry
+
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value
+
+                self._pop(key)
+
+        if self.backend is None:
+            return None
+
+        serialized_value = self.backend.get(key)
+
+        if serialized_value is None:
+            return None
+
+        value = json.loads(serialized_value)
+        self._store(key, value, len(serialized_value))
+        return value
+
+    def set(self, key: str, value: t.Any, size: int | None = None) -> None:
+        """Caches the JSON-serializable value of the key
+
+        Args:
+            key (str): Cache key - see `make_key`.
+            value (t.Any): Parsed details.
+            size (int | None, optional): Length of the body the value was parsed from - spares serializing it when there is no backend.
+        """  # noqa: E501
+        if size is not None and self.backend is None:
+            self._store(key, value, size)
+            return
+
+        serialized_value = json.dumps(value)
+        self._store(key, value, len(serialized_value))
+
+        if self.backend is not None:
+            self.backend.set(key, serialized_value, self.ttl)
+
+    def get_model(self, key: str) -> t.Any | None:
+        """Model validated from the unexpired value of the key if kept"""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+
+            return self._models.get(key)
+
+    def set_model(self, key: str, model: t.Any) -> None:
+        """Keeps a model validated from the cached value of the key - dropped
+        along with the value"""
+        with self._lock:
+            if key in self._entries:
+                self._models[key] = model
+
+    def _store(self, key: str, value: t.Any, size: int) -> None:
+        with self._lock:
+            self._pop(key)
+
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._size += size
+
+            while (
+                len(self._entries) > self.max_entries
+                or self._size > self.max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def _pop(self, key: str) -> None:
+        self._models.pop(key, None)
+        entry = self._entries.pop(key, None)
+
+        if entry is not None:
+            self._size -= entry[1]
+
+    async def aget_or_fetch(
+        self,
+        key: str,
+        fetch: t.Callable[[], t.Awaitable[t.Any]],
+        get_size: t.Callable[[], int | None] | None = None,
+    ) -> t.Any:
+        """Get cached details or fetch and cache them
+
+        Args:
+            key (str): Cache key - see `make_key`.
+            fetch (t.Callable[[], t.Awaitable[t.Any]]): Fetches and parses the details.
+            get_size (t.Callable[[], int | None] | None, optional): Length of the body fetched by `fetch` - see `set`.
+
+        Returns:
+            t.Any: Item details
+        """  # noqa: E501
+        if _bypass_cache.get():
+            self.stats.bypasses += 1
+
+        else:
+            value = self.get(key)
+
+            if value is not None:
+                self.stats.hits += 1
+                return value
+
+            self.stats.misses += 1
+
+        value = await fetch()
+        self.set(key, value, None if get_size is None else get_size())
+        return value
+
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Removes cached details
+
+        Args:
+            pattern (str | None, optional): Only remove keys containing this
+                e.g detail path. Defaults to None (all).
+
+        Returns:
+            int: Number of removed entries in memory
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries if pattern is None or pattern in key
+            ]
+
+            for key in keys:
+                self._pop(key)
+
+        if self.backend is not None:
+            self.backend.delete(pattern)
+
+        logger.debug(f"Invalidated {len(keys)} cached item details - {pattern!r}")
+        return len(keys)
+
+
+def get_default_item_details_cache() -> ItemDetailsCache | None:
+    """Item details cache to use when none is passed explicitly.
+
+    Returns:
+        ItemDetailsCache | None: `ItemDetailsCache.shared()` when enabled using
+            the environment variable `MOVIEBOX_DETAILS_CACHE=1` (or `disk` to
+            persist it) otherwise None.
+    """
+    value = os.getenv(ENVIRONMENT_DETAILS_CACHE_KEY, "0").lower()
+
+    if value == "disk" and ItemDetailsCache._shared is None:
+        return ItemDetailsCache.shared(
+            SQLiteCacheBackend(DEFAULT_DETAILS_CACHE_PATH)
+        )
+
+    if value in ("1", "true", "disk"):
+        return ItemDetailsCache.shared()
@@ -483,7 +483,7 @@ class Downloader:
 
         else:
             core_tv_series_details = TVSeriesDetails(
-                target_tv_series, self._session
+                target_tv_series, self._session, stream=True
             )
 
             tv_series_details_model = (
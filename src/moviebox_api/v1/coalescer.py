@@ -0,0 +1,119 @@
+"""
+Collapses concurrent identical api requests into a single upstream call
+whose parsed response is shared among all the callers.
+"""
+
+import asyncio
+import copy
+import typing as t
+from dataclasses import dataclass
+
+from moviebox_api.v1.cache import ResponseCache
+from moviebox_api.v1.logger import logger
+
+__all__ = ["CoalescerStats", "RequestCoalescer"]
+
+
+@dataclass
+class CoalescerStats:
+    """Request coalescing counters"""
+
+    upstream: int = 0
+    """Requests actually sent"""
+    collapsed: int = 0
+    """Requests served by joining an identical in-flight one"""
+
+    @property
+    def collapse_ratio(self) -> float:
+        total = self.upstream + self.collapsed
+        return self.collapsed / total if total else 0.0
+
+
+class _InFlight:
+    """Shared upstream call and the number of callers awaiting it"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 1
+
+
+class RequestCoalescer:
+    """Deduplicates concurrent requests keyed by method, url and body
+
+    - The upstream call runs in its own task so that cancelling one caller
+    doesn't fail the others. It's cancelled once all callers are gone.
+    - Every caller except the last one to resume gets a deep copy of the
+    response so callers can't corrupt each other's copy.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, _InFlight] = {}
+        self.stats = CoalescerStats()
+
+    def __repr__(self):
+        return rf"<RequestCoalescer in_flight={len(self)} stats={self.stats}>"
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+
+        if not task.cancelled():
+            # Retrieved in case all the callers were cancelled
+            task.exception()
+
+    async def aget_or_fetch(
+        self,
+        method: str,
+        url: str,
+        fetch: t.Callable[[], t.Awaitable[dict | list]],
+        params: dict[str, t.Any] | None = None,
+        body: t.Any = None,
+        scope: str | None = None,
+    ) -> dict | list:
+        """Join an identical in-flight request or start one using `fetch`
+
+        Args:
+            method (str): Http method.
+            url (str): Absolute url or path.
+            fetch (t.Callable[[], t.Awaitable[dict | list]]): Performs the
+                actual request and returns the parsed data.
+            params (dict[str, t.Any] | None, optional): Query parameters.
+            body (t.Any, optional): JSON-serializable request body.
+            scope (str | None, optional): Kind of client making the request.
+
+        Returns:
+            dict | list: Response data
+        """
+        key = ResponseCache.make_key(method, url, params, body, scope)
+        in_flight = self._in_flight.get(key)
+
+        if in_flight is None:
+            in_flight = _InFlight(asyncio.ensure_future(fetch()))
+            self._in_flight[key] = in_flight
+            in_flight.task.add_done_callback(
+                lambda task: self._on_done(key, task)
+            )
+            self.stats.upstream += 1
+
+        else:
+            in_flight.waiters += 1
+            self.stats.collapsed += 1
+            logger.debug(f"Joining in-flight request - {key!r}")
+
+        try:
+            data = await asyncio.shield(in_flight.task)
+        finally:
+            in_flight.waiters -= 1
+
+            if not in_flight.waiters and not in_flight.task.done():
+                # All the callers are gone
+                in_flight.task.cancel()
+
+        if in_flight.waiters:
+            return copy.deepcopy(data)
+
+        return data
@@ -5,6 +5,7 @@ import typing as t
 from enum import IntEnum, StrEnum
 from pathlib import Path
 
+import httpx
 from throttlebuster.constants import (
     DEFAULT_CHUNK_SIZE,
     DEFAULT_READ_TIMEOUT_ATTEMPTS,
@@ -98,13 +99,152 @@ DEFAULT_CAPTION_LANGUAGE_SHORT = "en"
 CURRENT_WORKING_DIR = Path(os.getcwd())
 """Directory where contents will be saved to by default"""
 
+CACHE_DIR = (
+    Path(os.getenv("XDG_CACHE_HOME") or Path.home().joinpath(".cache"))
+    / "moviebox-api"
+)
+"""Directory for persisting reusable data across invocations"""
+
+ENVIRONMENT_TOKEN_STORE_KEY = "MOVIEBOX_TOKEN_STORE"
+"""User enables the persistent auth-token store by setting this to 1"""
+
+DEFAULT_TOKEN_STORE_PATH = CACHE_DIR / "tokens.json"
+"""File where auth-tokens are persisted"""
+
+DEFAULT_TOKEN_TTL = 6 * 60 * 60
+"""Seconds a persisted auth-token is considered valid"""
+
+AUTH_FAILURE_STATUS_CODES = frozenset({401, 403})
+"""Response status codes indicating that the auth-token has been rejected"""
+
+DEFAULT_RESPONSE_CACHE_PATH = CACHE_DIR / "responses.sqlite3"
+"""Database file of the on-disk response cache"""
+
+DEFAULT_RESPONSE_CACHE_MAX_ENTRIES = 1024
+"""Maximum number of responses held by the in-memory cache"""
+
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""Maximum total size of responses held by the in-memory cache"""
+
+DEFAULT_RESPONSE_CACHE_TTLS: dict[str, float] = {
+    r"/subject/search-suggest$": 60 * 60,
+    r"/subject(-api)?/search(/v2)?$": 10 * 60,
+    r"/subject/(filter|trending|search-rank|everyone-search)$": 10 * 60,
+    r"/subject/detail-rec$": 60 * 60,
+    r"/(web/home|home|tab-operating|ranking-list/content)$": 10 * 60,
+    r"/(detail|subject-api/get|subject-api/season-info)$": 60 * 60,
+}
+"""Url path regex patterns of cacheable endpoints mapped to the time-to-live
+of their responses in seconds.
+
+- Endpoints serving signed media & caption links are left out since the links
+expire.
+"""
+
 ITEM_DETAILS_PATH = "/detail"
 """Immediate path to particular item details page"""
 
+ENVIRONMENT_DETAILS_CACHE_KEY = "MOVIEBOX_DETAILS_CACHE"
+"""User enables the process-wide item details cache by setting this to 1 or to
+`disk` to also persist it"""
+
+DEFAULT_DETAILS_CACHE_PATH = CACHE_DIR / "details.sqlite3"
+"""Database file of the on-disk item details cache"""
+
+DEFAULT_DETAILS_CACHE_MAX_ENTRIES = 256
+"""Maximum number of item details held in memory"""
+
+DEFAULT_DETAILS_CACHE_MAX_BYTES = 64 * 1024 * 1024
+"""Maximum total size of item details held in memory"""
+
+DEFAULT_DETAILS_CACHE_TTL = 60 * 60
+"""Seconds cached item details are considered fresh"""
+
 
 DEFAULT_TASKS = 5
 """Default number of connections for download"""
 
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+"""Connection pool limits for the long-lived http clients of `Session`"""
+
+RETRY_STATUS_CODES: frozenset[int] = frozenset(
+    {
+        407,
+        429,
+        500,
+        502,
+        503,
+        504,
+    }
+)
+"""Response status codes indicating a transient failure worth retrying - auth
+failures (`AUTH_FAILURE_STATUS_CODES`) are left out since resending the same
+credentials fails again"""
+
+DEFAULT_RETRY_MAX_ATTEMPTS = 3
+"""Total attempts (including the first one) of a retryable request"""
+
+DEFAULT_RETRY_BACKOFF_BASE = 0.5
+"""Seconds the exponential backoff starts from"""
+
+DEFAULT_RETRY_BACKOFF_MAX = 30.0
+"""Upper limit of both the backoff and honoured `Retry-After` in seconds"""
+
+IDEMPOTENT_POST_PATHS: tuple[str, ...] = (
+    r"/subject(-api)?/search(/v2)?$",
+    r"/subject/(search-suggest|filter)$",
+)
+"""Url path regex patterns of POST endpoints that are safe to retry"""
+
+ENVIRONMENT_HTTP2_KEY = "MOVIEBOX_HTTP2"
+"""Environment variable that enables HTTP/2 when not set explicitly"""
+
+ENVIRONMENT_RATE_LIMIT_KEY = "MOVIEBOX_RATE_LIMIT"
+"""Environment variable that enables the process-wide rate limiter"""
+
+MEDIA_FILE_EXTENSIONS: tuple[str, ...] = (
+    ".mp4",
+    ".mkv",
+    ".webm",
+    ".m3u8",
+    ".mpd",
+    ".ts",
+    ".srt",
+    ".vtt",
+)
+"""Url path suffixes of media & caption files"""
+
+ENVIRONMENT_HTML_PARSER_KEY = "MOVIEBOX_HTML_PARSER"
+"""Environment variable that sets the html parser of `BeautifulSoup` e.g `lxml`"""
+
+HTML_PARSERS: tuple[str, ...] = ("lxml", "html.parser")
+"""Html parsers in order of preference - the first one installed is used"""
+
+MAX_ERROR_BODY_SIZE = 1024
+"""Bytes of a response body included in error messages"""
+
+DEFAULT_ITEMS_BUFFER_SIZE = 100
+"""Items fetched ahead of the consumer of `aiter_items`"""
+
+DEFAULT_BATCH_SEARCH_CONCURRENCY = 8
+"""Titles searched at once by `Search.batch`"""
+
+DEFAULT_BATCH_SEARCH_MAX_PAGES = 5
+"""Search results pages looked through for a title matching the year filter"""
+
+DEFAULT_TITLE_INDEX_PATH = CACHE_DIR / "titles.json"
+"""File where the local title index is persisted"""
+
+TITLE_INDEX_MAX_PREFIX_SIZE = 10
+"""Longest token prefix indexed - longer prefixes are matched by scanning"""
+
+TITLE_INDEX_FUZZY_CUTOFF = 0.75
+"""Minimum similarity (0-1) of a misspelt word to an indexed one"""
+
 
 class SubjectType(IntEnum):
     """Content types mapped to their integer representatives"""
@@ -149,3 +289,24 @@ class SubjectType(IntEnum):
 class DownloadStatus(StrEnum):
     DOWNLOADING = "downloading"
     FINISHED = "finished"
+
+
+class EndpointClass(StrEnum):
+    """Kinds of upstream resources rate-limited separately"""
+
+    API = "api"
+    """JSON api endpoints"""
+
+    PAGE = "page"
+    """Web pages (html)"""
+
+    MEDIA = "media"
+    """Media & caption files"""
+
+
+DEFAULT_RATE_LIMITS: dict[EndpointClass, float] = {
+    EndpointClass.API: 10.0,
+    EndpointClass.PAGE: 2.0,
+    EndpointClass.MEDIA: 20.0,
+}
+"""Requests per second allowed to each host per endpoint class"""
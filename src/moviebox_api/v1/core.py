@@ -4,12 +4,19 @@ Generate models from httpx request responses.
 Also provides object mapping support to specific extracted item details
 """
 
+import asyncio
 import typing as t
 
 from moviebox_api.v1._bases import (
     BaseContentProviderAndHelper,
 )
-from moviebox_api.v1.constants import SubjectType
+from moviebox_api.v1.cache import ItemDetailsCache, get_default_item_details_cache
+from moviebox_api.v1.constants import (
+    DEFAULT_BATCH_SEARCH_CONCURRENCY,
+    DEFAULT_BATCH_SEARCH_MAX_PAGES,
+    DEFAULT_ITEMS_BUFFER_SIZE,
+    SubjectType,
+)
 from moviebox_api.v1.exceptions import (
     ExhaustedSearchResultsError,
     MovieboxApiException,
@@ -21,6 +28,9 @@ from moviebox_api.v1.extractor._core import (
     TagDetailsExtractor,
     TagDetailsExtractorModel,
 )
+from moviebox_api.v1.extractor.batch import get_extraction_pool, model_json_data
+from moviebox_api.v1.extractor.exceptions import DetailsExtractionError
+from moviebox_api.v1.extractor.helpers import JsonScriptScanner
 from moviebox_api.v1.extractor.models.json import ItemJsonDetailsModel
 from moviebox_api.v1.helpers import (
     assert_instance,
@@ -39,7 +49,19 @@ from moviebox_api.v1.models import (
     SuggestedItemsModel,
     TrendingResultsModel,
 )
+from moviebox_api.v1.pagination import aiter_items, aiter_pages, at_page
 from moviebox_api.v1.requests import Session
+from moviebox_api.v1.resolver import (
+    BatchSearchResults,
+    ProgressCallback,
+    TitleQuery,
+    resolve_titles,
+)
+from moviebox_api.v1.title_index import (
+    TitleEntry,
+    TitleIndex,
+    refresh_in_background,
+)
 
 __all__ = [
     "Homepage",
@@ -149,6 +171,7 @@ class Search(BaseSearch):
         subject_type: SubjectType = SubjectType.ALL,
         page: int = 1,
         per_page: int = 24,
+        title_index: TitleIndex | None = None,
     ):
         """Constructor for `Search`
 
@@ -158,6 +181,7 @@ class Search(BaseSearch):
             subject_type (SubjectType, optional): Subject-type filter for performing search. Defaults to SubjectType.ALL.
             page (int, optional): Page number filter. Defaults to 1.
             per_page (int, optional): Maximum number of items per page. Defaults to 24.
+            title_index (TitleIndex | None, optional): Local index fed with the items fetched. Defaults to None.
         """  # noqa: E501
         assert_instance(subject_type, SubjectType, "subject_type")
         assert_instance(session, Session, "session")
@@ -167,6 +191,8 @@ class Search(BaseSearch):
         self._query = query
         self._page = page
         self._per_page = per_page
+        self._title_index = title_index
+        self._refresh_tasks: set[asyncio.Task] = set()
 
     def __repr__(self):
         return (
@@ -210,8 +236,29 @@ class Search(BaseSearch):
 
             contents["items"] = target_items
 
+        if self._title_index is not None:
+            self._title_index.add_from(contents)
+
         return contents
 
+    async def get_local_items(self, refresh: bool = True) -> list[TitleEntry]:
+        """Items of the title index matching the query - instantly
+
+        Args:
+            refresh (bool, optional): Fetch the remote results in the background to update the index. Defaults to True.
+
+        Returns:
+            list[TitleEntry]: Matching titles seen before - most popular first
+        """  # noqa: E501
+        assert self._title_index is not None, "Search lacks a title_index"
+
+        if refresh:
+            refresh_in_background(self._refresh_tasks, self.get_content())
+
+        return self._title_index.lookup(
+            self._query, self._per_page, self._subject_type.value
+        )
+
     async def get_content_model(self) -> SearchResultsModel:
         """Modelled version of the contents.
 
@@ -274,6 +321,65 @@ class Search(BaseSearch):
                 "one instead."
             )
 
+    async def get_content_model_all(
+        self, concurrency: int = 1
+    ) -> t.AsyncIterator[SearchResultsModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
+
+        async def fetch(page: int) -> SearchResultsModel:
+            return await at_page(self, page).get_content_model()
+
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
+            yield content_model
+
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> t.AsyncIterator[SearchResultsItem]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
+
+    @classmethod
+    async def batch(
+        cls,
+        session: Session,
+        queries: t.Iterable[TitleQuery],
+        subject_type: SubjectType = SubjectType.ALL,
+        concurrency: int = DEFAULT_BATCH_SEARCH_CONCURRENCY,
+        max_pages: int = DEFAULT_BATCH_SEARCH_MAX_PAGES,
+        per_page: int = 24,
+        progress: ProgressCallback | None = None,
+    ) -> BatchSearchResults:
+        """Resolves many titles to search results items concurrently over
+        `session` - whose cookies are assigned once beforehand.
+
+        Args:
+            session (Session): MovieboxAPI request session.
+            queries (t.Iterable[TitleQuery]): Titles or (title, release year) pairs.
+            subject_type (SubjectType, optional): Subject-type filter. Defaults to SubjectType.ALL.
+            concurrency (int, optional): Titles searched at once. Defaults to DEFAULT_BATCH_SEARCH_CONCURRENCY.
+            max_pages (int, optional): Pages to look through per title. Defaults to DEFAULT_BATCH_SEARCH_MAX_PAGES.
+            per_page (int, optional): Maximum number of items per page. Defaults to 24.
+            progress (ProgressCallback | None, optional): Called as each title completes. Defaults to None.
+
+        Returns:
+            BatchSearchResults: Resolved titles in the order of `queries` - failures carry their error
+        """  # noqa: E501
+        await session.ensure_cookies_are_assigned()
+
+        return await resolve_titles(
+            lambda query: cls(session, query, subject_type, per_page=per_page),
+            queries,
+            concurrency=concurrency,
+            max_pages=max_pages,
+            progress=progress,
+        )
+
     def _create_payload(self) -> dict[str, str | int]:
         """Creates payload from the parameters declared.
 
@@ -381,23 +487,27 @@ class Trending(BaseSearch):
             )
 
     async def get_content_model_all(
-        self,
+        self, concurrency: int = 1
     ) -> t.AsyncIterator[TrendingResultsModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model()
+        async def fetch(page: int) -> TrendingResultsModel:
+            return await at_page(self, page).get_content_model()
 
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
             yield content_model
 
-            if content_model.pager.hasMore:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> t.AsyncIterator[SearchResultsItem]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
 
     def _create_payload(self) -> dict[str, str | int]:
         """Creates payload from the parameters declared.
@@ -524,6 +634,29 @@ class Recommend(BaseSearch):
                 " instead."
             )
 
+    async def get_content_model_all(
+        self, concurrency: int = 1
+    ) -> t.AsyncIterator[SearchResultsModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
+
+        async def fetch(page: int) -> SearchResultsModel:
+            return await at_page(self, page).get_content_model()
+
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
+            yield content_model
+
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> t.AsyncIterator[SearchResultsItem]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
+
     def _create_payload(self) -> dict[str, str | int]:
         """Creates payload from the parameters declared.
 
@@ -593,19 +726,30 @@ class SearchSuggestion(BaseContentProviderAndHelper):
 
     _url = get_absolute_url(r"/wefeed-h5-bff/web/subject/search-suggest")
 
-    def __init__(self, session: Session, per_page: int = 10):
+    def __init__(
+        self,
+        session: Session,
+        per_page: int = 10,
+        title_index: TitleIndex | None = None,
+        refresh: bool = True,
+    ):
         """Constructor for `SearchSuggestion`
 
         Args:
             session (Session): MovieboxAPI request session
             per_page(int, optional): Number of items to suggest. Defauls to 10.
-        """
+            title_index (TitleIndex | None, optional): Local index answering first - remote only on a miss. Defaults to None.
+            refresh (bool, optional): Fetch remote suggestions in the background after a local hit. Defaults to True.
+        """  # noqa: E501
 
         self.session = session
         self._per_page = per_page
+        self._title_index = title_index
+        self._refresh = refresh
+        self._refresh_tasks: set[asyncio.Task] = set()
 
-    async def get_content(self, reference: str) -> dict:
-        """Get movie suggestions based on a reference
+    async def get_remote_content(self, reference: str) -> dict:
+        """Get movie suggestions based on a reference from the server
 
         Args:
             reference (str): Movie keyword or title
@@ -620,6 +764,67 @@ class SearchSuggestion(BaseContentProviderAndHelper):
                 "keyword": reference,
             },
         )
+
+        if self._title_index is not None:
+            for item in contents.get("items") or []:
+                self._title_index.add(item)
+
+        return contents
+
+    def get_local_content(self, reference: str) -> dict | None:
+        """Get movie suggestions based on a reference from the title index
+
+        Args:
+            reference (str): Movie keyword or title
+
+        Returns:
+            dict | None: Suggested item(s) details. None when nothing matches.
+        """
+        if self._title_index is None:
+            return None
+
+        entries = self._title_index.lookup(reference, self._per_page)
+
+        if not entries:
+            return None
+
+        return {
+            "items": [
+                {
+                    "type": (
+                        entry.subject_type
+                        if entry.subject_type in SubjectType
+                        else SubjectType.ALL
+                    ),
+                    "subject": None,
+                    "word": entry.title,
+                }
+                for entry in entries
+            ],
+            "keyword": reference,
+            "ops": "",
+        }
+
+    async def get_content(self, reference: str) -> dict:
+        """Get movie suggestions based on a reference - locally first when
+        there is a title index
+
+        Args:
+            reference (str): Movie keyword or title
+
+        Returns:
+            dict: Suggested item(s) details
+        """
+        contents = self.get_local_content(reference)
+
+        if contents is None:
+            return await self.get_remote_content(reference)
+
+        if self._refresh:
+            refresh_in_background(
+                self._refresh_tasks, self.get_remote_content(reference)
+            )
+
         return contents
 
     async def get_content_model(self, reference: str) -> SuggestedItemsModel:
@@ -641,30 +846,51 @@ class BaseItemDetails(BaseContentProviderAndHelper):
     - Page content is fetched only once throughout the life of the instance
     """
 
-    def __init__(self, page_url: str, session: Session):
+    def __init__(
+        self,
+        page_url: str,
+        session: Session,
+        stream: bool = False,
+        details_cache: ItemDetailsCache | None = None,
+    ):
         """Constructor for `BaseItemDetails`
 
         Args:
             page_url (str): Url to specific page containing the item details.
             session (Session): MovieboxAPI request session
-        """
+            stream (bool, optional): Stop fetching the page once its json data is received and keep it as bytes. Defaults to False.
+            details_cache (ItemDetailsCache | None, optional): Shares json data of the page across instances. Defaults to `get_default_item_details_cache()`.
+        """  # noqa: E501
         assert_instance(session, Session, "session")
         self._url = validate_item_page_url(page_url)
         self._session = session
-        self.__html_content: str | None = None
+        self._stream = stream
+        self._details_cache = (
+            get_default_item_details_cache()
+            if details_cache is None
+            else details_cache
+        )
+        self.__html_content: str | bytes | None = None
         """Cached page contents"""
 
-    async def get_html_content(self) -> str:
+    async def get_html_content(self) -> str | bytes:
         """The specific page contents
 
         Returns:
-            str: html formatted contents of the page
+            str | bytes: html formatted contents of the page - undecoded and
+              only up to the end of the json data when streaming.
         """
         if self.__html_content is not None:
             # Not a good approach for async but it will save alot
             #  of seconds & bandwidth
             return self.__html_content
 
+        if self._stream:
+            self.__html_content = await self._session.get_with_cookies_until(
+                get_absolute_url(self._url), JsonScriptScanner()
+            )
+            return self.__html_content
+
         resp = await self._session.get_with_cookies(
             get_absolute_url(self._url),
         )
@@ -688,7 +914,12 @@ class BaseItemDetails(BaseContentProviderAndHelper):
             ItemJsonDetailsModel: Modelled item details
         """
         modelled_extracted_content = await self.get_json_details_extractor_model()
-        return modelled_extracted_content.details
+        details = modelled_extracted_content.details
+
+        if self._details_cache is not None:
+            self._details_cache.set_model(self._details_cache_key, details)
+
+        return details
 
     async def get_tag_details_extractor(self) -> TagDetailsExtractor:
         """Fetch content and return object that provide ways to extract details
@@ -696,11 +927,59 @@ class BaseItemDetails(BaseContentProviderAndHelper):
         content = await self.get_html_content()
         return TagDetailsExtractor(content)
 
+    @property
+    def _details_cache_key(self) -> str:
+        return ItemDetailsCache.make_key(self._url, "v1")
+
+    async def get_json_data(self, offload: bool = False) -> list:
+        """Json script data of the page - shared across instances through the
+        details cache when set
+
+        Args:
+            offload (bool, optional): Load the data on the shared extraction
+              process pool instead of the event loop. Defaults to False.
+
+        Returns:
+            list: Json script data (nuxt payload)
+        """
+
+        body_size: int | None = None
+
+        async def load() -> list:
+            nonlocal body_size
+            html_contents = await self.get_html_content()
+            body_size = len(html_contents)
+
+            try:
+                if offload:
+                    data = await asyncio.get_running_loop().run_in_executor(
+                        get_extraction_pool(),
+                        JsonDetailsExtractor.load_json_script,
+                        html_contents,
+                    )
+                else:
+                    data = JsonDetailsExtractor.load_json_script(html_contents)
+
+            except Exception as e:
+                raise DetailsExtractionError(
+                    "Failed to load json data of the page. Ensure correct "
+                    "content is passed."
+                ) from e
+
+            JsonDetailsExtractor.load_payload(html_contents, data)  # Validates
+            return data
+
+        if self._details_cache is None:
+            return await load()
+
+        return await self._details_cache.aget_or_fetch(
+            self._details_cache_key, load, lambda: body_size
+        )
+
     async def get_json_details_extractor(self) -> JsonDetailsExtractor:
         """Fetch content and return object that extract details from
         json-formatted data in the page"""
-        html_contents = await self.get_html_content()
-        return JsonDetailsExtractor(html_contents)
+        return JsonDetailsExtractor.from_data(await self.get_json_data())
 
     async def get_tag_details_extractor_model(self) -> TagDetailsExtractorModel:
         """Fetch content and return object that provide ways to model extracted
@@ -709,18 +988,39 @@ class BaseItemDetails(BaseContentProviderAndHelper):
         return TagDetailsExtractorModel(html_content)
 
     async def get_json_details_extractor_model(
-        self,
+        self, offload: bool = False
     ) -> JsonDetailsExtractorModel:
         """Fetch content and return object that models extracted details from
-        json-formatted data in the page"""
-        html_contents = await self.get_html_content()
-        return JsonDetailsExtractorModel(html_contents)
+        json-formatted data in the page
+
+        Args:
+            offload (bool, optional): Load, resolve & model the json data on the
+              shared extraction process pool instead of the event loop.
+              Defaults to False.
+        """
+        data = await self.get_json_data(offload)
+        json_details_extractor = JsonDetailsExtractor.from_data(data)
+        details = (
+            None
+            if self._details_cache is None
+            else self._details_cache.get_model(self._details_cache_key)
+        )
 
-    def get_html_content_sync(self, *args, **kwargs) -> str:
+        if details is None and offload:
+            details = await asyncio.get_running_loop().run_in_executor(
+                get_extraction_pool(), model_json_data, data
+            )
+
+            if self._details_cache is not None:
+                self._details_cache.set_model(self._details_cache_key, details)
+
+        return JsonDetailsExtractorModel(json_details_extractor, details)
+
+    def get_html_content_sync(self, *args, **kwargs) -> str | bytes:
         """Get specific page contents `synchronously`
 
         Returns:
-            str: html formatted contents of the page
+            str | bytes: html formatted contents of the page
         """
         return get_event_loop().run_until_complete(
             self.get_html_content(*args, **kwargs)
@@ -766,13 +1066,24 @@ class BaseItemDetails(BaseContentProviderAndHelper):
 class MovieDetails(BaseItemDetails):
     """Specific movie item details"""
 
-    def __init__(self, url_or_item: str | SearchResultsItem, session: Session):
+    def __init__(
+        self,
+        url_or_item: str | SearchResultsItem,
+        session: Session,
+        stream: bool = False,
+        details_cache: ItemDetailsCache | None = None,
+    ):
         """Constructor for `MovieDetails`
 
         Args:
             page_url (str|SearchResultsItem): Url to specific item page or
                 search-results-item.
             session (Session): MovieboxAPI request session
+            stream (bool, optional): Stop fetching the page once its json data
+                is received. Defaults to False.
+            details_cache (ItemDetailsCache | None, optional): Shares json data
+                of the page across instances. Defaults to
+                `get_default_item_details_cache()`.
         """
         assert_instance(url_or_item, (str, SearchResultsItem), "url_or_item")
 
@@ -788,19 +1099,35 @@ class MovieDetails(BaseItemDetails):
         else:
             page_url = url_or_item
 
-        super().__init__(page_url=page_url, session=session)
+        super().__init__(
+            page_url=page_url,
+            session=session,
+            stream=stream,
+            details_cache=details_cache,
+        )
 
 
 class TVSeriesDetails(BaseItemDetails):
     """Specific tv-series details"""
 
-    def __init__(self, url_or_item: str | SearchResultsItem, session: Session):
+    def __init__(
+        self,
+        url_or_item: str | SearchResultsItem,
+        session: Session,
+        stream: bool = False,
+        details_cache: ItemDetailsCache | None = None,
+    ):
         """Constructor for `TVSeriesDetails`
 
         Args:
             url_or_item: (str|SearchResultsItem): Url to specific item page or
                 search-results-item.
             session (Session): MovieboxAPI request session
+            stream (bool, optional): Stop fetching the page once its json data
+                is received. Defaults to False.
+            details_cache (ItemDetailsCache | None, optional): Shares json data
+                of the page across instances. Defaults to
+                `get_default_item_details_cache()`.
         """
         assert_instance(url_or_item, (str, SearchResultsItem), "url_or_item")
 
@@ -817,4 +1144,9 @@ class TVSeriesDetails(BaseItemDetails):
         else:
             page_url = url_or_item
 
-        super().__init__(page_url=page_url, session=session)
+        super().__init__(
+            page_url=page_url,
+            session=session,
+            stream=stream,
+            details_cache=details_cache,
+        )
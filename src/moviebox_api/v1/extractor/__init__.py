@@ -6,6 +6,7 @@ from moviebox_api.v1.extractor._core import (
     TagDetailsExtractor,
     TagDetailsExtractorModel,
 )
+from moviebox_api.v1.extractor.batch import aextract_many, extract_many
 from moviebox_api.v1.extractor.exceptions import DetailsExtractionError
 
 __all__ = [
@@ -14,4 +15,6 @@ __all__ = [
     "TagDetailsExtractorModel",
     "JsonDetailsExtractorModel",
     "DetailsExtractionError",
+    "extract_many",
+    "aextract_many",
 ]
@@ -3,10 +3,18 @@ from its dedicated page.
 """
 
 import typing as t
+from functools import cached_property
 from json import loads
 
 from moviebox_api.v1.extractor.exceptions import DetailsExtractionError
-from moviebox_api.v1.extractor.helpers import souper
+from moviebox_api.v1.extractor.helpers import (
+    NuxtNode,
+    NuxtPayload,
+    cache_result,
+    find_json_script,
+    get_scope_filter,
+    souper,
+)
 from moviebox_api.v1.extractor.models.json import (
     ItemJsonDetailsModel,
     MetadataModel,
@@ -26,6 +34,7 @@ from moviebox_api.v1.extractor.models.tag import (
     OthersModel,
     ReviewModel,
 )
+from moviebox_api.v1.logger import logger
 
 __all__ = [
     "TagDetailsExtractor",
@@ -43,17 +52,41 @@ class TagDetailsExtractor:
     - Also this extraction method suffers from content restriction
     - e.g "This content is not available on the website. Please download
     our Android app to access it."
+    - The page is parsed once and each extraction result is cached.
     """
 
-    def __init__(self, content: str):
+    scope_tags: tuple[str, ...] = ("head",)
+    """Tags built when parsing is scoped"""
+    scope_classes: tuple[str, ...] = (
+        "pc-detail-content",
+        "pc-staff",
+        "pc-reviews-box",
+        "pc-btm-tip",
+        "desc",
+    )
+    """Classes of tags built when parsing is scoped"""
+
+    def __init__(
+        self, content: str, parser: str | None = None, scoped: bool = True
+    ):
         """Constructor for `TagDetailsExtractor`
 
         Args:
             content (str): Html formatted text
-        """
+            parser (str | None, optional): Html parser e.g `lxml`. Defaults to the fastest installed.
+            scoped (bool, optional): Only build parts of the page that are extracted. Defaults to True.
+        """  # noqa: E501
         self._content = content
-        self.souped_content = souper(content)
-        self.souped_content_body = self.souped_content.find("body")
+        self.souped_content = souper(
+            content,
+            parser,
+            get_scope_filter(self.scope_tags, self.scope_classes)
+            if scoped
+            else None,
+        )
+        self.souped_content_body = (
+            self.souped_content.find("body") or self.souped_content
+        )
 
     def __repr__(self) -> str:
         headers = self.extract_headers()
@@ -74,6 +107,7 @@ class TagDetailsExtractor:
         """
         return self.extract_all()
 
+    @cache_result
     def extract_headers(
         self, include_extra: bool = True
     ) -> dict[str, str | list[str | dict[str, str]]]:
@@ -113,6 +147,7 @@ class TagDetailsExtractor:
             ]
         return resp
 
+    @cache_result
     def extract_basics(self) -> dict:
         """Extracts basic data such as `title`, `duration` etc"""
 
@@ -132,13 +167,13 @@ class TagDetailsExtractor:
 
         return resp
 
+    @cache_result
     def extract_casts(self) -> list[dict[str, str]]:
         """Extracts characters detail"""
 
-        cast_soup = self.souped_content_body.find(
-            "div", {"class": "pc-btm-section flx-sta-sta"}
+        cast_staff_soup = self.souped_content_body.find(
+            "div", {"class": "pc-staff"}
         )
-        cast_staff_soup = cast_soup.find("div", {"class": "pc-staff"})
 
         cast_staff_details = []
 
@@ -157,6 +192,7 @@ class TagDetailsExtractor:
 
         return cast_staff_details
 
+    @cache_result
     def extract_reviews(
         self,
     ) -> list[dict[str, str]]:
@@ -190,16 +226,19 @@ class TagDetailsExtractor:
 
         return review_details
 
+    @cache_result
     def extract_others(self) -> dict:
         """This include disclaimer etc"""
         resp = {}
-        web_page_soup = self.souped_content_body.find(
-            "div", {"class": "web-page"}
-        )
-        resp["tip"] = web_page_soup.find("div", {"class": "pc-btm-tip"}).text
-        resp["desc"] = web_page_soup.find("div", {"class": "desc"}).text
+        resp["tip"] = self.souped_content_body.find(
+            "div", {"class": "pc-btm-tip"}
+        ).text
+        resp["desc"] = self.souped_content_body.find(
+            "div", {"class": "desc"}
+        ).text
         return resp
 
+    @cache_result
     def extract_all(self) -> dict[str, list[str] | dict[str, t.Any]]:
         """Extract all possible contents from the page"""
 
@@ -213,7 +252,7 @@ class TagDetailsExtractor:
 
     def get_details_extractor_model(self) -> "TagDetailsExtractorModel":
         """Returns object that allows modelling of the extracted details"""
-        return TagDetailsExtractorModel(self._content)
+        return TagDetailsExtractorModel(self)
 
 
 class JsonDetailsExtractor:
@@ -221,21 +260,24 @@ class JsonDetailsExtractor:
 
     #### Note:
     - Extracts whole details available.
+    - Details are resolved lazily so properties such as `seasons` only
+    resolve their own part of the data.
     """
 
-    def __init__(self, content: str):
+    def __init__(self, content: str | bytes, data: list | None = None):
         """Constructor for `JsonDetailsExtractor`
 
         Args:
-            content (str): Html contents of the item page
-        """
+            content (str | bytes): Html contents of the item page
+            data (list | None, optional): Json script data already loaded from `content` using `load_json_script`.
+        """  # noqa: E501
         self._content = content
-        self.details: dict[str, t.Any] = self.extract(content)
-        """Whole important extracted details"""
+        self.payload: NuxtPayload = self.load_payload(content, data)
+        """Lazily resolved nuxt payload"""
 
     def __repr__(self) -> str:
-        title = self.details["resData"]["metadata"]["title"]
-        url = self.details["resData"]["metadata"]["url"]
+        title = self.metadata["title"]
+        url = self.metadata["url"]
         return (
             rf"{self.__module__}.{self.__class__.__name__} "
             rf'title="{title}" url="{url}">'
@@ -245,78 +287,140 @@ class JsonDetailsExtractor:
         """Whole important extracted details"""
         return self.details
 
+    @cached_property
+    def details(self) -> dict[str, t.Any]:
+        """Whole important extracted details"""
+        return self.get_target_data(self.payload)
+
     @classmethod
-    def extract(self, content: str, whole: bool = False) -> dict[str, t.Any]:
-        """Extract item details from its specific page.
+    def from_data(cls, data: list) -> "JsonDetailsExtractor":
+        """Extractor of json script data loaded beforehand e.g from cache
 
         Args:
-            content (str): Contents of the specific item page (html).
-            whole (bool, optional): Include less important details. Defaults to
-              False.
+            data (list): Json script data of the item page
+
+        Returns:
+            JsonDetailsExtractor: Extractor of the data
+        """
+        return cls(b"", data)
+
+    @staticmethod
+    def load_json_script(content: str | bytes) -> list:
+        """Loads data of the json script tag in the page.
+
+        - Slices the script straight from the html and only falls back to
+        parsing the whole page with `BeautifulSoup` when that fails.
+
+        Args:
+            content (str | bytes): Contents of the specific item page (html).
+
+        Returns:
+            list: Nuxt payload
+        """
+        from_script = find_json_script(content)
+
+        if from_script is not None:
+            try:
+                return loads(from_script)
+            except ValueError:
+                pass
+
+        logger.debug("Falling back to parsing the whole page to find json script")
+
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
+
+        from_script = (
+            souper(content).find("script", {"type": "application/json"}).text
+        )
+        return loads(from_script)
+
+    @classmethod
+    def load_payload(
+        cls, content: str | bytes, data: list | None = None
+    ) -> NuxtPayload:
+        """Loads nuxt payload of the page without resolving it.
+
+        Args:
+            content (str | bytes): Contents of the specific item page (html).
+            data (list | None, optional): Json script data already loaded.
 
         Raises:
             DetailsExtractionError: Incase no data extracted
 
         Returns:
-            dict[str, t.Any]: Extracted item details
+            NuxtPayload: Lazily resolved nuxt payload
         """
         try:
-            from_script = (
-                souper(content).find("script", {"type": "application/json"}).text
+            payload = NuxtPayload(
+                cls.load_json_script(content) if data is None else data
             )
-            data: list = loads(from_script)
-            extracts = []
-
-            def resolve_value(value):
-                if type(value) is list:
-                    return [
-                        resolve_value(
-                            data[index] if type(index) is int else index
-                        )
-                        for index in value
-                    ]
-
-                elif type(value) is dict:
-                    processed_value = {}
-                    for k, v in value.items():
-                        processed_value[k] = resolve_value(data[v])
-                    return processed_value
-
-                return value
-
-            for entry in data:
-                if type(entry) is dict:
-                    details = {}
-                    for key, index in entry.items():
-                        details[key] = resolve_value(data[index])
-
-                    extracts.append(details)
-
-            if extracts:
-                if whole:
-                    return extracts[0]
-                else:
-                    target_data: dict = extracts[0]["state"][1]
-                    return dict(
-                        zip(
-                            [key[2:] for key in target_data.keys()],  # Remove ^$s
-                            target_data.values(),
-                        )
-                    )
-            else:
-                raise DetailsExtractionError(
-                    "The extraction process completed without any find. "
-                    "Ensure correct content is passed."
-                )
+            cls.get_target_node(payload)
         except Exception as e:
-            if isinstance(e, DetailsExtractionError):
-                raise
-
             raise DetailsExtractionError(
                 "The extraction process completed without any find. Ensure "
                 "correct content is passed."
             ) from e
 
+        return payload
+
+    @staticmethod
+    def get_target_node(payload: NuxtPayload) -> NuxtNode:
+        """Unresolved view of the important details in the payload"""
+        return payload.root["state"][1]
+
+    @classmethod
+    def get_target_data(cls, payload: NuxtPayload) -> dict[str, t.Any]:
+        """Resolved important details in the payload"""
+        target_data: dict = cls.get_target_node(payload).resolve()
+        return dict(
+            zip(
+                [key[2:] for key in target_data.keys()],  # Remove ^$s
+                target_data.values(),
+            )
+        )
+
+    @classmethod
+    def extract(
+        self, content: str | bytes, whole: bool = False
+    ) -> dict[str, t.Any]:
+        """Extract item details from its specific page.
+
+        Args:
+            content (str | bytes): Contents of the specific item page (html).
+            whole (bool, optional): Include less important details. Defaults to
+              False.
+
+        Raises:
+            DetailsExtractionError: Incase no data extracted
+
+        Returns:
+            dict[str, t.Any]: Extracted item details
+        """
+        payload = self.load_payload(content)
+
+        if whole:
+            return payload.root.resolve()
+
+        return self.get_target_data(payload)
+
+    def resolve(self, *keys: str | int) -> t.Any:
+        """Resolves only the details at the given path
+
+        Args:
+            keys (str | int): Path to the details e.g `"resData", "subject"`
+
+        Returns:
+            t.Any: Resolved details
+        """
+        first_key, *other_keys = keys
+        node = self.get_target_node(self.payload)["$s" + first_key]
+
+        for key in other_keys:
+            node = node[key]
+
+        return node.resolve() if isinstance(node, NuxtNode) else node
+
     @property
     def data(self) -> dict[str, t.Any]:
         """Key data resources
@@ -326,7 +430,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.details["resData"]`
         """
-        return self.details["resData"]
+        return self.resolve("resData")
 
     @property
     def subject(self) -> dict[str, t.Any]:
@@ -335,7 +439,7 @@ class JsonDetailsExtractor:
         - Retrieved from `self.data["subject"]`
         """
 
-        return self.data["subject"]
+        return self.resolve("resData", "subject")
 
     @property
     def reviews(self) -> list[dict[str, t.Any]]:
@@ -343,7 +447,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.data["postList"]["items"]`
         """
-        return self.data["postList"]["items"]
+        return self.resolve("resData", "postList", "items")
 
     @property
     def metadata(self) -> dict[str, str]:
@@ -351,7 +455,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.data["metadata"]`
         """
-        return self.data["metadata"]
+        return self.resolve("resData", "metadata")
 
     @property
     def stars(self) -> list[dict[str, str | int]]:
@@ -359,7 +463,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.data["stars"]`
         """
-        return self.data["stars"]
+        return self.resolve("resData", "stars")
 
     @property
     def resource(self) -> dict[str, str | list[dict]]:
@@ -367,7 +471,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.data["resource"]`
         """
-        return self.data["resource"]
+        return self.resolve("resData", "resource")
 
     @property
     def seasons(
@@ -377,7 +481,7 @@ class JsonDetailsExtractor:
 
         - Retrieved from `self.resource["seasons"]`
         """
-        return self.resource["seasons"]
+        return self.resolve("resData", "resource", "seasons")
 
     @property
     def page_details(self) -> dict[str, str | bool]:
@@ -386,27 +490,29 @@ class JsonDetailsExtractor:
         - Retrieved from `self.data["pubParam"]`
         """
 
-        return self.data["pubParam"]
+        return self.resolve("resData", "pubParam")
 
     def get_details_extractor_model(self) -> "JsonDetailsExtractorModel":
         """Returns object that allows modelling of extracted details"""
-        return JsonDetailsExtractorModel(self._content)
+        return JsonDetailsExtractorModel(self)
 
 
 class TagDetailsExtractorModel:
     """Extracts item details from html tags and model them"""
 
-    def __init__(self, content: str):
+    def __init__(self, content: str | TagDetailsExtractor):
         """Constructor for `TagDetailsExtractorModel`
 
         Args:
-            content (str): Html formatted text
-        """
-        self.tag_details_extractor: TagDetailsExtractor = TagDetailsExtractor(
+            content (str | TagDetailsExtractor): Html formatted text or its extractor
+        """  # noqa: E501
+        self.tag_details_extractor: TagDetailsExtractor = (
             content
+            if isinstance(content, TagDetailsExtractor)
+            else TagDetailsExtractor(content)
         )
 
-    @property
+    @cached_property
     def details(self) -> ItemTagDetailsModel:
         """Modelled extracted item details
 
@@ -453,18 +559,35 @@ class TagDetailsExtractorModel:
 
 
 class JsonDetailsExtractorModel:
-    """Extracts item details from json-formatted data and models them"""
+    """Extracts item details from json-formatted data and models them
+
+    - Submodels are only validated when accessed.
+    """
 
-    def __init__(self, content: str):
+    def __init__(
+        self,
+        content: str | bytes | JsonDetailsExtractor,
+        details: ItemJsonDetailsModel | None = None,
+    ):
         """Constructor for `JsonDetailsExtractorModel`
 
         Args:
-            content (str): Html contents of the item page
-        """
-        self.json_details_extractor: JsonDetailsExtractor = JsonDetailsExtractor(
+            content (str | bytes | JsonDetailsExtractor): Html contents of the item page or its extractor
+            details (ItemJsonDetailsModel | None, optional): Details modelled beforehand e.g on the extraction pool - submodels are then taken from it.
+        """  # noqa: E501
+        self.json_details_extractor: JsonDetailsExtractor = (
             content
+            if isinstance(content, JsonDetailsExtractor)
+            else JsonDetailsExtractor(content)
         )
-        self.details: ItemJsonDetailsModel = self.extract(content)
+
+        if details is not None:
+            self.__dict__["details"] = details
+
+    @cached_property
+    def details(self) -> ItemJsonDetailsModel:
+        """Modelled extracted item details"""
+        return ItemJsonDetailsModel(**self.json_details_extractor.details)
 
     @classmethod
     def extract(cls, content: str) -> ItemJsonDetailsModel:
@@ -482,58 +605,79 @@ class JsonDetailsExtractorModel:
         contents = JsonDetailsExtractor.extract(content, whole=False)
         return ItemJsonDetailsModel(**contents)
 
-    @property
+    @cached_property
     def data(self) -> ResDataModel:
         """Key data resources
 
         Contains key data such as `metadata`, `stars`, `reviews`, `resource.seasons`, `subject` etc
 
-        - Shortcut for `self.details.resData`
+        - Modelled from `self.json_details_extractor.data`
         """
-        return self.details.resData
+        if "details" in self.__dict__:
+            return self.details.resData
 
-    @property
+        return ResDataModel(**self.json_details_extractor.data)
+
+    @cached_property
     def subject(self) -> SubjectModel:
         """Movie details such as `duration`, `releaseDate` etc
 
-        - Shortcut for `self.data.subject`
+        - Modelled from `self.json_details_extractor.subject`
         """
-        return self.data.subject
+        if "details" in self.__dict__:
+            return self.details.resData.subject
 
-    @property
+        return SubjectModel(**self.json_details_extractor.subject)
+
+    @cached_property
     def reviews(self) -> list[PostListItemModel]:
         """Reviews only
 
-        - Shortcut for `self.data.postList.items`
+        - Modelled from `self.json_details_extractor.reviews`
         """
-        return self.data.postList.items
+        if "details" in self.__dict__:
+            return self.details.resData.postList.items
 
-    @property
+        return [
+            PostListItemModel(**review)
+            for review in self.json_details_extractor.reviews
+        ]
+
+    @cached_property
     def metadata(self) -> MetadataModel:
         """Item metadata such as `description` etc
 
-        - Shortcut for `self.data.metadata`
+        - Modelled from `self.json_details_extractor.metadata`
         """
 
-        return self.data.metadata
+        if "details" in self.__dict__:
+            return self.details.resData.metadata
 
-    @property
+        return MetadataModel(**self.json_details_extractor.metadata)
+
+    @cached_property
     def stars(self) -> list[StarsModel]:
         """Movie casts
 
-        - Shortcut for `self.data.stars`
+        - Modelled from `self.json_details_extractor.stars`
         """
-        return self.data.stars
+        if "details" in self.__dict__:
+            return self.details.resData.stars
 
-    @property
+        return [StarsModel(**star) for star in self.json_details_extractor.stars]
+
+    @cached_property
     def resource(self) -> ResourceModel:
         """Data includes `seasons`, `source` & `uploadBy`
 
-        - Shortcut for `self.data.resource`
+        - Modelled from `self.json_details_extractor.resource`
         """
-        return self.data.resource
+        if "details" in self.__dict__:
+            return self.details.resData.resource
 
-    @property
+        return ResourceModel(**self.json_details_extractor.resource)
+
+    @cached_property
     def seasons(self) -> list[SeasonsModel]:
         """Season details
 
@@ -541,11 +685,14 @@ class JsonDetailsExtractorModel:
         """
         return self.resource.seasons
 
-    @property
+    @cached_property
     def page_details(self) -> PubParamModel:
         """Page details such as `url`, `referer`, `lang` etc
 
-        - Shortcut for `self.data.pubParam`
+        - Modelled from `self.json_details_extractor.page_details`
         """
 
-        return self.data.pubParam
+        if "details" in self.__dict__:
+            return self.details.resData.pubParam
+
+        return PubParamModel(**self.json_details_extractor.page_details)
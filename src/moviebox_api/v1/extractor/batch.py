@@ -0,0 +1,180 @@
+"""
+Extraction of details from many item pages on a process pool so that the
+CPU-bound parsing does not block the event loop driving network I/O.
+
+```python
+from moviebox_api.v1.extractor.batch import aextract_many, extract_many
+
+details = extract_many(pages, workers=4)
+models = await aextract_many(pages, kind="tag", model=True)
+```
+"""
+
+import asyncio
+import threading
+import typing as t
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+
+from pydantic import BaseModel
+
+from moviebox_api.v1.extractor._core import (
+    JsonDetailsExtractor,
+    TagDetailsExtractor,
+)
+from moviebox_api.v1.extractor.models.json import ItemJsonDetailsModel
+from moviebox_api.v1.extractor.models.tag import ItemTagDetailsModel
+
+__all__ = [
+    "extract",
+    "extract_many",
+    "aextract_many",
+    "model_json_data",
+    "get_extraction_pool",
+    "shutdown_extraction_pool",
+]
+
+ExtractorKind = t.Literal["json", "tag"]
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def extract(
+    content: str | bytes,
+    kind: ExtractorKind = "json",
+    model: bool = False,
+    return_exceptions: bool = False,
+) -> dict[str, t.Any] | BaseModel | Exception:
+    """Extracts details of a single item page - runs in the worker processes
+
+    Args:
+        content (str | bytes): Contents of the specific item page (html).
+        kind (ExtractorKind, optional): `json` for `JsonDetailsExtractor.extract` or `tag` for `TagDetailsExtractor.extract_all`. Defaults to "json".
+        model (bool, optional): Model the extracted details. Defaults to False.
+        return_exceptions (bool, optional): Return extraction errors instead of raising them. Defaults to False.
+
+    Returns:
+        dict[str, t.Any] | BaseModel | Exception: Extracted item details
+    """  # noqa: E501
+    try:
+        if kind == "json":
+            details = JsonDetailsExtractor.extract(content)
+            return ItemJsonDetailsModel(**details) if model else details
+
+        if kind == "tag":
+            if isinstance(content, bytes):
+                content = content.decode("utf-8", errors="replace")
+
+            details = TagDetailsExtractor(content).extract_all()
+            return ItemTagDetailsModel(**details) if model else details
+
+        raise ValueError(f"Unknown extractor kind {kind!r}")
+
+    except Exception as e:
+        if return_exceptions:
+            return e
+
+        raise
+
+
+def model_json_data(data: list) -> ItemJsonDetailsModel:
+    """Resolves & models json script data of an item page - runs in the
+    worker processes
+
+    Args:
+        data (list): Json script data loaded using `JsonDetailsExtractor.load_json_script`.
+
+    Returns:
+        ItemJsonDetailsModel: Modelled item details
+    """  # noqa: E501
+    return ItemJsonDetailsModel(**JsonDetailsExtractor.from_data(data).details)
+
+
+def get_extraction_pool(workers: int | None = None) -> ProcessPoolExecutor:
+    """Process pool shared by async extractions - created on first use
+
+    Args:
+        workers (int | None, optional): Worker processes of a new pool. Defaults to cpu count.
+
+    Returns:
+        ProcessPoolExecutor: Shared process pool
+    """  # noqa: E501
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers)
+
+        return _pool
+
+
+def shutdown_extraction_pool() -> None:
+    """Stops worker processes of the shared pool if any"""
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown()
+            _pool = None
+
+
+def extract_many(
+    pages: t.Iterable[str | bytes],
+    kind: ExtractorKind = "json",
+    model: bool = False,
+    workers: int | None = None,
+    chunksize: int = 1,
+    return_exceptions: bool = False,
+) -> list[dict[str, t.Any] | BaseModel | Exception]:
+    """Extracts details of many item pages on a process pool
+
+    Args:
+        pages (t.Iterable[str | bytes]): Contents of the specific item pages (html).
+        kind (ExtractorKind, optional): Extractor to use - `json` or `tag`. Defaults to "json".
+        model (bool, optional): Model the extracted details. Defaults to False.
+        workers (int | None, optional): Worker processes. 0 extracts in the current process. Defaults to cpu count.
+        chunksize (int, optional): Pages sent to a worker at once. Defaults to 1.
+        return_exceptions (bool, optional): Return extraction errors in place of details instead of raising them. Defaults to False.
+
+    Returns:
+        list[dict[str, t.Any] | BaseModel | Exception]: Extracted details in the order of `pages`
+    """  # noqa: E501
+    extractor = partial(
+        extract, kind=kind, model=model, return_exceptions=return_exceptions
+    )
+
+    if workers == 0:
+        return [extractor(page) for page in pages]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(extractor, pages, chunksize=chunksize))
+
+
+async def aextract_many(
+    pages: t.Iterable[str | bytes],
+    kind: ExtractorKind = "json",
+    model: bool = False,
+    executor: Executor | None = None,
+    return_exceptions: bool = False,
+) -> list[dict[str, t.Any] | BaseModel | Exception]:
+    """Extracts details of many item pages without blocking the event loop
+
+    Args:
+        pages (t.Iterable[str | bytes]): Contents of the specific item pages (html).
+        kind (ExtractorKind, optional): Extractor to use - `json` or `tag`. Defaults to "json".
+        model (bool, optional): Model the extracted details. Defaults to False.
+        executor (Executor | None, optional): Executor to run extractions on. Defaults to `get_extraction_pool()`.
+        return_exceptions (bool, optional): Return extraction errors in place of details instead of raising them. Defaults to False.
+
+    Returns:
+        list[dict[str, t.Any] | BaseModel | Exception]: Extracted details in the order of `pages`
+    """  # noqa: E501
+    loop = asyncio.get_running_loop()
+    executor = executor or get_extraction_pool()
+    extractor = partial(
+        extract, kind=kind, model=model, return_exceptions=return_exceptions
+    )
+    return await asyncio.gather(
+        *(loop.run_in_executor(executor, extractor, page) for page in pages)
+    )
@@ -1,15 +1,418 @@
 """Contains common functions for the submodule"""
 
+import os
+import re
+import typing as t
+from functools import cache, wraps
+from importlib.util import find_spec
+
 from bs4 import BeautifulSoup
 
+from moviebox_api.v1.constants import ENVIRONMENT_HTML_PARSER_KEY, HTML_PARSERS
+
+try:
+    from bs4.filter import ElementFilter
+except ImportError:  # beautifulsoup4 < 4.13
+    ElementFilter = None
+
+JSON_SCRIPT_OPENING_TAG_PATTERN = re.compile(
+    r"<script\b[^>]*\btype=[\"']?application/json[\"']?[^>]*>", re.IGNORECASE
+)
+JSON_SCRIPT_OPENING_TAG_BYTES_PATTERN = re.compile(
+    JSON_SCRIPT_OPENING_TAG_PATTERN.pattern.encode(), re.IGNORECASE
+)
+
+
+@cache
+def get_default_html_parser() -> str:
+    """First installed parser in `HTML_PARSERS`"""
+    for parser in HTML_PARSERS:
+        if parser == "html.parser" or find_spec(parser) is not None:
+            return parser
+
+    return "html.parser"
+
+
+def get_html_parser(parser: str | None = None) -> str:
+    """Html parser to use with `BeautifulSoup`
+
+    Args:
+        parser (str | None, optional): Parser name e.g `lxml`. Defaults to the
+          environment variable `MOVIEBOX_HTML_PARSER` then the fastest installed.
+
+    Returns:
+        str: Parser name
+    """
+    return (
+        parser
+        or os.getenv(ENVIRONMENT_HTML_PARSER_KEY)
+        or get_default_html_parser()
+    )
+
+
+def get_scope_filter(
+    tags: t.Iterable[str] = (), classes: t.Iterable[str] = ()
+) -> "ElementFilter | None":
+    """Filter that makes `BeautifulSoup` build only the matching top-most tags
+    and their descendants
 
-def souper(html: str) -> BeautifulSoup:
+    Args:
+        tags (t.Iterable[str], optional): Names of tags to build e.g `head`.
+        classes (t.Iterable[str], optional): Classes of tags to build.
+
+    Returns:
+        ElementFilter | None: Filter or None if unsupported by beautifulsoup4
+    """
+    if ElementFilter is None:
+        return None
+
+    tags = frozenset(tags)
+    classes = frozenset(classes)
+
+    class ScopeFilter(ElementFilter):
+        def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+            if name in tags:
+                return True
+
+            tag_classes = (attrs or {}).get("class") or ()
+
+            if isinstance(tag_classes, str):
+                tag_classes = tag_classes.split()
+
+            return not classes.isdisjoint(tag_classes)
+
+        def allow_string_creation(self, string) -> bool:
+            return False
+
+    return ScopeFilter()
+
+
+def souper(
+    html: str,
+    parser: str | None = None,
+    parse_only: "ElementFilter | None" = None,
+) -> BeautifulSoup:
     """Convert html formatted txt to bts object
 
     Args:
         html (str): Html formatted text
+        parser (str | None, optional): Parser name. Defaults to `get_html_parser()`.
+        parse_only (ElementFilter | None, optional): Builds only the matching parts.
 
     Returns:
         BeautifulSoup: Souped html
+    """  # noqa: E501
+    return BeautifulSoup(html, get_html_parser(parser), parse_only=parse_only)
+
+
+def cache_result(method: t.Callable) -> t.Callable:
+    """Caches results of an extractor method per instance and arguments so
+    that the page is only walked once
+
+    Args:
+        method (t.Callable): Extractor method
+
+    Returns:
+        t.Callable: Caching method
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        results: dict = self.__dict__.setdefault("_results", {})
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+
+        if key not in results:
+            results[key] = method(self, *args, **kwargs)
+
+        return results[key]
+
+    return wrapper
+
+
+def find_json_script(content: str | bytes) -> str | bytes | None:
+    """Slices contents of the first `<script type="application/json">` tag
+    straight from the html without parsing it
+
+    Args:
+        content (str | bytes): Html formatted text
+
+    Returns:
+        str | bytes | None: Script contents or None if the tag is not found
+    """
+    if isinstance(content, bytes):
+        opening_tag_pattern = JSON_SCRIPT_OPENING_TAG_BYTES_PATTERN
+        closing_tag = b"</script"
+    else:
+        opening_tag_pattern = JSON_SCRIPT_OPENING_TAG_PATTERN
+        closing_tag = "</script"
+
+    opening_tag = opening_tag_pattern.search(content)
+
+    if opening_tag is None:
+        return None
+
+    end = content.find(closing_tag, opening_tag.end())
+
+    if end == -1:
+        return None
+
+    return content[opening_tag.end() : end]
+
+
+class JsonScriptScanner:
+    """Tells when the json script tag of a page being received in chunks has
+    been fully received
+
+    - Only the newly received part of the body is scanned on each call.
+
+    ```python
+    scanner = JsonScriptScanner()
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if scanner(body):
+            break
+    ```
+    """
+
+    max_opening_tag_size: int = 512
+    """Bytes rescanned in case the opening tag is split across chunks"""
+
+    def __init__(self):
+        self._script_start: int | None = None
+        self._scanned: int = 0
+        self.is_complete: bool = False
+        """Whether the whole script tag has been received"""
+
+    def __call__(self, body: bytes | bytearray) -> bool:
+        """Scans what has been received since the last call
+
+        Args:
+            body (bytes | bytearray): Whole body received so far
+
+        Returns:
+            bool: Whether the whole script tag has been received
+        """
+        if self._script_start is None:
+            opening_tag = JSON_SCRIPT_OPENING_TAG_BYTES_PATTERN.search(
+                body, max(0, self._scanned - self.max_opening_tag_size)
+            )
+            self._scanned = len(body)
+
+            if opening_tag is None:
+                return False
+
+            self._script_start = self._scanned = opening_tag.end()
+
+        end = body.find(b"</script", max(self._script_start, self._scanned - 8))
+        self._scanned = len(body)
+        self.is_complete = end != -1
+        return self.is_complete
+
+
+class NuxtPayload:
+    """Nuxt (devalue) payload - an array whose objects and arrays reference
+    their values by index - resolved lazily.
+
+    - Nodes are only resolved when asked for and each index is resolved
+    once and shared by all its references.
+    - Resolution is iterative and cycles end up as self-references.
+    """
+
+    def __init__(self, data: list):
+        """Constructor for `NuxtPayload`
+
+        Args:
+            data (list): Nuxt payload
+        """
+        self.data = data
+        self._resolved: dict[int, t.Any] = {}
+
+    def __repr__(self) -> str:
+        return (
+            rf"<NuxtPayload entries={len(self.data)} "
+            rf"resolved={len(self._resolved)}>"
+        )
+
+    @property
+    def root(self) -> "NuxtNode | None":
+        """View of the first object in the payload if any"""
+        root_index = next(
+            (
+                index
+                for index, entry in enumerate(self.data)
+                if type(entry) is dict
+            ),
+            None,
+        )
+
+        if root_index is None:
+            return None
+
+        return NuxtNode(self, self.data[root_index], root_index)
+
+    def get_node(self, entry: t.Any, is_index: bool = True) -> "NuxtNode | t.Any":
+        """View of an object/array or the value itself for other types
+
+        Args:
+            entry (t.Any): Index of the value or the value itself.
+            is_index (bool, optional): `entry` is an index. Defaults to True.
+        """
+        index = entry if is_index else None
+        value = self.data[entry] if is_index else entry
+
+        if type(value) in (list, dict):
+            return NuxtNode(self, value, index)
+
+        return value
+
+    def resolve(self, entry: t.Any, is_index: bool = True) -> t.Any:
+        """Fully resolves a value and everything it references
+
+        Args:
+            entry (t.Any): Index of the value or the value itself.
+            is_index (bool, optional): `entry` is an index. Defaults to True.
+        """
+        resolved = self._resolved
+        data = self.data
+        pending: list[tuple[list | dict, list | dict]] = []
+
+        def new_container(source: list | dict) -> list | dict:
+            container = [] if type(source) is list else {}
+            pending.append((container, source))
+            return container
+
+        def resolve_index(index: int) -> t.Any:
+            if index in resolved:
+                return resolved[index]
+
+            value = data[index]
+
+            if type(value) in (list, dict):
+                value = new_container(value)
+
+            resolved[index] = value
+            return value
+
+        def resolve_literal(value: t.Any) -> t.Any:
+            if type(value) in (list, dict):
+                return new_container(value)
+
+            return value
+
+        value = resolve_index(entry) if is_index else resolve_literal(entry)
+
+        while pending:
+            container, source = pending.pop()
+
+            if type(source) is list:
+                container.extend(
+                    resolve_index(item)
+                    if type(item) is int
+                    else resolve_literal(item)
+                    for item in source
+                )
+            else:
+                for key, index in source.items():
+                    container[key] = resolve_index(index)
+
+        return value
+
+
+class NuxtNode:
+    """View of an object or array in a `NuxtPayload` whose children are
+    resolved on key or attribute access
+
+    ```python
+    payload = NuxtPayload(data)
+    seasons = payload.root["state"][1]["$sresData"].resource.seasons.resolve()
+    ```
+    """
+
+    def __init__(
+        self, payload: NuxtPayload, source: list | dict, index: int | None = None
+    ):
+        """Constructor for `NuxtNode`
+
+        Args:
+            payload (NuxtPayload): Payload the node belongs to.
+            source (list | dict): Raw object/array.
+            index (int | None, optional): Position in the payload. Defaults to None.
+        """  # noqa: E501
+        self._payload = payload
+        self._source = source
+        self._index = index
+
+    def __repr__(self) -> str:
+        return (
+            rf"<NuxtNode {type(self._source).__name__} "
+            rf"index={self._index} size={len(self._source)}>"
+        )
+
+    def _get_child(self, entry: t.Any) -> "NuxtNode | t.Any":
+        # Object values are always indices, array items only when integers
+        is_index = type(self._source) is dict or type(entry) is int
+        return self._payload.get_node(entry, is_index)
+
+    def __getitem__(self, key: str | int) -> "NuxtNode | t.Any":
+        return self._get_child(self._source[key])
+
+    def __getattr__(self, name: str) -> "NuxtNode | t.Any":
+        if name.startswith("_") or type(self._source) is not dict:
+            raise AttributeError(name)
+
+        try:
+            return self[name]
+        except KeyError as e:
+            raise AttributeError(name) from e
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __contains__(self, key: t.Any) -> bool:
+        return key in self._source
+
+    def __iter__(self) -> t.Iterator:
+        if type(self._source) is dict:
+            return iter(self._source)
+
+        return (self._get_child(entry) for entry in self._source)
+
+    def keys(self) -> t.KeysView:
+        """Keys of the object"""
+        return self._source.keys()
+
+    def get(self, key: str, default: t.Any = None) -> "NuxtNode | t.Any":
+        """Child of the object or `default` if missing"""
+        if key in self._source:
+            return self[key]
+
+        return default
+
+    def resolve(self) -> list | dict:
+        """Fully resolved object/array"""
+        if self._index is None:
+            return self._payload.resolve(self._source, is_index=False)
+
+        return self._payload.resolve(self._index)
+
+
+def resolve_nuxt_payload(data: list) -> dict | None:
+    """Resolves the first object of a nuxt (devalue) payload - an array whose
+    objects and arrays reference their values by index.
+
+    - Each index is resolved only once and shared by all its references.
+    - Resolution is iterative and cycles end up as self-references.
+
+    Args:
+        data (list): Nuxt payload
+
+    Returns:
+        dict | None: First resolved object or None if there's none
     """
-    return BeautifulSoup(html, "html.parser")
+    root = NuxtPayload(data).root
+
+    if root is None:
+        return None
+
+    return root.resolve()
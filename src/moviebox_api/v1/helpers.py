@@ -3,14 +3,36 @@ This module provide functions for performing common and frequently required task
 across the package.
 """
 
+import codecs
+import importlib.util
+import json
+import os
 import re
 import typing as t
+from contextlib import contextmanager
+from pathlib import Path
 from urllib.parse import urljoin
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import httpx
 
 from moviebox_api.utils import get_event_loop
-from moviebox_api.v1.constants import HOST_URL, ITEM_DETAILS_PATH
+from moviebox_api.v1.constants import (
+    ENVIRONMENT_HTTP2_KEY,
+    HOST_URL,
+    ITEM_DETAILS_PATH,
+    MAX_ERROR_BODY_SIZE,
+)
 from moviebox_api.v1.exceptions import UnsuccessfulResponseError
 from moviebox_api.v1.logger import logger
 
@@ -30,6 +52,14 @@ SERIES_NAME_WITH_SEASON_NUMBER_ONE_PATTERN = re.compile(r"^.*\sS1$")
 
 UNWANTED_ITEM_NAME_PATTERN = re.compile(r"(\sS\d{1,}|\sS\d{1,}-S\d{1,}|-S\d{1,})")
 
+WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+
+JSON_STRUCTURAL_PATTERN = re.compile(r'["\[\]{}]')
+
+JSON_STRING_SPECIAL_PATTERN = re.compile(r'["\\]')
+
+JSON_SCALAR_DELIMITERS = " \t\n\r,]}"
+
 
 def get_absolute_url(relative_url: str, base_url: str = HOST_URL) -> str:
     """Makes absolute url from relative one
@@ -66,32 +96,64 @@ def assert_instance(
     )
 
 
-def process_api_response(response: httpx.Response) -> dict | list:
-    """Extracts the response data field
+def loads_json(content: bytes | str) -> t.Any:
+    """Decodes json using `orjson` when installed - straight from bytes
 
     Args:
-        response (t.Dict): Server response
+        content (bytes | str): Json document
 
     Returns:
-        t.Dict: Extracted data field value
+        t.Any: Decoded json
     """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+
+def truncate_body(content: bytes, size: int = MAX_ERROR_BODY_SIZE) -> str:
+    """Decodes only the first `size` bytes of a response body for messages"""
+    body = content[:size].decode("utf-8", errors="replace")
+
+    if len(content) > size:
+        body += f"... ({len(content) - size} more bytes)"
+
+    return body
+
+
+def get_media_type(response: httpx.Response) -> str:
+    """Content type of the response without parameters such as `charset`"""
+    content_type = response.headers.get("content-type", "")
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def assert_api_content_type(response: httpx.Response) -> None:
+    """Asserts the response is json - body is truncated in the error"""
     expected_content_type = "application/json"
     content_type = response.headers.get("content-type", "")
 
-    if content_type != expected_content_type:
+    if get_media_type(response) != expected_content_type:
         raise RuntimeError(
             f"Unexpect content type {content_type!r} encountered. "
-            f"Expected {expected_content_type!r} - BODY {response.text!r}"
+            f"Expected {expected_content_type!r} - "
+            f"BODY {truncate_body(response.content)!r}"
         )
 
-    j: dict = response.json()
 
-    if j.get("code", 1) == 0 and j.get("message") == "ok":
-        return j["data"]
+def is_successful_api_response(j: dict) -> bool:
+    """Checks the `code` & `message` fields of an api response"""
+    return j.get("code", 1) == 0 and j.get("message") == "ok"
+
 
+def raise_unsuccessful_api_response(
+    response: httpx.Response | None, body: bytes | None = None
+) -> t.NoReturn:
+    """Raises `UnsuccessfulResponseError` with the truncated body"""
+    body = response.content if body is None else body
+    status_code = None if response is None else response.status_code
     error_msg = (
         "Unsuccessful response received from server - "
-        f"STATUS {response.status_code} - BODY: {response.text!r}"
+        f"STATUS {status_code} - BODY: {truncate_body(body)!r}"
     )
 
     logger.debug(error_msg)
@@ -102,9 +164,320 @@ def process_api_response(response: httpx.Response) -> dict | list:
     )
 
 
+def process_api_response(response: httpx.Response) -> dict | list:
+    """Extracts the response data field
+
+    Args:
+        response (t.Dict): Server response
+
+    Returns:
+        t.Dict: Extracted data field value
+    """
+    assert_api_content_type(response)
+
+    j: dict = loads_json(response.content)
+
+    if is_successful_api_response(j):
+        return j["data"]
+
+    raise_unsuccessful_api_response(response)
+
+
 extract_data_field_value = process_api_response
 
 
+class ApiItemsParser:
+    """Incrementally parses an api response body fed in chunks and hands over
+    elements of `data.items` as soon as each one is complete - without
+    holding the whole document.
+
+    ```python
+    parser = ApiItemsParser()
+    for chunk in chunks:
+        for item in parser.feed(chunk):
+            ...
+    rest = parser.close() # Response without the items
+    ```
+    """
+
+    trim_size: int = 64 * 1024
+    """Characters consumed before the parsed part of the buffer is dropped"""
+
+    def __init__(
+        self,
+        response: httpx.Response | None = None,
+        path: tuple[str, ...] = ("data", "items"),
+    ):
+        """Constructor for `ApiItemsParser`
+
+        Args:
+            response (httpx.Response | None, optional): Streamed response whose body is fed. Used in errors. Defaults to None.
+            path (tuple[str, ...], optional): Keys leading to the array whose elements are yielded. Defaults to ("data", "items").
+        """  # noqa: E501
+        self.response = response
+        self.path = path
+        self.head = bytearray()
+        """Start of the body - for error messages"""
+        self.document: dict = {}
+        """Fields parsed so far other than the items"""
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pending: list[str] | None = None
+        """Chunks received while a value is being scanned"""
+        self._pos = 0
+        self._eof = False
+        self._items: list = []
+        self._parser = self._parse()
+
+    @property
+    def is_successful(self) -> bool:
+        """Whether the `code` & `message` fields parsed report success"""
+        return is_successful_api_response(self.document)
+
+    def feed(self, chunk: bytes) -> list[t.Any]:
+        """Parses the next chunk of the body
+
+        Args:
+            chunk (bytes): Body bytes following those fed previously
+
+        Raises:
+            UnsuccessfulResponseError: When the response reports a failure
+            json.JSONDecodeError: When the body is not valid json
+
+        Returns:
+            list[t.Any]: Items completed by this chunk
+        """
+        if len(self.head) <= MAX_ERROR_BODY_SIZE:
+            self.head += chunk[: MAX_ERROR_BODY_SIZE + 1 - len(self.head)]
+
+        self._append(self._decoder.decode(chunk))
+        return self._advance()
+
+    def close(self) -> dict:
+        """Parses the rest of the body
+
+        Returns:
+            dict: The response fields other than the items
+        """
+        self._append(self._decoder.decode(b"", final=True))
+        self._eof = True
+        self._advance()
+
+        if not self.is_successful:
+            self._raise_unsuccessful()
+
+        return self.document
+
+    def _append(self, text: str) -> None:
+        if self._pending is None:
+            self._buffer += text
+        else:
+            self._pending.append(text)
+
+    def _raise_unsuccessful(self) -> t.NoReturn:
+        raise_unsuccessful_api_response(self.response, bytes(self.head))
+
+    def _advance(self) -> list[t.Any]:
+        if self._parser is not None:
+            try:
+                self._parser.send(None)
+            except StopIteration:
+                self._parser = None
+                self._skip_whitespace()
+                if self._pos < len(self._buffer):
+                    raise json.JSONDecodeError(
+                        "Extra data", self._buffer, self._pos
+                    )
+
+        items, self._items = self._items, []
+
+        if self._pos > self.trim_size:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+
+        return items
+
+    def _skip_whitespace(self) -> None:
+        self._pos = WHITESPACE_PATTERN.match(self._buffer, self._pos).end()
+
+    def _next_char(self) -> t.Generator[None, None, str]:
+        """Whitespace-skipped character at the current position"""
+        while True:
+            self._skip_whitespace()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+
+            if self._eof:
+                raise json.JSONDecodeError(
+                    "Expecting value", self._buffer, self._pos
+                )
+            yield
+
+    def _expect(self, characters: str) -> t.Generator[None, None, str]:
+        char = yield from self._next_char()
+        if char not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self._buffer, self._pos
+            )
+
+        self._pos += 1
+        return char
+
+    def _value(self) -> t.Generator[None, None, t.Any]:
+        """Decodes the next complete json value"""
+        char = yield from self._next_char()
+
+        if char in '"[{':
+            yield from self._scan_value()
+            value, self._pos = self._json_decoder.raw_decode(
+                self._buffer, self._pos
+            )
+            return value
+
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(
+                    self._buffer, self._pos
+                )
+                if self._eof or (
+                    end < len(self._buffer)
+                    and self._buffer[end] in JSON_SCALAR_DELIMITERS
+                ):
+                    # A number ending the buffer e.g `1.` might be incomplete
+                    self._pos = end
+                    return value
+
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+
+            yield
+
+    def _scan_value(self) -> t.Generator[None, None, None]:
+        """Waits until the string, array or object at the current position is
+        complete so that it is decoded only once.
+
+        - Tracks nesting depth & string state across chunks, scanning each
+        chunk once.
+        - Chunks are held in `_pending` and joined to the buffer only once the
+        value is complete.
+        """
+        depth = 0
+        in_string = False
+        escaped = False
+        text, index = self._buffer, self._pos
+        scanned_chunks = 0
+        self._pending = []
+
+        try:
+            while True:
+                size = len(text)
+
+                if escaped and index < size:
+                    index += 1
+                    escaped = False
+
+                while index < size:
+                    if in_string:
+                        match = JSON_STRING_SPECIAL_PATTERN.search(text, index)
+                        if match is None:
+                            break
+
+                        index = match.end()
+                        if match.group() == "\\":
+                            if index == size:
+                                escaped = True  # Escaped character is ahead
+                                break
+
+                            index += 1
+                            continue
+
+                        in_string = False
+                        if depth == 0:
+                            return
+
+                    else:
+                        match = JSON_STRUCTURAL_PATTERN.search(text, index)
+                        if match is None:
+                            break
+
+                        char = match.group()
+                        index = match.end()
+
+                        if char == '"':
+                            in_string = True
+                        elif char in "[{":
+                            depth += 1
+                        else:
+                            depth -= 1
+                            if depth == 0:
+                                return
+
+                if scanned_chunks < len(self._pending):
+                    text, index = self._pending[scanned_chunks], 0
+                    scanned_chunks += 1
+                    continue
+
+                if self._eof:
+                    raise json.JSONDecodeError(
+                        "Unterminated value", self._buffer, self._pos
+                    )
+                yield
+
+        finally:
+            self._buffer += "".join(self._pending)
+            self._pending = None
+
+    def _parse(self) -> t.Generator[None, None, None]:
+        yield from self._parse_object(self.path, self.document)
+
+    def _parse_object(
+        self, path: tuple[str, ...], target: dict
+    ) -> t.Generator[None, None, None]:
+        yield from self._expect("{")
+        if (yield from self._next_char()) == "}":
+            self._pos += 1
+            return
+
+        while True:
+            key = yield from self._value()
+            yield from self._expect(":")
+
+            if path and key == path[0]:
+                if target is self.document and not self.is_successful:
+                    self._raise_unsuccessful()
+
+                char = yield from self._next_char()
+                if len(path) > 1 and char == "{":
+                    target[key] = {}
+                    yield from self._parse_object(path[1:], target[key])
+
+                elif len(path) == 1 and char == "[":
+                    yield from self._parse_items()
+
+                else:
+                    target[key] = yield from self._value()
+            else:
+                target[key] = yield from self._value()
+
+            if (yield from self._expect(",}")) == "}":
+                return
+
+    def _parse_items(self) -> t.Generator[None, None, None]:
+        yield from self._expect("[")
+        if (yield from self._next_char()) == "]":
+            self._pos += 1
+            return
+
+        while True:
+            item = yield from self._value()
+            self._items.append(item)
+
+            if (yield from self._expect(",]")) == "]":
+                return
+
+
 def get_file_extension(url: str) -> str | None:
     """Extracts extension from file url e.g `mp4` or `srt`
 
@@ -139,3 +512,52 @@ def is_valid_search_item(item_name: str) -> bool:
 
 def sanitize_item_name(item_name: str) -> str:
     return UNWANTED_ITEM_NAME_PATTERN.sub("", item_name)
+
+
+def resolve_http2(http2: bool | None) -> bool:
+    """Whether to enable HTTP/2 in httpx clients
+
+    Args:
+        http2 (bool | None): Explicit choice. None falls back to the environment
+            variable `MOVIEBOX_HTTP2`.
+
+    Returns:
+        bool: False when HTTP/2 is not wanted or `h2` is not installed.
+    """
+    if http2 is None:
+        http2 = os.getenv(ENVIRONMENT_HTTP2_KEY, "0").lower() in ("1", "true")
+
+    if http2 and importlib.util.find_spec("h2") is None:
+        logger.warning(
+            "HTTP/2 requires the 'h2' package - `pip install httpx[http2]`. "
+            "Falling back to HTTP/1.1"
+        )
+        return False
+
+    return http2
+
+
+@contextmanager
+def file_lock(path: Path | str) -> t.Iterator[None]:
+    """Holds an exclusive inter-process lock on `path` until exit
+
+    Args:
+        path (Path | str): Lock file. Created if it doesn't exist.
+    """
+    os.makedirs(Path(path).parent, exist_ok=True)
+
+    with open(path, "a+b") as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        else:
+            fh.seek(0)
+            msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+            else:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
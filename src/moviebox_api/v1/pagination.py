@@ -0,0 +1,202 @@
+"""
+Walks paginated results while fetching the pages that follow ahead of the
+consumer - through a bounded window - and yields them (or their items)
+in order.
+"""
+
+import asyncio
+import copy
+import typing as t
+from collections import deque
+from math import ceil
+
+from pydantic import BaseModel
+
+from moviebox_api.v1.constants import DEFAULT_ITEMS_BUFFER_SIZE
+
+__all__ = ["aiter_items", "aiter_pages", "at_page"]
+
+
+def at_page[C](cursor: C, page: int, attribute: str = "_page") -> C:
+    """Shallow copy of a content provider set to fetch a different page
+
+    Args:
+        cursor (C): Content provider e.g `Trending`
+        page (int): Page number
+        attribute (str, optional): Attribute holding the page number. Defaults to "_page".
+
+    Returns:
+        C: Content provider for the page
+    """  # noqa: E501
+    cursor = copy.copy(cursor)
+    setattr(cursor, attribute, page)
+    return cursor
+
+
+def get_pager_info(content: BaseModel) -> tuple[bool, int, int, int]:
+    """Pagination details of modelled page contents - v1/v2 or v3 pager
+
+    Returns:
+        tuple[bool, int, int, int]: has-more, next page, per page & total count
+    """
+    pager = content.pager
+
+    if hasattr(pager, "has_more"):
+        return (
+            pager.has_more,
+            pager.next_page,
+            pager.per_page,
+            pager.total_count,
+        )
+
+    return pager.hasMore, pager.nextPage, pager.perPage, pager.totalCount
+
+
+async def aiter_pages[PageModel: BaseModel](
+    fetch: t.Callable[[int], t.Awaitable[PageModel]],
+    page: int,
+    concurrency: int = 1,
+) -> t.AsyncIterator[PageModel]:
+    """Yields modelled contents of `page` and those that follow in order
+
+    - With the total count known from the first page, up to `concurrency`
+    pages are fetched at once.
+    - Otherwise only the page following the one being consumed is fetched
+    ahead (speculatively).
+    - Stops at the first page without more results; pages fetched beyond it
+    are discarded.
+
+    Args:
+        fetch (t.Callable[[int], t.Awaitable[PageModel]]): Fetches modelled contents of a page number.
+        page (int): Number of the first page.
+        concurrency (int, optional): Maximum pages fetched at once. 1 fetches one after another. Defaults to 1.
+
+    Yields:
+        PageModel: Modelled contents of each page
+    """  # noqa: E501
+    assert concurrency >= 1, f"concurrency must be at least 1 not {concurrency}"
+
+    content = await fetch(page)
+    has_more, next_page, per_page, total_count = get_pager_info(content)
+    last_page = None
+
+    if total_count > 0 and per_page > 0:
+        # Pages counted from 1 - an extra page when counted from 0 is discarded
+        last_page = max(ceil(total_count / per_page), next_page)
+
+    pending: deque[asyncio.Task[PageModel]] = deque()
+
+    def fill():
+        nonlocal next_page
+        while len(pending) < (
+            concurrency if last_page is not None and next_page <= last_page else 1
+        ):
+            pending.append(asyncio.ensure_future(fetch(next_page)))
+            next_page += 1
+
+    try:
+        while True:
+            if has_more and concurrency > 1:
+                # Fetch ahead while the consumer handles this page
+                fill()
+
+            yield content
+
+            if not has_more:
+                break
+
+            fill()
+            content = await pending.popleft()
+            has_more = get_pager_info(content)[0]
+
+    finally:
+        for task in pending:
+            task.cancel()
+
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+class _Failure:
+    """Error raised while fetching pages - handed over to the consumer"""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def get_item_key(item: BaseModel) -> str | None:
+    """Subject id of a v1/v2 or v3 item used to drop duplicates"""
+    return getattr(item, "subjectId", getattr(item, "subject_id", None))
+
+
+async def aiter_items[Item: BaseModel](
+    pages: t.AsyncIterator[BaseModel],
+    limit: int | None = None,
+    buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+) -> t.AsyncIterator[Item]:
+    """Yields items of the pages one at a time - each subject only once
+
+    - Pages are fetched in the background until `buffer_size` items are
+    waiting, so the pace of the consumer controls how far ahead it gets.
+
+    Args:
+        pages (t.AsyncIterator[BaseModel]): Modelled contents of the pages e.g `get_content_model_all()`.
+        limit (int | None, optional): Maximum items to yield. Defaults to None (all).
+        buffer_size (int, optional): Maximum items fetched ahead of the consumer. Defaults to DEFAULT_ITEMS_BUFFER_SIZE.
+
+    Yields:
+        Item: Items not yielded before
+    """  # noqa: E501
+    assert limit is None or limit >= 0, f"limit cannot be negative - {limit}"
+    assert buffer_size >= 1, f"buffer_size must be at least 1 not {buffer_size}"
+
+    if limit == 0:
+        return
+
+    queue: asyncio.Queue[Item | _Failure | None] = asyncio.Queue(buffer_size)
+
+    async def produce():
+        try:
+            async for content in pages:
+                for item in content.items:
+                    await queue.put(item)
+
+        except Exception as e:
+            await queue.put(_Failure(e))
+            return
+
+        finally:
+            if hasattr(pages, "aclose"):
+                await pages.aclose()
+
+        await queue.put(None)
+
+    producer = asyncio.ensure_future(produce())
+    seen: set[str] = set()
+    yielded = 0
+
+    try:
+        while limit is None or yielded < limit:
+            item = await queue.get()
+
+            if item is None:
+                break
+
+            if isinstance(item, _Failure):
+                raise item.error
+
+            key = get_item_key(item)
+
+            if key is not None:
+                if key in seen:
+                    continue
+
+                seen.add(key)
+
+            yield item
+            yielded += 1
+
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
@@ -0,0 +1,215 @@
+"""
+Client-side rate limiting of requests using adaptive token buckets - one for
+each upstream host and endpoint class.
+
+```python
+from moviebox_api.v1 import Session
+from moviebox_api.v1.rate_limit import RateLimiter
+
+# Shared by every session and client in the process
+session = Session(rate_limiter=RateLimiter.shared())
+```
+"""
+
+import asyncio
+import os
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from moviebox_api.v1.constants import (
+    DEFAULT_RATE_LIMITS,
+    ENVIRONMENT_RATE_LIMIT_KEY,
+    MEDIA_FILE_EXTENSIONS,
+    EndpointClass,
+)
+from moviebox_api.v1.logger import logger
+
+__all__ = [
+    "TokenBucket",
+    "RateLimiter",
+    "RateLimiterStats",
+    "get_default_rate_limiter",
+]
+
+
+class TokenBucket:
+    """Token bucket whose rate halves on throttling and slowly recovers
+    on success (additive increase, multiplicative decrease)
+
+    - Waiters reserve tokens in advance instead of holding a lock so the
+    bucket works across event loops and threads.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float | None = None,
+        min_rate: float | None = None,
+        decrease_factor: float = 0.5,
+        recovery_step: float | None = None,
+    ):
+        """Constructor for `TokenBucket`
+
+        Args:
+            rate (float): Maximum requests per second.
+            burst (float | None, optional): Bucket capacity. Defaults to `rate`.
+            min_rate (float | None, optional): Lowest adapted rate. Defaults to 5% of `rate`.
+            decrease_factor (float, optional): Rate multiplier on throttling. Defaults to 0.5.
+            recovery_step (float | None, optional): Rate increase on success. Defaults to 2% of `rate`.
+        """  # noqa: E501
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst or max(rate, 1.0)
+        self.min_rate = min_rate or rate * 0.05
+        self.decrease_factor = decrease_factor
+        self.recovery_step = recovery_step or rate * 0.02
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return rf"<TokenBucket rate={self.rate:.2f}/{self.max_rate}>"
+
+    def _reserve(self) -> float:
+        """Takes a token and returns seconds to wait for it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        """Waits for a token
+
+        Returns:
+            float: Seconds waited
+        """
+        delay = self._reserve()
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        return delay
+
+    def throttle(self) -> None:
+        """Slows down after being rate-limited by the server"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+
+    def recover(self) -> None:
+        """Speeds up slowly after a successful request"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+
+@dataclass
+class RateLimiterStats:
+    """Rate limiter counters"""
+
+    requests: int = 0
+    delayed: int = 0
+    """Requests that had to wait for a token"""
+    waited: float = 0.0
+    """Total seconds waited"""
+    throttled: int = 0
+    """Responses with status 429"""
+
+
+class RateLimiter:
+    """Token buckets keyed by host and endpoint class"""
+
+    _shared: "RateLimiter | None" = None
+
+    def __init__(
+        self,
+        rates: dict[EndpointClass, float] | None = None,
+        host_rates: dict[str, dict[EndpointClass, float]] | None = None,
+    ):
+        """Constructor for `RateLimiter`
+
+        Args:
+            rates (dict[EndpointClass, float] | None, optional): Requests per second of each endpoint class. Updates DEFAULT_RATE_LIMITS.
+            host_rates (dict[str, dict[EndpointClass, float]] | None, optional): Host-specific `rates` overrides.
+        """  # noqa: E501
+        self.rates = {**DEFAULT_RATE_LIMITS, **(rates or {})}
+        self.host_rates = host_rates or {}
+        self.stats = RateLimiterStats()
+        self._buckets: dict[tuple[str, EndpointClass], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return rf"<RateLimiter buckets={len(self._buckets)} stats={self.stats}>"
+
+    @classmethod
+    def shared(cls) -> "RateLimiter":
+        """Process-wide rate limiter"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @staticmethod
+    def classify(url: str) -> EndpointClass:
+        """Endpoint class of the url"""
+        path = urlsplit(url).path.lower()
+
+        if path.endswith(MEDIA_FILE_EXTENSIONS):
+            return EndpointClass.MEDIA
+
+        if "-bff/" in path or "/api/" in path:
+            return EndpointClass.API
+
+        return EndpointClass.PAGE
+
+    def get_bucket(self, url: str) -> TokenBucket:
+        """Token bucket of the url's host and endpoint class"""
+        host = urlsplit(url).netloc
+        endpoint_class = self.classify(url)
+        key = (host, endpoint_class)
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+
+            if bucket is None:
+                rate = self.host_rates.get(host, {}).get(
+                    endpoint_class, self.rates[endpoint_class]
+                )
+                bucket = self._buckets[key] = TokenBucket(rate)
+
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Waits for the turn of a request to the url"""
+        waited = await self.get_bucket(url).acquire()
+        self.stats.requests += 1
+
+        if waited:
+            self.stats.delayed += 1
+            self.stats.waited += waited
+
+    def update(self, url: str, status_code: int) -> None:
+        """Adapts the rate of the url's bucket to the response status"""
+        bucket = self.get_bucket(url)
+
+        if status_code == 429:
+            self.stats.throttled += 1
+            bucket.throttle()
+            logger.debug(f"Throttled by {url!r} - rate lowered to {bucket}")
+
+        elif status_code < 400:
+            bucket.recover()
+
+
+def get_default_rate_limiter() -> RateLimiter | None:
+    """Rate limiter to use when none is passed explicitly.
+
+    Returns:
+        RateLimiter | None: `RateLimiter.shared()` when enabled using the
+            environment variable `MOVIEBOX_RATE_LIMIT=1` otherwise None.
+    """
+    if os.getenv(ENVIRONMENT_RATE_LIMIT_KEY, "0").lower() in ("1", "true"):
+        return RateLimiter.shared()
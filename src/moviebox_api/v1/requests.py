@@ -2,26 +2,102 @@
 Provide ways to interact with Moviebox using `httpx`
 """
 
+import asyncio
 import json
+import time
+import typing as t
+from dataclasses import asdict
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
 
 import httpx
 from httpx import Response
 from httpx._config import DEFAULT_TIMEOUT_CONFIG
 from httpx._types import CookieTypes, HeaderTypes, ProxyTypes, TimeoutTypes
 
-from moviebox_api.v1.constants import DOWNLOAD_REQUEST_HEADERS
+from moviebox_api.v1.cache import ResponseCache
+from moviebox_api.v1.coalescer import RequestCoalescer
+from moviebox_api.v1.constants import (
+    AUTH_FAILURE_STATUS_CODES,
+    DEFAULT_CONNECTION_LIMITS,
+    DOWNLOAD_REQUEST_HEADERS,
+)
 from moviebox_api.v1.exceptions import EmptyResponseError, MissingAuthError
 from moviebox_api.v1.helpers import (
+    ApiItemsParser,
+    assert_api_content_type,
     get_absolute_url,
+    get_media_type,
     process_api_response,
+    resolve_http2,
 )
 from moviebox_api.v1.models import MovieboxAppInfo, UserInfo
+from moviebox_api.v1.rate_limit import RateLimiter, get_default_rate_limiter
+from moviebox_api.v1.retry import RetryPolicy
+from moviebox_api.v1.token_store import TokenStore, get_default_token_store
 
 request_cookies = {}
 
 __all__ = ["Session"]
 
 
+class _RejectServerCookiesPolicy(DefaultCookiePolicy):
+    """Cookie policy that never stores cookies assigned by the server"""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+def _make_cookieless_jar(cookies: CookieTypes | None) -> CookieJar:
+    """Creates cookie jar that only holds the user-declared cookies
+
+    Args:
+        cookies (CookieTypes | None): User-declared cookies.
+
+    Returns:
+        CookieJar: Jar that ignores the `Set-Cookie` of responses
+    """
+    # httpx only keeps the jar (and its policy) when passed a `CookieJar`
+    jar = CookieJar(policy=_RejectServerCookiesPolicy())
+    if cookies:
+        httpx.Cookies(jar).update(cookies)
+    return jar
+
+
+def _dump_cookie(cookie: Cookie) -> dict[str, t.Any]:
+    """JSON-serializable cookie - scoped to its domain & path"""
+    return {
+        "name": cookie.name,
+        "value": cookie.value,
+        "domain": cookie.domain,
+        "path": cookie.path,
+        "expires": cookie.expires,
+        "secure": cookie.secure,
+    }
+
+
+def _load_cookie(details: dict[str, t.Any]) -> Cookie:
+    """Cookie dumped using `_dump_cookie`"""
+    domain = details["domain"]
+    return Cookie(
+        version=0,
+        name=details["name"],
+        value=details["value"],
+        port=None,
+        port_specified=False,
+        domain=domain,
+        domain_specified=bool(domain),
+        domain_initial_dot=domain.startswith("."),
+        path=details["path"],
+        path_specified=True,
+        secure=details["secure"],
+        expires=details["expires"],
+        discard=details["expires"] is None,
+        comment=None,
+        comment_url=None,
+        rest={},
+    )
+
+
 class Session:
     """Performs actual get & post http requests asynchronously
     with or without cookies on demand
@@ -37,12 +113,22 @@ class Session:
     """Search suggestion responses are attached with auth bearer value as both 
     cookie and custom headers"""
 
+    _token_store_key = "v1"
+    """Identifier of the auth details in the token store"""
+
     def __init__(
         self,
         headers: HeaderTypes | None = DOWNLOAD_REQUEST_HEADERS,
         cookies: CookieTypes | None = request_cookies,
         timeout: TimeoutTypes = DEFAULT_TIMEOUT_CONFIG,
         proxy: ProxyTypes | None = None,
+        limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS,
+        token_store: TokenStore | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http2: bool | None = None,
         **httpx_kwargs,
     ):
         """Constructor for `Session`
@@ -52,6 +138,13 @@ class Session:
             cookies (CookieTypes | None , optional): Http request cookies. Defaults to request_cookies.
             timeout (TimeoutTypes, optional): Http request timeout in seconds. Defaults to DEFAULT_TIMEOUT_CONFIG.
             proxy (ProxyTypes | None, optional): Http requests proxy. Defaults to None.
+            limits (httpx.Limits, optional): Connection pool limits of each client. Defaults to DEFAULT_CONNECTION_LIMITS.
+            token_store (TokenStore | None, optional): Persists auth details across processes. Defaults to `get_default_token_store()`.
+            cache (ResponseCache | None, optional): Caches the parsed api responses. Defaults to None.
+            coalesce (bool, optional): Collapse concurrent identical api requests into one. Defaults to True.
+            retry_policy (RetryPolicy | None, optional): Retries transient failures - `RetryPolicy(max_attempts=1)` disables retrying. Defaults to `RetryPolicy()`.
+            rate_limiter (RateLimiter | None, optional): Paces requests per host. Defaults to `get_default_rate_limiter()`.
+            http2 (bool | None, optional): Multiplex requests over HTTP/2 where the host negotiates it. Defaults to None (env `MOVIEBOX_HTTP2`).
 
         httpx_kwargs : Other keyword arguments for `httpx.AsyncClient`
         """  # noqa: E501
@@ -59,19 +152,48 @@ class Session:
         self._cookies = cookies
         self._timeout = timeout
         self._proxy = proxy
+        self._limits = limits
+        self._http2 = resolve_http2(http2)
+        self._token_store = token_store or get_default_token_store()
+        self._cache = cache
+        self.coalescer: RequestCoalescer | None = (
+            RequestCoalescer() if coalesce else None
+        )
+        """Shares in-flight api requests - see `coalescer.stats`"""
+        self.retry_policy = (
+            RetryPolicy() if retry_policy is None else retry_policy
+        )
+        """Retries transient failures - see `retry_policy.stats`"""
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        """Paces requests per host and endpoint class"""
 
         self._client = httpx.AsyncClient(
             headers=headers,
             cookies=cookies,
             timeout=timeout,
             proxy=proxy,
+            limits=limits,
+            http2=self._http2,
             **httpx_kwargs,
         )
 
+        self._cookieless_client = httpx.AsyncClient(
+            headers=headers,
+            cookies=_make_cookieless_jar(cookies),
+            timeout=timeout,
+            proxy=proxy,
+            limits=limits,
+            http2=self._http2,
+            **httpx_kwargs,
+        )
+        """Pooled client whose cookies jar is never updated by the server"""
+
         self.moviebox_app_info: MovieboxAppInfo | None = None
         self.user_info: UserInfo | None = None
         self.__moviebox_app_info_fetched: bool = False
         """Used to track cookies assignment status"""
+        self.__bootstrap_lock = asyncio.Lock()
+        """Ensures concurrent first requests run the bootstrap only once"""
 
     def _validate_response(self, response: Response) -> Response:
         """Ensures response is not empty"""
@@ -81,40 +203,124 @@ class Session:
             )
         return response
 
+    async def _raise_for_status(self, response: Response) -> None:
+        """Like `response.raise_for_status()` but forgets the auth details
+        when the server rejects them so that they get renewed"""
+        if response.status_code in AUTH_FAILURE_STATUS_CODES:
+            self.__moviebox_app_info_fetched = False
+
+            if self._token_store is not None:
+                await self._token_store.ainvalidate(self._token_store_key)
+
+        response.raise_for_status()
+
     def __repr__(self):
         return rf"<Session(MovieBoxAPI) timeout={self._timeout}>"
 
+    async def __aenter__(self) -> "Session":
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether both http clients have been closed"""
+        return self._client.is_closed and self._cookieless_client.is_closed
+
+    async def aclose(self) -> None:
+        """Closes both http clients and release their pooled connections"""
+        await self._client.aclose()
+        await self._cookieless_client.aclose()
+
+    async def _send(
+        self, send: t.Callable[..., t.Awaitable[Response]], url: str, **kwargs
+    ) -> Response:
+        """Makes the request using `send` at the pace set by the rate limiter"""
+        if self.rate_limiter is None:
+            return await send(url, **kwargs)
+
+        await self.rate_limiter.acquire(url)
+        response = await send(url, **kwargs)
+        self.rate_limiter.update(url, response.status_code)
+        return response
+
     async def get(self, url: str, params: dict = {}, **kwargs) -> Response:
         """Makes a http get request without server cookies from previous requests.
         It's relevant because some requests with expired cookies won't go through
         but having it none does go through.
 
+        - Uses a pooled keep-alive client whose cookies are never updated
+        by the server.
+
         Args:
             url (str): Resource link.
             params (dict, optional): Request params. Defaults to {}.
 
+        kwargs : Other keyword arguments for `httpx.AsyncClient.get`
+
         Returns:
             Response: Httpx response object
         """
-        client = httpx.AsyncClient(
-            headers=self._headers,
-            cookies=self._cookies,
-            proxy=self._proxy,
-            timeout=self._timeout,
-            **kwargs,
+        response = await self.retry_policy.asend(
+            "GET",
+            url,
+            lambda: self._send(
+                self._cookieless_client.get, url, params=params, **kwargs
+            ),
         )
-        response = await client.get(url, params=params)
         response.raise_for_status()
         return self._validate_response(response)
 
-    async def get_from_api(self, *args, **kwargs) -> dict:
+    async def _fetch_from_api(
+        self,
+        method: str,
+        send: t.Callable[..., t.Awaitable[Response]],
+        url: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        scope: str | None = None,
+        **kwargs,
+    ) -> dict:
+        """Sends the request using `send` and extract the `data` field from the
+        response - through the request coalescer and response cache when set
+
+        - `scope` keeps responses of the cookied client apart from those of
+        the cookieless one since they may be personalised.
+        """
+
+        if params is not None:
+            kwargs["params"] = params
+
+        if json is not None:
+            kwargs["json"] = json
+
+        async def fetch() -> dict:
+            response = await send(url, **kwargs)
+            return process_api_response(response)
+
+        async def fetch_cached() -> dict:
+            if self._cache is None:
+                return await fetch()
+
+            return await self._cache.aget_or_fetch(
+                method, url, fetch, params=params, body=json, scope=scope
+            )
+
+        if self.coalescer is None:
+            return await fetch_cached()
+
+        return await self.coalescer.aget_or_fetch(
+            method, url, fetch_cached, params=params, body=json, scope=scope
+        )
+
+    async def get_from_api(self, url: str, params: dict = {}, **kwargs) -> dict:
         """Fetch data from api and extract the `data` field from the response
 
         Returns:
             dict: Extracted data field value
         """
-        response = await self.get(*args, **kwargs)
-        return process_api_response(response)
+        return await self._fetch_from_api("GET", self.get, url, params, **kwargs)
 
     async def get_with_cookies(
         self, url: str, params: dict = {}, **kwargs
@@ -131,20 +337,141 @@ class Session:
         """
         await self.ensure_cookies_are_assigned()
 
-        response = await self._client.get(url, params=params, **kwargs)
-        response.raise_for_status()
+        response = await self.retry_policy.asend(
+            "GET",
+            url,
+            lambda: self._send(self._client.get, url, params=params, **kwargs),
+        )
+        await self._raise_for_status(response)
 
         return self._validate_response(response)
 
-    async def get_with_cookies_from_api(self, *args, **kwargs) -> dict:
+    async def _get_streamed(
+        self, client: httpx.AsyncClient, url: str, params: dict, **kwargs
+    ) -> Response:
+        """Makes a http get request whose body is yet to be received - through
+        the retry policy and rate limiter"""
+
+        async def send(url: str, **kwargs) -> Response:
+            request = client.build_request("GET", url, **kwargs)
+            response = await client.send(request, stream=True)
+
+            if response.is_error:
+                # Small body & frees the connection for retries
+                await response.aread()
+
+            return response
+
+        return await self.retry_policy.asend(
+            "GET",
+            url,
+            lambda: self._send(send, url, params=params, **kwargs),
+        )
+
+    async def get_with_cookies_until(
+        self,
+        url: str,
+        until: t.Callable[[bytearray], bool],
+        params: dict = {},
+        **kwargs,
+    ) -> bytes:
+        """Makes a streamed http get request with server-assigned cookies from
+        previous requests and stops receiving the body once `until` is met.
+
+        Args:
+            url (str): Resource link.
+            until (t.Callable[[bytearray], bool]): Called with the body received so far after each chunk - returns True to stop.
+            params (dict, optional): Request params. Defaults to {}.
+
+        Returns:
+            bytes: Body received up to when `until` was met
+        """  # noqa: E501
+        await self.ensure_cookies_are_assigned()
+        response = await self._get_streamed(self._client, url, params, **kwargs)
+
+        body = bytearray()
+        try:
+            await self._raise_for_status(response)
+
+            async for chunk in response.aiter_bytes():
+                body += chunk
+
+                if until(body):
+                    break
+        finally:
+            await response.aclose()
+
+        if not body:
+            raise EmptyResponseError(
+                response, "Server returned an empty body response."
+            )
+
+        return bytes(body)
+
+    async def get_with_cookies_from_api(
+        self, url: str, params: dict = {}, **kwargs
+    ) -> dict:
         """Makes a http get request with server-assigned cookies from previous
         requests and extract the `data` field from the response.
 
         Returns:
             dict: Extracted data field value
         """
-        response = await self.get_with_cookies(*args, **kwargs)
-        return process_api_response(response)
+        return await self._fetch_from_api(
+            "GET", self.get_with_cookies, url, params, scope="cookies", **kwargs
+        )
+
+    async def aiter_items_from_api(
+        self,
+        url: str,
+        params: dict = {},
+        with_cookies: bool = False,
+        path: tuple[str, ...] = ("data", "items"),
+        **kwargs,
+    ) -> t.AsyncGenerator[t.Any, None]:
+        """Makes a streamed http get request and yields elements of the
+        `data.items` field of the response as they are parsed - the whole
+        response is never decoded at once.
+
+        - Goes past the request coalescer and response cache.
+
+        Args:
+            url (str): Resource link.
+            params (dict, optional): Request params. Defaults to {}.
+            with_cookies (bool, optional): Send server-assigned cookies from previous requests. Defaults to False.
+            path (tuple[str, ...], optional): Keys leading to the array whose elements are yielded. Defaults to ("data", "items").
+
+        Yields:
+            t.Any: Elements of the array
+        """  # noqa: E501
+        if with_cookies:
+            await self.ensure_cookies_are_assigned()
+            client = self._client
+        else:
+            client = self._cookieless_client
+
+        response = await self._get_streamed(client, url, params, **kwargs)
+
+        try:
+            if with_cookies:
+                await self._raise_for_status(response)
+            else:
+                response.raise_for_status()
+
+            if get_media_type(response) != "application/json":
+                await response.aread()
+                assert_api_content_type(response)
+
+            parser = ApiItemsParser(response, path)
+
+            async for chunk in response.aiter_bytes():
+                for item in parser.feed(chunk):
+                    yield item
+
+            parser.close()
+
+        finally:
+            await response.aclose()
 
     async def post(self, url: str, json: dict, **kwargs) -> Response:
         """Makes a http post request with both self assigned and server-
@@ -159,37 +486,124 @@ class Session:
         """
         await self.ensure_cookies_are_assigned()
 
-        response = await self._client.post(url, json=json, **kwargs)
-        response.raise_for_status()
+        response = await self.retry_policy.asend(
+            "POST",
+            url,
+            lambda: self._send(self._client.post, url, json=json, **kwargs),
+        )
+        await self._raise_for_status(response)
 
         return self._validate_response(response)
 
-    async def post_to_api(self, *args, **kwargs) -> dict:
+    async def post_to_api(self, url: str, json: dict, **kwargs) -> dict:
         """Sends data to api and extract the `data` field from the response
 
         Returns:
             dict: Extracted data field value
         """
-        response = await self.post(*args, **kwargs)
-        return process_api_response(response)
+        return await self._fetch_from_api(
+            "POST", self.post, url, json=json, scope="cookies", **kwargs
+        )
 
     async def ensure_cookies_are_assigned(self) -> bool:
         """Checks if the essential cookies are available if not update it.
 
+        - Concurrent callers share a single bootstrap, the rest wait for it
+        to complete.
+
         Returns:
             bool: `account` cookie availability status.
         """
         if not self.__moviebox_app_info_fetched:
-            # First run probably
-            await self._fetch_user_info()
-            await self._fetch_app_info()
-            self.__moviebox_app_info_fetched = True
+            async with self.__bootstrap_lock:
+                if not self.__moviebox_app_info_fetched:
+                    # First run probably
+                    await self._bootstrap()
+                    self.__moviebox_app_info_fetched = True
 
         return (
             self._client.cookies.get("account") is not None
             and self._client.cookies.get("token") is not None
         )
 
+    async def _bootstrap(self) -> None:
+        """Loads auth details from the token store or fetch new ones"""
+        if self._token_store is None:
+            await self._fetch_auth_details()
+            return
+
+        async def fetch_and_dump_auth_details() -> dict:
+            await self._fetch_auth_details()
+            return self._dump_auth_details()
+
+        auth_details = await self._token_store.aget_or_create(
+            self._token_store_key, fetch_and_dump_auth_details
+        )
+        self._load_auth_details(auth_details)
+
+    def _dump_auth_details(self) -> dict:
+        """JSON-serializable auth details for persisting in token store"""
+        return {
+            "user_info": asdict(self.user_info) if self.user_info else None,
+            "moviebox_app_info": (
+                asdict(self.moviebox_app_info) if self.moviebox_app_info else None
+            ),
+            "cookies": [
+                _dump_cookie(cookie) for cookie in self._client.cookies.jar
+            ],
+        }
+
+    def _load_auth_details(self, auth_details: dict) -> None:
+        """Restore auth details dumped using `self._dump_auth_details`"""
+        if auth_details["user_info"]:
+            self.user_info = UserInfo(**auth_details["user_info"])
+            self._client.headers.update(
+                {"Authorization": f"Bearer {self.user_info.token}"}
+            )
+
+        if auth_details["moviebox_app_info"]:
+            self.moviebox_app_info = MovieboxAppInfo(
+                **auth_details["moviebox_app_info"]
+            )
+
+        cookies = auth_details["cookies"]
+
+        if isinstance(cookies, dict):
+            # Persisted before cookies kept their domain & path
+            cookies = [
+                {
+                    "name": name,
+                    "value": value,
+                    "domain": "",
+                    "path": "/",
+                    "expires": None,
+                    "secure": False,
+                }
+                for name, value in cookies.items()
+            ]
+
+        jar = self._client.cookies.jar
+        now = time.time()
+
+        for details in cookies:
+            if details["expires"] is not None and details["expires"] <= now:
+                continue
+
+            if self._client.cookies.get(details["name"]) is None:
+                jar.set_cookie(_load_cookie(details))
+
+    async def _fetch_auth_details(self) -> None:
+        """Fetches user info and app info concurrently since they are
+        independent of each other"""
+        results = await asyncio.gather(
+            self._fetch_user_info(),
+            self._fetch_app_info(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
     async def _fetch_app_info(self) -> MovieboxAppInfo:
         """Fetches the moviebox app info but the main goal is to get the essential
           cookies required for requests such as download to go through.
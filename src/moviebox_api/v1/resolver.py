@@ -0,0 +1,231 @@
+"""
+Resolves many titles - optionally with their release years - to search
+results items concurrently over a single session.
+
+```python
+from moviebox_api.v1 import Search, Session
+
+async with Session() as session:
+    results = await Search.batch(
+        session, ["Merlin", ("Titanic", 1997)], concurrency=8
+    )
+
+for result in results:
+    print(result.title, result.item.title if result.ok else result.error)
+
+print(results.stats)
+```
+"""
+
+import asyncio
+import time
+import typing as t
+from contextlib import aclosing
+from dataclasses import dataclass, field
+
+from moviebox_api.v1.constants import (
+    DEFAULT_BATCH_SEARCH_CONCURRENCY,
+    DEFAULT_BATCH_SEARCH_MAX_PAGES,
+)
+from moviebox_api.v1.exceptions import ZeroSearchResultsError
+from moviebox_api.v1.logger import logger
+
+__all__ = [
+    "TitleQuery",
+    "ProgressCallback",
+    "ResolvedTitle",
+    "BatchSearchStats",
+    "BatchSearchResults",
+    "resolve_titles",
+]
+
+TitleQuery = str | tuple[str, int | None]
+"""Title or (title, release year)"""
+
+
+@dataclass
+class ResolvedTitle:
+    """Outcome of resolving a single title"""
+
+    title: str
+    year: int | None = None
+    item: t.Any | None = None
+    """Matching search results item"""
+    error: Exception | None = None
+    """Reason the title could not be resolved"""
+    pages: int = 0
+    """Search results pages fetched"""
+    elapsed: float = 0.0
+    """Seconds taken"""
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchSearchStats:
+    """Progress & throughput of a batch search"""
+
+    total: int = 0
+    resolved: int = 0
+    failed: int = 0
+    pages: int = 0
+    """Search results pages fetched"""
+    elapsed: float = 0.0
+    """Seconds taken so far"""
+
+    @property
+    def completed(self) -> int:
+        return self.resolved + self.failed
+
+    @property
+    def titles_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class BatchSearchResults:
+    """Resolved titles in the order of the queries"""
+
+    results: list[ResolvedTitle] = field(default_factory=list)
+    stats: BatchSearchStats = field(default_factory=BatchSearchStats)
+
+    def __iter__(self) -> t.Iterator[ResolvedTitle]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> ResolvedTitle:
+        return self.results[index]
+
+
+ProgressCallback = t.Callable[[ResolvedTitle, BatchSearchStats], None]
+"""Called with each resolved title and the stats so far"""
+
+
+def get_release_year(item: t.Any) -> int | None:
+    """Release year of a v1/v2 or v3 search results item"""
+    release_date = getattr(
+        item, "releaseDate", getattr(item, "release_date", None)
+    )
+    return None if release_date is None else release_date.year
+
+
+def parse_title_query(query: TitleQuery) -> tuple[str, int | None]:
+    if isinstance(query, str):
+        return query, None
+
+    title, year = query
+    return title, year
+
+
+async def resolve_title(
+    make_search: t.Callable[[str], t.Any],
+    title: str,
+    year: int | None = None,
+    max_pages: int = DEFAULT_BATCH_SEARCH_MAX_PAGES,
+) -> ResolvedTitle:
+    """Finds the first search results item of a title released in `year`
+
+    - Pages forward only when the item is not in the pages fetched so far.
+
+    Args:
+        make_search (t.Callable[[str], t.Any]): Creates the search e.g `Search` of the title.
+        title (str): Partial or complete title.
+        year (int | None, optional): Release year filter. Defaults to None.
+        max_pages (int, optional): Pages to look through. Defaults to DEFAULT_BATCH_SEARCH_MAX_PAGES.
+
+    Returns:
+        ResolvedTitle: Outcome - never raises
+    """  # noqa: E501
+    result = ResolvedTitle(title=title, year=year)
+    start = time.perf_counter()
+
+    try:
+        pages = make_search(title).get_content_model_all()
+
+        async with aclosing(pages):
+            async for content in pages:
+                result.pages += 1
+                result.item = next(
+                    (
+                        item
+                        for item in content.items
+                        if year is None or get_release_year(item) == year
+                    ),
+                    None,
+                )
+
+                if result.item is not None or result.pages >= max_pages:
+                    break
+
+        if result.item is None:
+            raise ZeroSearchResultsError(
+                f"No item in {result.pages} page(s) of the search results of "
+                f"{title!r}"
+                + ("" if year is None else f" matched the year filter - {year}")
+            )
+
+    except Exception as e:
+        logger.debug(f"Unable to resolve title {title!r} - {e!r}")
+        result.error = e
+
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+async def resolve_titles(
+    make_search: t.Callable[[str], t.Any],
+    queries: t.Iterable[TitleQuery],
+    concurrency: int = DEFAULT_BATCH_SEARCH_CONCURRENCY,
+    max_pages: int = DEFAULT_BATCH_SEARCH_MAX_PAGES,
+    progress: ProgressCallback | None = None,
+) -> BatchSearchResults:
+    """Resolves many titles to search results items concurrently
+
+    Args:
+        make_search (t.Callable[[str], t.Any]): Creates the search e.g `Search` of a title - all sharing a session.
+        queries (t.Iterable[TitleQuery]): Titles or (title, release year) pairs.
+        concurrency (int, optional): Titles searched at once. Defaults to DEFAULT_BATCH_SEARCH_CONCURRENCY.
+        max_pages (int, optional): Pages to look through per title. Defaults to DEFAULT_BATCH_SEARCH_MAX_PAGES.
+        progress (ProgressCallback | None, optional): Called as each title completes. Defaults to None.
+
+    Returns:
+        BatchSearchResults: Resolved titles in the order of `queries` - failures carry their error
+    """  # noqa: E501
+    assert concurrency >= 1, f"concurrency must be at least 1 not {concurrency}"
+
+    queries = [parse_title_query(query) for query in queries]
+    stats = BatchSearchStats(total=len(queries))
+    semaphore = asyncio.Semaphore(concurrency)
+    start = time.perf_counter()
+
+    async def resolve(title: str, year: int | None) -> ResolvedTitle:
+        async with semaphore:
+            result = await resolve_title(make_search, title, year, max_pages)
+
+        stats.pages += result.pages
+        stats.elapsed = time.perf_counter() - start
+
+        if result.ok:
+            stats.resolved += 1
+        else:
+            stats.failed += 1
+
+        if progress is not None:
+            progress(result, stats)
+
+        return result
+
+    results = await asyncio.gather(
+        *(resolve(title, year) for title, year in queries)
+    )
+    stats.elapsed = time.perf_counter() - start
+
+    return BatchSearchResults(results=list(results), stats=stats)
@@ -0,0 +1,183 @@
+"""
+Retrying of transient request failures with full-jitter exponential backoff
+that honours the `Retry-After` response header.
+
+Shared by `Session` (v1 & v2) and `MovieBoxHttpClient` (v3).
+"""
+
+import asyncio
+import random
+import re
+import time
+import typing as t
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import httpx
+
+from moviebox_api.v1.constants import (
+    DEFAULT_RETRY_BACKOFF_BASE,
+    DEFAULT_RETRY_BACKOFF_MAX,
+    DEFAULT_RETRY_MAX_ATTEMPTS,
+    IDEMPOTENT_POST_PATHS,
+    RETRY_STATUS_CODES,
+)
+from moviebox_api.v1.logger import logger
+
+__all__ = ["RetryPolicy", "RetryStats"]
+
+
+@dataclass
+class RetryStats:
+    """Retry counters"""
+
+    retries: int = 0
+    """Requests re-sent after a transient failure"""
+    recovered: int = 0
+    """Requests that succeeded after at least one retry"""
+    exhausted: int = 0
+    """Requests that still failed after the last attempt"""
+
+
+@dataclass
+class RetryPolicy:
+    """Decides whether and when a failed request is retried
+
+    - Only idempotent methods and POST endpoints matching `idempotent_post_paths`
+    are retried.
+    - The delay is drawn uniformly from 0 to the exponential backoff
+    (full-jitter) unless the server sets `Retry-After`.
+    - `max_attempts=1` disables retrying.
+    """
+
+    max_attempts: int = DEFAULT_RETRY_MAX_ATTEMPTS
+    backoff_base: float = DEFAULT_RETRY_BACKOFF_BASE
+    backoff_max: float = DEFAULT_RETRY_BACKOFF_MAX
+    retry_status_codes: frozenset[int] = RETRY_STATUS_CODES
+    idempotent_methods: frozenset[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    idempotent_post_paths: tuple[str, ...] = IDEMPOTENT_POST_PATHS
+    respect_retry_after: bool = True
+    stats: RetryStats = field(default_factory=RetryStats)
+
+    def __post_init__(self):
+        assert self.max_attempts >= 1, (
+            f"max_attempts must be at least 1 not {self.max_attempts}"
+        )
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        """Whether the request can be safely sent more than once"""
+        method = method.upper()
+
+        if method in self.idempotent_methods:
+            return True
+
+        if method == "POST":
+            path = urlsplit(url).path
+            return any(
+                re.search(pattern, path) for pattern in self.idempotent_post_paths
+            )
+
+        return False
+
+    def get_retry_after(self, response: httpx.Response) -> float | None:
+        """Seconds to wait as set by `Retry-After` header if any"""
+        retry_after = response.headers.get("retry-after")
+
+        if not retry_after:
+            return None
+
+        try:
+            seconds = float(retry_after)
+
+        except ValueError:
+            try:
+                seconds = (
+                    parsedate_to_datetime(retry_after).timestamp() - time.time()
+                )
+            except (TypeError, ValueError):
+                return None
+
+        return min(max(seconds, 0.0), self.backoff_max)
+
+    def get_delay(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float:
+        """Seconds to wait before the next attempt
+
+        Args:
+            attempt (int): Number of attempts made so far.
+            response (httpx.Response | None, optional): Last failed response.
+
+        Returns:
+            float: Delay in seconds
+        """
+        if response is not None and self.respect_retry_after:
+            retry_after = self.get_retry_after(response)
+
+            if retry_after is not None:
+                return retry_after
+
+        backoff = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, backoff)
+
+    async def asend(
+        self,
+        method: str,
+        url: str,
+        send: t.Callable[[], t.Awaitable[httpx.Response]],
+        retry_exceptions: tuple[type[Exception], ...] = (httpx.TransportError,),
+    ) -> httpx.Response:
+        """Sends the request using `send`, retrying transient failures
+
+        Args:
+            method (str): Http method.
+            url (str): Request url - used to tell idempotency.
+            send (t.Callable[[], t.Awaitable[httpx.Response]]): Makes the request.
+            retry_exceptions (tuple[type[Exception], ...], optional): Errors worth retrying. Defaults to (httpx.TransportError,).
+
+        Returns:
+            httpx.Response: Last response received
+        """  # noqa: E501
+        max_attempts = self.max_attempts if self.is_idempotent(method, url) else 1
+        attempt = 0
+
+        while True:
+            attempt += 1
+            response = None
+
+            try:
+                response = await send()
+
+            except retry_exceptions as e:
+                if attempt >= max_attempts:
+                    self._give_up(attempt)
+                    raise
+
+                reason = e.__class__.__name__
+
+            else:
+                if response.status_code not in self.retry_status_codes:
+                    if attempt > 1:
+                        self.stats.recovered += 1
+                    return response
+
+                if attempt >= max_attempts:
+                    self._give_up(attempt)
+                    return response
+
+                reason = f"status {response.status_code}"
+
+            delay = self.get_delay(attempt, response)
+            self.stats.retries += 1
+            logger.info(
+                f"Retrying {method.upper()} {url} in {delay:.2f}s "
+                f"({reason}) - attempt {attempt + 1}/{max_attempts}"
+            )
+            await asyncio.sleep(delay)
+
+    def _give_up(self, attempts: int) -> None:
+        if attempts > 1:
+            self.stats.exhausted += 1
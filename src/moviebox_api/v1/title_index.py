@@ -0,0 +1,370 @@
+"""
+In-memory inverted index of the titles seen in search results, trending,
+homepage and category listings - answers autocomplete lookups locally
+without a round-trip per keystroke.
+
+```python
+from moviebox_api.v1 import Search, SearchSuggestion, Session, Trending
+from moviebox_api.v1.title_index import TitleIndex
+
+index = TitleIndex.load()
+
+async with Session() as session:
+    index.add_from(await Trending(session).get_content_model())
+    await Search(session, "avatar", title_index=index).get_content_model()
+
+    suggestion = SearchSuggestion(session, title_index=index)
+    print(await suggestion.get_content_model("avat"))
+
+index.save()
+```
+"""
+
+import asyncio
+import json
+import os
+import re
+import typing as t
+import unicodedata
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from difflib import SequenceMatcher
+from math import log1p
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from moviebox_api.v1.constants import (
+    DEFAULT_TITLE_INDEX_PATH,
+    TITLE_INDEX_FUZZY_CUTOFF,
+    TITLE_INDEX_MAX_PREFIX_SIZE,
+)
+from moviebox_api.v1.helpers import file_lock, sanitize_item_name
+from moviebox_api.v1.logger import logger
+
+__all__ = ["TitleEntry", "TitleIndex", "normalize_title", "refresh_in_background"]
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+NGRAM_SIZE = 3
+
+
+def normalize_title(title: str) -> list[str]:
+    """Tokens of a title - season suffixes, accents & case dropped
+
+    For example:
+        "Pokémon: The Series S2" returns ['pokemon', 'the', 'series']
+    """
+    title = unicodedata.normalize("NFKD", sanitize_item_name(title))
+    title = "".join(char for char in title if not unicodedata.combining(char))
+    return TOKEN_PATTERN.findall(title.casefold())
+
+
+def get_release_year(release_date: t.Any) -> int | None:
+    """Year of a modelled (date) or raw (`YYYY-MM-DD`) release date"""
+    if isinstance(release_date, str):
+        return int(release_date[:4]) if release_date[:4].isdigit() else None
+
+    return getattr(release_date, "year", None)
+
+
+def get_ngrams(token: str) -> set[str]:
+    """Character n-grams of a token padded at the edges"""
+    padded = f" {token} "
+    return {
+        padded[start : start + NGRAM_SIZE]
+        for start in range(max(len(padded) - NGRAM_SIZE + 1, 1))
+    }
+
+
+@dataclass
+class TitleEntry:
+    """Indexed title"""
+
+    key: str
+    """`subjectId` or the normalized title of suggested words"""
+    title: str
+    subject_type: int | None = None
+    year: int | None = None
+    detail_path: str | None = None
+    popularity: float = 0.0
+    """Rating, rating count & number of times seen - higher ranks first"""
+    seen: int = 1
+
+
+class TitleIndex:
+    """Inverted index of normalized title tokens with prefix & fuzzy lookup
+
+    - Every prefix (up to `TITLE_INDEX_MAX_PREFIX_SIZE` characters) of a
+    token maps to the titles containing it.
+    - Character n-grams of the tokens back the fuzzy lookup of misspelt ones.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_TITLE_INDEX_PATH):
+        """Constructor for `TitleIndex`
+
+        Args:
+            path (Path | str, optional): File the index is saved to. Defaults to DEFAULT_TITLE_INDEX_PATH.
+        """  # noqa: E501
+        self.path = Path(path)
+        self.entries: dict[str, TitleEntry] = {}
+        self._prefixes: defaultdict[str, set[str]] = defaultdict(set)
+        """Token prefix mapped to keys of the entries"""
+        self._tokens: defaultdict[str, set[str]] = defaultdict(set)
+        """Complete token mapped to keys of the entries"""
+        self._ngrams: defaultdict[str, set[str]] = defaultdict(set)
+        """Character n-gram mapped to tokens containing it"""
+
+    def __repr__(self):
+        return rf"<TitleIndex entries={len(self.entries)} path='{self.path}'>"
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def _index(self, entry: TitleEntry) -> None:
+        for token in normalize_title(entry.title):
+            self._tokens[token].add(entry.key)
+
+            for ngram in get_ngrams(token):
+                self._ngrams[ngram].add(token)
+
+            for size in range(
+                1, min(len(token), TITLE_INDEX_MAX_PREFIX_SIZE) + 1
+            ):
+                self._prefixes[token[:size]].add(entry.key)
+
+    def add(self, item: BaseModel | dict) -> TitleEntry | None:
+        """Indexes a v1/v2/v3 subject or a suggested word
+
+        Args:
+            item (BaseModel | dict): Search results item, content subject or suggested item
+
+        Returns:
+            TitleEntry | None: Entry of the item. None if it lacks a title.
+        """  # noqa: E501
+        if isinstance(item, BaseModel):
+            item = item.model_dump(by_alias=True)
+
+        title = item.get("title") or item.get("word")
+
+        if not title or not normalize_title(title):
+            return None
+
+        key = item.get("subjectId") or " ".join(normalize_title(title))
+        subject_type = item.get("subjectType", item.get("type"))
+        popularity = float(item.get("imdbRatingValue") or 0) + log1p(
+            int(item.get("imdbRatingCount") or 0)
+        )
+
+        entry = self.entries.get(key)
+
+        if entry is None:
+            entry = TitleEntry(
+                key=key,
+                title=sanitize_item_name(title),
+                subject_type=None if subject_type is None else int(subject_type),
+                year=get_release_year(item.get("releaseDate")),
+                detail_path=item.get("detailPath"),
+                popularity=popularity,
+            )
+            self.entries[key] = entry
+            self._index(entry)
+
+        else:
+            entry.seen += 1
+            entry.popularity = max(entry.popularity, popularity)
+
+        return entry
+
+    def add_from(self, content: t.Any) -> int:
+        """Indexes every subject found in modelled (or raw) contents e.g
+        search results, trending, homepage or content category pages
+
+        Returns:
+            int: Number of subjects found
+        """
+        if isinstance(content, BaseModel):
+            content = content.model_dump(by_alias=True)
+
+        added = 0
+        pending = [content]
+
+        while pending:
+            value = pending.pop()
+
+            if isinstance(value, dict):
+                if "subjectId" in value and "title" in value:
+                    added += self.add(value) is not None
+
+                pending.extend(value.values())
+
+            elif isinstance(value, list):
+                pending.extend(value)
+
+        return added
+
+    def _fuzzy_tokens(self, token: str) -> set[str]:
+        """Indexed tokens similar to a (misspelt) one"""
+        candidates = set()
+        for ngram in get_ngrams(token):
+            candidates.update(self._ngrams.get(ngram, ()))
+
+        return {
+            candidate
+            for candidate in candidates
+            if SequenceMatcher(None, token, candidate).ratio()
+            >= TITLE_INDEX_FUZZY_CUTOFF
+        }
+
+    def _match(self, token: str, is_prefix: bool, fuzzy: bool) -> set[str]:
+        if not is_prefix:
+            keys = set(self._tokens.get(token, ()))
+
+        elif len(token) <= TITLE_INDEX_MAX_PREFIX_SIZE:
+            keys = set(self._prefixes.get(token, ()))
+
+        else:
+            keys = {
+                key
+                for indexed_token, token_keys in self._tokens.items()
+                if indexed_token.startswith(token)
+                for key in token_keys
+            }
+
+        if not keys and fuzzy:
+            for similar_token in self._fuzzy_tokens(token):
+                keys.update(self._tokens[similar_token])
+
+        return keys
+
+    def lookup(
+        self,
+        query: str,
+        limit: int = 10,
+        subject_type: int | None = None,
+        fuzzy: bool = True,
+    ) -> list[TitleEntry]:
+        """Titles matching all words of a query - the last one as a prefix
+
+        Args:
+            query (str): Partial title e.g what has been typed so far.
+            limit (int, optional): Maximum entries to return. Defaults to 10.
+            subject_type (int | None, optional): Subject type filter. Defaults to None.
+            fuzzy (bool, optional): Match misspelt words too. Defaults to True.
+
+        Returns:
+            list[TitleEntry]: Matching entries - most popular first
+        """  # noqa: E501
+        tokens = normalize_title(query)
+
+        if not tokens:
+            return []
+
+        keys: set[str] | None = None
+
+        for position, token in enumerate(tokens):
+            matches = self._match(token, position == len(tokens) - 1, fuzzy)
+            keys = matches if keys is None else keys & matches
+
+            if not keys:
+                return []
+
+        normalized_query = " ".join(tokens)
+        entries = [
+            self.entries[key]
+            for key in keys
+            if subject_type in (None, 0)
+            or self.entries[key].subject_type in (None, subject_type)
+        ]
+        entries.sort(
+            key=lambda entry: (
+                " ".join(normalize_title(entry.title)).startswith(
+                    normalized_query
+                ),
+                entry.popularity + entry.seen,
+            ),
+            reverse=True,
+        )
+        return entries[:limit]
+
+    def save(self, path: Path | str | None = None) -> Path:
+        """Persists the entries - the index is rebuilt when loaded
+
+        Args:
+            path (Path | str | None, optional): Destination file. Defaults to `self.path`.
+
+        Returns:
+            Path: File saved to
+        """  # noqa: E501
+        path = Path(path or self.path)
+        os.makedirs(path.parent, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+
+        with file_lock(path.with_name(path.name + ".lock")):
+            with open(temp_path, "w", encoding="utf-8") as fh:
+                json.dump([asdict(entry) for entry in self.entries.values()], fh)
+
+            os.replace(temp_path, path)
+
+        return path
+
+    @classmethod
+    def load(cls, path: Path | str = DEFAULT_TITLE_INDEX_PATH) -> "TitleIndex":
+        """Index of the entries saved in `path` - empty when missing
+
+        Args:
+            path (Path | str, optional): Saved index file. Defaults to DEFAULT_TITLE_INDEX_PATH.
+
+        Returns:
+            TitleIndex: Loaded index
+        """  # noqa: E501
+        index = cls(path)
+
+        try:
+            with open(index.path, encoding="utf-8") as fh:
+                saved_entries = json.load(fh)
+
+        except FileNotFoundError:
+            return index
+
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring corrupt title index {index.path} - {e}")
+            return index
+
+        for saved_entry in saved_entries:
+            entry = TitleEntry(**saved_entry)
+            index.entries[entry.key] = entry
+            index._index(entry)
+
+        return index
+
+
+def refresh_in_background(
+    tasks: set[asyncio.Task], coroutine: t.Coroutine
+) -> asyncio.Task:
+    """Runs a remote refresh of the index without awaiting it
+
+    - Failures are logged rather than raised since the local results have
+    already been served.
+
+    Args:
+        tasks (set[asyncio.Task]): Pending refreshes - referenced until done.
+        coroutine (t.Coroutine): Refresh e.g fetching the remote results.
+
+    Returns:
+        asyncio.Task: Scheduled refresh
+    """
+
+    async def refresh():
+        try:
+            await coroutine
+        except Exception as e:
+            logger.debug(f"Background refresh of the title index failed - {e!r}")
+
+    task = asyncio.ensure_future(refresh())
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+    return task
@@ -0,0 +1,178 @@
+"""
+Persists auth-tokens on disk so that they can be reused across invocations
+and processes instead of bootstrapping a new one every time.
+"""
+
+import asyncio
+import json
+import os
+import time
+import typing as t
+from pathlib import Path
+
+from moviebox_api.v1.constants import (
+    DEFAULT_TOKEN_STORE_PATH,
+    DEFAULT_TOKEN_TTL,
+    ENVIRONMENT_TOKEN_STORE_KEY,
+)
+from moviebox_api.v1.helpers import file_lock
+from moviebox_api.v1.logger import logger
+
+__all__ = ["TokenStore", "get_default_token_store"]
+
+
+class TokenStore:
+    """File-backed store of auth details with expiry
+
+    - Reads and writes are guarded by an inter-process file lock.
+    - `aget_or_create` holds the lock while bootstrapping so that parallel
+    processes end up sharing one token.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_TOKEN_STORE_PATH,
+        ttl: float = DEFAULT_TOKEN_TTL,
+    ):
+        """Constructor for `TokenStore`
+
+        Args:
+            path (Path | str, optional): File to persist tokens in. Defaults to DEFAULT_TOKEN_STORE_PATH.
+            ttl (float, optional): Seconds a token stays valid. Defaults to DEFAULT_TOKEN_TTL.
+        """  # noqa: E501
+        self.path = Path(path)
+        self.ttl = ttl
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def __repr__(self):
+        return rf"<TokenStore path='{self.path}' ttl={self.ttl}>"
+
+    def _read(self) -> dict[str, dict[str, t.Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as fh:
+                return json.load(fh)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, entries: dict[str, dict[str, t.Any]]) -> None:
+        os.makedirs(self.path.parent, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+
+        with open(temp_path, "w", encoding="utf-8") as fh:
+            json.dump(entries, fh)
+
+        os.replace(temp_path, self.path)
+
+    def _get(self, key: str) -> dict[str, t.Any] | None:
+        entry = self._read().get(key)
+
+        if entry is None or entry["expires_at"] <= time.time():
+            return None
+
+        return entry["value"]
+
+    def _set(self, key: str, value: dict[str, t.Any], ttl: float | None) -> None:
+        entries = self._read()
+        entries[key] = {
+            "value": value,
+            "expires_at": time.time() + (self.ttl if ttl is None else ttl),
+        }
+        self._write(entries)
+
+    def get(self, key: str) -> dict[str, t.Any] | None:
+        """Get unexpired auth details
+
+        Args:
+            key (str): Auth details identifier.
+
+        Returns:
+            dict[str, t.Any] | None: Auth details if present and unexpired.
+        """
+        with file_lock(self._lock_path):
+            return self._get(key)
+
+    def set(self, key: str, value: dict[str, t.Any], ttl: float | None = None):
+        """Persist auth details
+
+        Args:
+            key (str): Auth details identifier.
+            value (dict[str, t.Any]): JSON-serializable auth details.
+            ttl (float | None, optional): Overrides `self.ttl`. Defaults to None.
+        """
+        with file_lock(self._lock_path):
+            self._set(key, value, ttl)
+
+    def invalidate(self, key: str) -> None:
+        """Remove auth details so that they won't be reused
+
+        Args:
+            key (str): Auth details identifier.
+        """
+        with file_lock(self._lock_path):
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                logger.debug(f"Invalidating persisted auth details - {key!r}")
+                self._write(entries)
+
+    async def ainvalidate(self, key: str) -> None:
+        """Asynchronous `self.invalidate` - waits for the lock off the event
+        loop"""
+        await asyncio.to_thread(self.invalidate, key)
+
+    async def aget_or_create(
+        self,
+        key: str,
+        factory: t.Callable[[], t.Awaitable[dict[str, t.Any]]],
+    ) -> dict[str, t.Any]:
+        """Get unexpired auth details or create them using `factory` while
+        holding the lock.
+
+        Args:
+            key (str): Auth details identifier.
+            factory (t.Callable[[], t.Awaitable[dict[str, t.Any]]]): Fetches
+                new auth details.
+
+        Returns:
+            dict[str, t.Any]: Auth details
+        """
+        lock = file_lock(self._lock_path)
+        # Waiting for the lock can take a while when another process is
+        # bootstrapping so it's done off the event loop
+        acquiring = asyncio.ensure_future(asyncio.to_thread(lock.__enter__))
+
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # The thread acquires the lock regardless so release it afterwards
+            acquiring.add_done_callback(
+                lambda future: (
+                    future.exception() or lock.__exit__(None, None, None)
+                )
+            )
+            raise
+
+        try:
+            value = self._get(key)
+
+            if value is None:
+                value = await factory()
+                self._set(key, value, None)
+
+            else:
+                logger.debug(f"Reusing persisted auth details - {key!r}")
+
+            return value
+
+        finally:
+            lock.__exit__(None, None, None)
+
+
+def get_default_token_store() -> TokenStore | None:
+    """Token store to use when none is passed explicitly.
+
+    Returns:
+        TokenStore | None: `TokenStore()` when enabled using the environment
+            variable `MOVIEBOX_TOKEN_STORE=1` otherwise None.
+    """
+    if os.getenv(ENVIRONMENT_TOKEN_STORE_KEY, "0").lower() in ("1", "true"):
+        return TokenStore()
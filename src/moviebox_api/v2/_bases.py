@@ -1,6 +1,8 @@
 import typing as t
+from copy import deepcopy
 
 from moviebox_api.v1._bases import BaseContentProviderAndHelper
+from moviebox_api.v1.cache import ItemDetailsCache, get_default_item_details_cache
 from moviebox_api.v1.helpers import assert_instance, sanitize_item_name
 from moviebox_api.v2.exceptions import InvalidDetailPathError
 from moviebox_api.v2.helpers import get_absolute_url, validate_detail_path
@@ -13,15 +15,23 @@ class BaseItemDetails(BaseContentProviderAndHelper):
 
     api_endpoint = get_absolute_url("/wefeed-h5api-bff/detail")
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, details_cache: ItemDetailsCache | None = None
+    ):
         """Constructor for `BaseItemDetails`
 
         Args:
             detail_path (str): Specific item detail path
             session (Session): MovieboxAPI request session
-        """
+            details_cache (ItemDetailsCache | None, optional): Shares item details across instances. Defaults to `get_default_item_details_cache()`.
+        """  # noqa: E501
         assert_instance(session, Session, "session")
         self._session = session
+        self._details_cache = (
+            get_default_item_details_cache()
+            if details_cache is None
+            else details_cache
+        )
 
     def _validate_detail_path(self, detail_path: str) -> t.NoReturn:
         if not validate_detail_path(detail_path):
@@ -30,21 +40,51 @@ class BaseItemDetails(BaseContentProviderAndHelper):
                 "Recheck and try again"
             )
 
-    async def get_content(self, detail_path: str) -> dict:
+    def _get_cache_key(self, detail_path: str) -> str:
+        return ItemDetailsCache.make_key(detail_path, "v2")
+
+    async def _fetch_content(self, detail_path: str) -> dict:
+        """Item details - shared with the details cache when set"""
         self._validate_detail_path(detail_path)
-        content = await self._session.get_from_api(
-            self.api_endpoint, params={"detailPath": detail_path}
+
+        async def fetch() -> dict:
+            content = await self._session.get_from_api(
+                self.api_endpoint, params={"detailPath": detail_path}
+            )
+            current_name = content["subject"]["title"]
+
+            content["subject"]["title"] = sanitize_item_name(current_name)
+            return content
+
+        if self._details_cache is None:
+            return await fetch()
+
+        return await self._details_cache.aget_or_fetch(
+            self._get_cache_key(detail_path), fetch
         )
-        current_name = content["subject"]["title"]
 
-        content["subject"]["title"] = sanitize_item_name(current_name)
-        return content
+    async def get_content(self, detail_path: str) -> dict:
+        content = await self._fetch_content(detail_path)
+
+        if self._details_cache is None:
+            return content
+
+        return deepcopy(content)  # Callers may modify it
 
     async def get_content_model(
         self, detail_path: str, **kwargs
     ) -> SpecificItemDetailsModel:
 
-        content = await self.get_content(detail_path, **kwargs)
-        modelled_content = SpecificItemDetailsModel(**content)
+        content = await self._fetch_content(detail_path)
+
+        if self._details_cache is None:
+            return SpecificItemDetailsModel(**content)
+
+        cache_key = self._get_cache_key(detail_path)
+        modelled_content = self._details_cache.get_model(cache_key)
+
+        if modelled_content is None:
+            modelled_content = SpecificItemDetailsModel(**content)
+            self._details_cache.set_model(cache_key, modelled_content)
 
         return modelled_content
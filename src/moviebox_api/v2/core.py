@@ -9,7 +9,11 @@ from collections.abc import AsyncIterator
 from typing_extensions import deprecated
 
 import moviebox_api.v1.core
+from moviebox_api.v1.cache import ItemDetailsCache
+from moviebox_api.v1.constants import DEFAULT_ITEMS_BUFFER_SIZE
 from moviebox_api.v1.helpers import assert_instance
+from moviebox_api.v1.models import SearchResultsItem as SearchResultsItemV1
+from moviebox_api.v1.pagination import aiter_items, aiter_pages, at_page
 from moviebox_api.v2._bases import BaseContentProviderAndHelper, BaseItemDetails
 from moviebox_api.v2.constants import (
     SINGLE_ITEM_SUBJECT_TYPES,
@@ -22,6 +26,7 @@ from moviebox_api.v2.exceptions import (
 )
 from moviebox_api.v2.helpers import get_absolute_url, validate_genre_top_id
 from moviebox_api.v2.models import (
+    ContentCategoryModelV2,
     HomepageContentModel,
     RealContentCategoryModel,
     SearchResultsItem,
@@ -40,6 +45,17 @@ class Homepage(moviebox_api.v1.core.Homepage):
         content = await self.get_content()
         return HomepageContentModel(**content)
 
+    async def aiter_content_items(self) -> AsyncIterator[ContentCategoryModelV2]:
+        """Modelled `operatingList` sections - each yielded once parsed from
+        the streamed response instead of after decoding the whole of it.
+
+        - See `Session.aiter_items_from_api`.
+        """
+        async for item in self._session.aiter_items_from_api(
+            self._url, path=("data", "operatingList")
+        ):
+            yield ContentCategoryModelV2.model_validate(item)
+
 
 class MoviesOperatingList(Homepage):
     _url = get_absolute_url(
@@ -110,6 +126,19 @@ class ContentCategory(BaseContentProviderAndHelper):
         modelled_content = RealContentCategoryModel.model_validate(content)
         return modelled_content
 
+    async def aiter_content_items(self) -> AsyncIterator[SearchResultsItemV1]:
+        """Modelled `subjectList` items of this page - each yielded once parsed
+        from the streamed response instead of after decoding the whole of it.
+
+        - See `Session.aiter_items_from_api`.
+        """
+        async for item in self.session.aiter_items_from_api(
+            self._url,
+            params=self._create_payload(),
+            path=("data", "subjectList"),
+        ):
+            yield SearchResultsItemV1.model_validate(item)
+
     def next_page(self, content: RealContentCategoryModel) -> "ContentCategory":
         """Navigate to the search results of the next page.
 
@@ -164,23 +193,27 @@ class ContentCategory(BaseContentProviderAndHelper):
             )
 
     async def get_content_model_all(
-        self,
+        self, concurrency: int = 1
     ) -> AsyncIterator[RealContentCategoryModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model()
+        async def fetch(page: int) -> RealContentCategoryModel:
+            return await at_page(self, page).get_content_model()
 
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
             yield content_model
 
-            if content_model.pager.hasMore:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> AsyncIterator[SearchResultsItemV1]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
 
 
 class SearchSuggestion(moviebox_api.v1.core.SearchSuggestion):
@@ -394,36 +427,43 @@ class SearchWithFilter(Search):
             )
 
     async def get_content_model_all(
-        self,
+        self, concurrency: int = 1
     ) -> AsyncIterator[SearchResultsModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model()
+        async def fetch(page: int) -> SearchResultsModel:
+            return await at_page(self, page).get_content_model()
 
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
             yield content_model
 
-            if content_model.pager.hasMore:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
-
 
 class ItemDetails(BaseItemDetails):
     """Fetch specific item details - movies, anime, education,
     music & tv-series"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, details_cache: ItemDetailsCache | None = None
+    ):
         """Constructor for `SingleItemDetails`
 
         Args:
             session (Session): MovieboxAPI request session
+            details_cache (ItemDetailsCache | None, optional): Shares item
+              details across instances. Defaults to
+              `get_default_item_details_cache()`.
         """
-        super().__init__(session)
+        super().__init__(session, details_cache)
+
+    def _get_detail_path(self, path_or_item: str | SearchResultsItem) -> str:
+        assert_instance(path_or_item, (str, SearchResultsItem), "path_or_item")
+
+        detail_path = path_or_item
+
+        if isinstance(path_or_item, SearchResultsItem):
+            detail_path = path_or_item.detailPath
+
+        return detail_path
 
     async def get_content(self, path_or_item: str | SearchResultsItem) -> dict:
         """Get specific item details
@@ -436,45 +476,34 @@ class ItemDetails(BaseItemDetails):
             ValueError: InvalidDetailPathError
         """
 
-        assert_instance(path_or_item, (str, SearchResultsItem), "path_or_item")
-
-        detail_path = path_or_item
-
-        if isinstance(path_or_item, SearchResultsItem):
-            detail_path = path_or_item.detailPath
-
-        return await super().get_content(detail_path)
+        return await super().get_content(self._get_detail_path(path_or_item))
 
     async def get_content_model(
         self, path_or_item: str | SearchResultsItem, **kwargs
     ) -> SpecificItemDetailsModel:
 
-        content = await self.get_content(path_or_item, **kwargs)
-        return SpecificItemDetailsModel(**content)
+        return await super().get_content_model(
+            self._get_detail_path(path_or_item), **kwargs
+        )
 
 
 class SingleItemDetails(BaseItemDetails):
     """Fetch specific item details - movies, anime, education, music"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, details_cache: ItemDetailsCache | None = None
+    ):
         """Constructor for `SingleItemDetails`
 
         Args:
             session (Session): MovieboxAPI request session
+            details_cache (ItemDetailsCache | None, optional): Shares item
+              details across instances. Defaults to
+              `get_default_item_details_cache()`.
         """
-        super().__init__(session)
-
-    async def get_content(self, path_or_item: str | SearchResultsItem) -> dict:
-        """Get specific item details
-
-        Args:
-            path_or_item (str|SearchResultsItem): Detail path for specific item
-              page or search-results-item.
-
-        Raises:
-            ValueError: InvalidDetailPathError
-        """
+        super().__init__(session, details_cache)
 
+    def _get_detail_path(self, path_or_item: str | SearchResultsItem) -> str:
         assert_instance(path_or_item, (str, SearchResultsItem), "path_or_item")
 
         detail_path = path_or_item
@@ -489,14 +518,28 @@ class SingleItemDetails(BaseItemDetails):
 
             detail_path = path_or_item.detailPath
 
-        return await super().get_content(detail_path)
+        return detail_path
+
+    async def get_content(self, path_or_item: str | SearchResultsItem) -> dict:
+        """Get specific item details
+
+        Args:
+            path_or_item (str|SearchResultsItem): Detail path for specific item
+              page or search-results-item.
+
+        Raises:
+            ValueError: InvalidDetailPathError
+        """
+
+        return await super().get_content(self._get_detail_path(path_or_item))
 
     async def get_content_model(
         self, path_or_item: str | SearchResultsItem, **kwargs
     ) -> SpecificItemDetailsModel:
 
-        content = await self.get_content(path_or_item, **kwargs)
-        return SpecificItemDetailsModel(**content)
+        return await super().get_content_model(
+            self._get_detail_path(path_or_item), **kwargs
+        )
 
 
 MusicDetails = AnimeDetails = EducationDetails = MovieDetails = SingleItemDetails
@@ -505,25 +548,20 @@ MusicDetails = AnimeDetails = EducationDetails = MovieDetails = SingleItemDetail
 class TVSeriesDetails(BaseItemDetails):
     """Fetch specific item details - tv_series"""
 
-    def __init__(self, session: Session):
+    def __init__(
+        self, session: Session, details_cache: ItemDetailsCache | None = None
+    ):
         """Constructor for `TVSeriesItemDetails`
 
         Args:
             session (Session): MovieboxAPI request session
+            details_cache (ItemDetailsCache | None, optional): Shares item
+              details across instances. Defaults to
+              `get_default_item_details_cache()`.
         """
-        super().__init__(session)
-
-    async def get_content(self, path_or_item: str | SearchResultsItem) -> dict:
-        """Get specific item details
-
-        Args:
-            path_or_item (str|SearchResultsItem): Detail path for specific item
-              page or search-results-item.
-
-        Raises:
-            ValueError: InvalidDetailPathError
-        """
+        super().__init__(session, details_cache)
 
+    def _get_detail_path(self, path_or_item: str | SearchResultsItem) -> str:
         assert_instance(path_or_item, (str, SearchResultsItem), "path_or_item")
 
         detail_path = path_or_item
@@ -538,11 +576,25 @@ class TVSeriesDetails(BaseItemDetails):
 
             detail_path = path_or_item.detailPath
 
-        return await super().get_content(detail_path)
+        return detail_path
+
+    async def get_content(self, path_or_item: str | SearchResultsItem) -> dict:
+        """Get specific item details
+
+        Args:
+            path_or_item (str|SearchResultsItem): Detail path for specific item
+              page or search-results-item.
+
+        Raises:
+            ValueError: InvalidDetailPathError
+        """
+
+        return await super().get_content(self._get_detail_path(path_or_item))
 
     async def get_content_model(
         self, path_or_item: str | SearchResultsItem, **kwargs
     ) -> SpecificItemDetailsModel:
 
-        content = await self.get_content(path_or_item, **kwargs)
-        return SpecificItemDetailsModel(**content)
+        return await super().get_content_model(
+            self._get_detail_path(path_or_item), **kwargs
+        )
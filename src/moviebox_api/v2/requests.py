@@ -1,10 +1,16 @@
 """For server interaction"""
 
+import httpx
 from httpx._config import DEFAULT_TIMEOUT_CONFIG
 from httpx._types import CookieTypes, HeaderTypes, ProxyTypes, TimeoutTypes
 from typing_extensions import deprecated
 
 import moviebox_api.v1.requests
+from moviebox_api.v1.cache import ResponseCache
+from moviebox_api.v1.constants import DEFAULT_CONNECTION_LIMITS
+from moviebox_api.v1.rate_limit import RateLimiter
+from moviebox_api.v1.retry import RetryPolicy
+from moviebox_api.v1.token_store import TokenStore
 from moviebox_api.v2.constants import DOWNLOAD_REQUEST_HEADERS
 
 request_cookies = {}
@@ -15,12 +21,21 @@ __all__ = ["Session"]
 class Session(moviebox_api.v1.requests.Session):
     _moviebox_app_info_url = None
 
+    _token_store_key = "v2"
+
     def __init__(
         self,
         headers: HeaderTypes | None = DOWNLOAD_REQUEST_HEADERS,
         cookies: CookieTypes | None = request_cookies,
         timeout: TimeoutTypes = DEFAULT_TIMEOUT_CONFIG,
         proxy: ProxyTypes | None = None,
+        limits: httpx.Limits = DEFAULT_CONNECTION_LIMITS,
+        token_store: TokenStore | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http2: bool | None = None,
         **httpx_kwargs,
     ):
         """Constructor for `Session`
@@ -30,6 +45,13 @@ class Session(moviebox_api.v1.requests.Session):
             cookies (CookieTypes | None , optional): Http request cookies. Defaults to request_cookies.
             timeout (TimeoutTypes, optional): Http request timeout in seconds. Defaults to DEFAULT_TIMEOUT_CONFIG.
             proxy (ProxyTypes | None, optional): Http requests proxy. Defaults to None.
+            limits (httpx.Limits, optional): Connection pool limits of each client. Defaults to DEFAULT_CONNECTION_LIMITS.
+            token_store (TokenStore | None, optional): Persists auth details across processes. Defaults to `get_default_token_store()`.
+            cache (ResponseCache | None, optional): Caches the parsed api responses. Defaults to None.
+            coalesce (bool, optional): Collapse concurrent identical api requests into one. Defaults to True.
+            retry_policy (RetryPolicy | None, optional): Retries transient failures - `RetryPolicy(max_attempts=1)` disables retrying. Defaults to `RetryPolicy()`.
+            rate_limiter (RateLimiter | None, optional): Paces requests per host. Defaults to `get_default_rate_limiter()`.
+            http2 (bool | None, optional): Multiplex requests over HTTP/2 where the host negotiates it. Defaults to None (env `MOVIEBOX_HTTP2`).
 
         httpx_kwargs : Other keyword arguments for `httpx.AsyncClient`
         """  # noqa: E501
@@ -39,15 +61,24 @@ class Session(moviebox_api.v1.requests.Session):
             cookies=cookies,
             timeout=timeout,
             proxy=proxy,
+            limits=limits,
+            token_store=token_store,
+            cache=cache,
+            coalesce=coalesce,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            http2=http2,
             **httpx_kwargs,
         )
 
     async def ensure_cookies_are_assigned(self) -> bool:
-        if not self.user_info:
-            await self._fetch_user_info()
-
+        await super().ensure_cookies_are_assigned()
         return True
 
+    async def _fetch_auth_details(self) -> None:
+        """Only the user info is required in v2"""
+        await self._fetch_user_info()
+
     @deprecated("This method is only available in V1")
     async def _fetch_app_info(self) -> None:
         raise NotImplementedError("This method is only available in v1")
@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+from itertools import product
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict
@@ -123,3 +125,18 @@ class FilterParams(BaseModel):
     year: Year = "All"
     language: Language = "All"
     sort: SortBy = "ForYou"
+
+    @classmethod
+    def sweep(cls, **choices: Iterable[str]) -> list["FilterParams"]:
+        """Filter params of every combination of the choices e.g
+        `FilterParams.sweep(genre=["Action", "Drama"], year=["2024", "2025"])`
+        for crawling a catalog slice by slice.
+
+        Returns:
+            list[FilterParams]: A filter params for each combination
+        """
+        names = list(choices)
+        return [
+            cls(**dict(zip(names, values, strict=True)))
+            for values in product(*choices.values())
+        ]
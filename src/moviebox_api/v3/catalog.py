@@ -0,0 +1,775 @@
+"""
+Incremental crawl of listings into a local SQLite mirror of the catalog -
+subjects, their seasons, resolutions & captions.
+
+- Subjects are upserted by `subjectId` and only new or changed ones have
+their details fetched.
+- Each source keeps a checkpoint so an interrupted crawl resumes from the
+page it stopped at.
+- Paging a source stops early once it reaches already seen, unchanged
+subjects.
+
+```python
+from moviebox_api.v2 import Session
+from moviebox_api.v2.core import ContentCategory, SearchWithFilter, Trending
+from moviebox_api.v2.constants import SubjectType
+from moviebox_api.v2.types import FilterParams
+from moviebox_api.v3.catalog import (
+    CatalogCrawler,
+    CatalogStore,
+    CrawlSource,
+    SubjectDetailsFetcher,
+)
+from moviebox_api.v3.core import Homepage
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+
+session = Session()
+
+async with MovieBoxHttpClient() as client_session:
+    sources = [
+        CrawlSource("trending", Trending(session)),
+        CrawlSource("homepage", Homepage(client_session)),
+        CrawlSource("category:872031290915189720", ContentCategory(
+            "872031290915189720", session
+        )),
+    ] + [
+        CrawlSource(f"filter:{params}", SearchWithFilter(
+            SubjectType.MOVIES, session, params
+        ))
+        for params in FilterParams.sweep(genre=["Action", "Drama"])
+    ]
+
+    with CatalogStore() as store:
+        summary = await CatalogCrawler(
+            store, sources, details=SubjectDetailsFetcher(client_session)
+        ).crawl()
+
+print(summary.report())
+```
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import StrEnum
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from moviebox_api.v1.helpers import assert_instance
+from moviebox_api.v1.pagination import at_page, get_pager_info
+from moviebox_api.v1.rate_limit import TokenBucket
+from moviebox_api.v3.constants import (
+    CATALOG_VOLATILE_FIELDS,
+    DEFAULT_CATALOG_PATH,
+    DEFAULT_CRAWL_CONCURRENCY,
+    DEFAULT_CRAWL_MAX_PAGES,
+    DEFAULT_CRAWL_RATE,
+    DEFAULT_CRAWL_UNCHANGED_PAGES,
+)
+from moviebox_api.v3.core import (
+    DownloadableCaptionFileDetails,
+    DownloadableVideoFilesDetail,
+    SeasonDetails,
+)
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+from moviebox_api.v3.logger import logger
+from moviebox_api.v3.models.details import SeasonsModel
+from moviebox_api.v3.models.downloadables import RootCaptionFileMetadata
+
+__all__ = [
+    "SubjectStatus",
+    "Checkpoint",
+    "CatalogStore",
+    "CrawlSource",
+    "SubjectDetails",
+    "SubjectDetailsFetcher",
+    "SourceSummary",
+    "CrawlSummary",
+    "CatalogCrawler",
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS subjects (
+    subject_id TEXT PRIMARY KEY,
+    subject_type INTEGER,
+    title TEXT NOT NULL,
+    release_date TEXT,
+    detail_path TEXT,
+    data TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    source TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    details_updated_at REAL
+);
+CREATE TABLE IF NOT EXISTS seasons (
+    subject_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    max_episode INTEGER NOT NULL,
+    all_episodes TEXT,
+    PRIMARY KEY (subject_id, season)
+);
+CREATE TABLE IF NOT EXISTS resolutions (
+    subject_id TEXT NOT NULL,
+    season INTEGER NOT NULL,
+    resolution INTEGER NOT NULL,
+    episodes INTEGER NOT NULL,
+    PRIMARY KEY (subject_id, season, resolution)
+);
+CREATE TABLE IF NOT EXISTS captions (
+    subject_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    language_name TEXT NOT NULL,
+    size INTEGER,
+    PRIMARY KEY (subject_id, language)
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    source TEXT PRIMARY KEY,
+    next_page INTEGER NOT NULL,
+    completed INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class SubjectStatus(StrEnum):
+    """Outcome of upserting a subject"""
+
+    NEW = "new"
+    UPDATED = "updated"
+    UNCHANGED = "unchanged"
+
+
+@dataclass
+class Checkpoint:
+    """Crawl progress of a source"""
+
+    source: str
+    next_page: int
+    """Page to fetch next"""
+    completed: bool
+    """Whether the last crawl of the source went through to the end"""
+    updated_at: float
+
+
+def get_fingerprint(subject: dict) -> str:
+    """Digest of the subject fields that matter when detecting changes"""
+    stable_fields = {
+        key: value
+        for key, value in subject.items()
+        if key not in CATALOG_VOLATILE_FIELDS
+    }
+    return hashlib.sha1(
+        json.dumps(stable_fields, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def get_subjects(content: BaseModel | dict | list) -> list[dict]:
+    """Subjects found anywhere in modelled (or raw) contents - each once
+
+    - Finds v1/v2 search results & category items as well as v3 homepage
+    subjects.
+    """
+    if isinstance(content, BaseModel):
+        content = content.model_dump(mode="json", by_alias=True)
+
+    subjects: dict[str, dict] = {}
+    pending = deque([content])
+
+    while pending:
+        value = pending.popleft()
+
+        if isinstance(value, dict):
+            if value.get("subjectId") and value.get("title"):
+                subjects.setdefault(value["subjectId"], value)
+
+            pending.extend(value.values())
+
+        elif isinstance(value, list):
+            pending.extend(value)
+
+    return list(subjects.values())
+
+
+class CatalogStore:
+    """SQLite mirror of subjects, seasons, resolutions, captions & crawl
+    checkpoints"""
+
+    def __init__(self, path: Path | str = DEFAULT_CATALOG_PATH):
+        """Constructor for `CatalogStore`
+
+        Args:
+            path (Path | str, optional): Database file. Defaults to DEFAULT_CATALOG_PATH.
+        """  # noqa: E501
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(SCHEMA)
+
+    def __repr__(self):
+        return rf"<CatalogStore path='{self.path}'>"
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM subjects"
+            ).fetchone()
+        return count
+
+    def __enter__(self) -> "CatalogStore":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def upsert_subjects(
+        self, subjects: list[dict], source: str | None = None
+    ) -> dict[str, SubjectStatus]:
+        """Inserts new subjects and updates changed ones
+
+        Args:
+            subjects (list[dict]): Raw (camelCase) subjects.
+            source (str | None, optional): Name of the source listing them. Defaults to None.
+
+        Returns:
+            dict[str, SubjectStatus]: `subjectId` of each subject mapped to its outcome
+        """  # noqa: E501
+        statuses: dict[str, SubjectStatus] = {}
+        now = time.time()
+
+        with self._lock, self._connection:
+            for subject in subjects:
+                subject_id = subject["subjectId"]
+                fingerprint = get_fingerprint(subject)
+                row = self._connection.execute(
+                    "SELECT fingerprint FROM subjects WHERE subject_id = ?",
+                    (subject_id,),
+                ).fetchone()
+
+                if row is not None and row[0] == fingerprint:
+                    self._connection.execute(
+                        "UPDATE subjects SET last_seen = ? WHERE subject_id = ?",
+                        (now, subject_id),
+                    )
+                    statuses[subject_id] = SubjectStatus.UNCHANGED
+                    continue
+
+                self._connection.execute(
+                    "INSERT INTO subjects VALUES "
+                    "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL) "
+                    "ON CONFLICT (subject_id) DO UPDATE SET "
+                    "subject_type = excluded.subject_type, "
+                    "title = excluded.title, "
+                    "release_date = excluded.release_date, "
+                    "detail_path = excluded.detail_path, "
+                    "data = excluded.data, "
+                    "fingerprint = excluded.fingerprint, "
+                    "last_seen = excluded.last_seen, "
+                    "updated_at = excluded.updated_at",
+                    (
+                        subject_id,
+                        subject.get("subjectType"),
+                        subject["title"],
+                        subject.get("releaseDate"),
+                        subject.get("detailPath"),
+                        json.dumps(subject, default=str),
+                        fingerprint,
+                        source,
+                        now,
+                        now,
+                        now,
+                    ),
+                )
+                statuses[subject_id] = (
+                    SubjectStatus.NEW if row is None else SubjectStatus.UPDATED
+                )
+
+        return statuses
+
+    def get_subject(self, subject_id: str) -> dict | None:
+        """Raw subject stored"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM subjects WHERE subject_id = ?", (subject_id,)
+            ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def has_details(self, subject_id: str) -> bool:
+        """Whether the details of the current version of the subject are
+        stored"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT details_updated_at >= updated_at FROM subjects "
+                "WHERE subject_id = ?",
+                (subject_id,),
+            ).fetchone()
+        return bool(row and row[0])
+
+    def set_details(self, subject_id: str, details: "SubjectDetails") -> None:
+        """Replaces the seasons, resolutions & captions of a subject"""
+        with self._lock, self._connection:
+            for table in ("seasons", "resolutions", "captions"):
+                self._connection.execute(
+                    f"DELETE FROM {table} WHERE subject_id = ?", (subject_id,)
+                )
+
+            for season in details.seasons.seasons if details.seasons else []:
+                self._connection.execute(
+                    "INSERT INTO seasons VALUES (?, ?, ?, ?)",
+                    (subject_id, season.se, season.max_ep, season.all_ep),
+                )
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO resolutions VALUES (?, ?, ?, ?)",
+                    [
+                        (
+                            subject_id,
+                            season.se,
+                            item.resolution.value,
+                            item.ep_num,
+                        )
+                        for item in season.resolutions
+                    ],
+                )
+
+            # Links are left out since they expire
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO captions VALUES (?, ?, ?, ?)",
+                [
+                    (subject_id, caption.lan, caption.lan_name, caption.size)
+                    for caption in (
+                        details.captions.captions if details.captions else []
+                    )
+                ],
+            )
+            self._connection.execute(
+                "UPDATE subjects SET details_updated_at = ? WHERE subject_id = ?",
+                (time.time(), subject_id),
+            )
+
+    def get_checkpoint(self, source: str) -> Checkpoint | None:
+        """Crawl progress of a source. None if never crawled."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT * FROM checkpoints WHERE source = ?", (source,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        source, next_page, completed, updated_at = row
+        return Checkpoint(source, next_page, bool(completed), updated_at)
+
+    def set_checkpoint(
+        self, source: str, next_page: int, completed: bool
+    ) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?)",
+                (source, next_page, int(completed), time.time()),
+            )
+
+    def count(self, table: str = "subjects") -> int:
+        """Number of rows of a table"""
+        assert table in ("subjects", "seasons", "resolutions", "captions"), (
+            f"Unknown table {table!r}"
+        )
+        with self._lock:
+            (count,) = self._connection.execute(
+                f"SELECT COUNT(*) FROM {table}"
+            ).fetchone()
+        return count
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+@dataclass
+class CrawlSource:
+    """Paginated listing crawled into the catalog
+
+    - Any content provider with a page attribute & `get_content_model()`
+    e.g v2 `ContentCategory`, `SearchWithFilter` & `Trending` or
+    v3 `Homepage`.
+    """
+
+    name: str
+    """Unique name - keys the checkpoint of the source"""
+    provider: t.Any
+    page_attribute: str | None = None
+    """Attribute holding the page number. Defaults to `_page_number` or
+    `_page` whichever the provider has."""
+
+    def __post_init__(self):
+        if self.page_attribute is None:
+            self.page_attribute = (
+                "_page_number"
+                if hasattr(self.provider, "_page_number")
+                else "_page"
+            )
+
+    @property
+    def first_page(self) -> int:
+        return getattr(self.provider, self.page_attribute)
+
+    async def fetch(self, page: int) -> BaseModel:
+        """Modelled contents of a page"""
+        return await at_page(
+            self.provider, page, self.page_attribute
+        ).get_content_model()
+
+
+@dataclass
+class SubjectDetails:
+    """Details of a subject stored alongside it"""
+
+    seasons: SeasonsModel | None = None
+    """Seasons and the resolutions available for each"""
+    captions: RootCaptionFileMetadata | None = None
+    """Captions of the first video file"""
+
+
+class SubjectDetailsFetcher:
+    """Fetches seasons, resolutions & captions of subjects from v3 api"""
+
+    def __init__(self, client_session: MovieBoxHttpClient, captions: bool = True):
+        """Constructor for `SubjectDetailsFetcher`
+
+        Args:
+            client_session (MovieBoxHttpClient): Http client of v3 api.
+            captions (bool, optional): Fetch captions too - two more requests per subject. Defaults to True.
+        """  # noqa: E501
+        assert_instance(client_session, MovieBoxHttpClient, "client_session")
+        self.client_session = client_session
+        self.captions = captions
+
+    async def fetch(
+        self,
+        subject_id: str,
+        throttle: t.Callable[[], t.AsyncContextManager] | None = None,
+    ) -> SubjectDetails:
+        """Details of a subject
+
+        Args:
+            subject_id (str): Unique identifier of the subject.
+            throttle (t.Callable[[], t.AsyncContextManager] | None, optional): Paces each request made. Defaults to None.
+
+        Returns:
+            SubjectDetails: Seasons & captions of the subject
+        """  # noqa: E501
+        throttle = throttle or CatalogCrawler.unthrottled
+        details = SubjectDetails()
+
+        async with throttle():
+            details.seasons = await SeasonDetails(
+                self.client_session
+            ).get_content_model(subject_id)
+
+        if not self.captions:
+            return details
+
+        async with throttle():
+            files = await DownloadableVideoFilesDetail(
+                self.client_session, per_page=1
+            ).get_content_model(subject_id)
+
+        if files.list:
+            async with throttle():
+                details.captions = await DownloadableCaptionFileDetails(
+                    self.client_session
+                ).get_content_model(subject_id, files.list[0])
+
+        return details
+
+
+@dataclass
+class SourceSummary:
+    """Outcome of crawling a source"""
+
+    source: str
+    pages: int = 0
+    subjects: int = 0
+    new: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    details: int = 0
+    """Subjects whose details were stored"""
+    failures: int = 0
+    """Subjects whose details could not be fetched - retried next crawl"""
+    resumed_from: int | None = None
+    """Page resumed from after an interrupted crawl"""
+    stopped_early: bool = False
+    """Whether paging stopped on reaching unchanged subjects"""
+    completed: bool = False
+    error: Exception | None = None
+    """Reason the crawl of the source was interrupted"""
+    elapsed: float = 0.0
+
+
+@dataclass
+class CrawlSummary:
+    """Outcome of a crawl"""
+
+    sources: list[SourceSummary] = field(default_factory=list)
+    requests: int = 0
+    elapsed: float = 0.0
+
+    def _total(self, name: str) -> int:
+        return sum(getattr(summary, name) for summary in self.sources)
+
+    @property
+    def pages(self) -> int:
+        return self._total("pages")
+
+    @property
+    def new(self) -> int:
+        return self._total("new")
+
+    @property
+    def updated(self) -> int:
+        return self._total("updated")
+
+    @property
+    def unchanged(self) -> int:
+        return self._total("unchanged")
+
+    @property
+    def failed_sources(self) -> list[SourceSummary]:
+        return [summary for summary in self.sources if summary.error is not None]
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def report(self) -> str:
+        """Human readable summary - a line per source then the totals"""
+        lines = []
+
+        for summary in self.sources:
+            if summary.error is not None:
+                state = f"interrupted ({summary.error!r})"
+            elif summary.stopped_early:
+                state = "up to date"
+            else:
+                state = "completed" if summary.completed else "paused"
+
+            lines.append(
+                f"{summary.source}: {summary.pages} page(s), "
+                f"{summary.new} new, {summary.updated} updated, "
+                f"{summary.unchanged} unchanged, {summary.details} detailed"
+                + (f" ({summary.failures} failed)" if summary.failures else "")
+                + (
+                    ""
+                    if summary.resumed_from is None
+                    else f", resumed from page {summary.resumed_from}"
+                )
+                + f" - {state}"
+            )
+
+        lines.append(
+            f"Total: {self.pages} page(s), {self.new} new, "
+            f"{self.updated} updated, {self.unchanged} unchanged - "
+            f"{self.requests} request(s) in {self.elapsed:.2f}s "
+            f"({self.requests_per_second:.2f}/s)"
+        )
+        return "\n".join(lines)
+
+
+class CatalogCrawler:
+    """Crawls sources into the catalog - concurrently & at a bounded rate"""
+
+    def __init__(
+        self,
+        store: CatalogStore,
+        sources: t.Iterable[CrawlSource],
+        details: SubjectDetailsFetcher | None = None,
+        concurrency: int = DEFAULT_CRAWL_CONCURRENCY,
+        rate: float | None = DEFAULT_CRAWL_RATE,
+        max_pages: int = DEFAULT_CRAWL_MAX_PAGES,
+        unchanged_pages: int = DEFAULT_CRAWL_UNCHANGED_PAGES,
+    ):
+        """Constructor for `CatalogCrawler`
+
+        Args:
+            store (CatalogStore): Catalog crawled into.
+            sources (t.Iterable[CrawlSource]): Listings to crawl.
+            details (SubjectDetailsFetcher | None, optional): Fetches details of new & changed subjects. Defaults to None (subjects only).
+            concurrency (int, optional): Requests made at once. Defaults to DEFAULT_CRAWL_CONCURRENCY.
+            rate (float | None, optional): Requests per second. None for unlimited. Defaults to DEFAULT_CRAWL_RATE.
+            max_pages (int, optional): Pages per source fetched in this crawl. Defaults to DEFAULT_CRAWL_MAX_PAGES.
+            unchanged_pages (int, optional): Stop paging a source after this many consecutive pages of unchanged subjects. 0 pages to the end. Defaults to DEFAULT_CRAWL_UNCHANGED_PAGES.
+        """  # noqa: E501
+        assert_instance(store, CatalogStore, "store")
+        assert concurrency >= 1, (
+            f"concurrency must be at least 1 not {concurrency}"
+        )
+        assert rate is None or rate > 0, f"rate must be positive not {rate}"
+        assert max_pages >= 1, f"max_pages must be at least 1 not {max_pages}"
+
+        self.store = store
+        self.sources = list(sources)
+        self.details = details
+        self.max_pages = max_pages
+        self.unchanged_pages = unchanged_pages
+
+        names = [source.name for source in self.sources]
+        assert len(set(names)) == len(names), "Source names must be unique"
+
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._bucket = None if rate is None else TokenBucket(rate)
+        self._requests = 0
+
+    def __repr__(self):
+        return (
+            rf"<CatalogCrawler sources={len(self.sources)} store={self.store!r}>"
+        )
+
+    @staticmethod
+    @asynccontextmanager
+    async def unthrottled() -> t.AsyncIterator[None]:
+        yield
+
+    @asynccontextmanager
+    async def throttle(self) -> t.AsyncIterator[None]:
+        """Holds a request slot - waiting for the rate allowed"""
+        async with self._semaphore:
+            if self._bucket is not None:
+                await self._bucket.acquire()
+
+            self._requests += 1
+            yield
+
+    async def _store_details(self, subject_id: str, summary: SourceSummary):
+        try:
+            details = await self.details.fetch(subject_id, self.throttle)
+
+        except Exception as e:
+            logger.warning(f"Unable to fetch details of {subject_id} - {e!r}")
+            summary.failures += 1
+            return
+
+        self.store.set_details(subject_id, details)
+        summary.details += 1
+
+    async def crawl_source(self, source: CrawlSource) -> SourceSummary:
+        """Pages through a source storing its subjects
+
+        Returns:
+            SourceSummary: Outcome - never raises
+        """
+        summary = SourceSummary(source=source.name)
+        start = time.perf_counter()
+        page = source.first_page
+        checkpoint = self.store.get_checkpoint(source.name)
+
+        if checkpoint is not None and not checkpoint.completed:
+            page = summary.resumed_from = checkpoint.next_page
+
+        unchanged_pages = 0
+
+        try:
+            while summary.pages < self.max_pages:
+                async with self.throttle():
+                    content = await source.fetch(page)
+
+                subjects = get_subjects(content)
+                statuses = self.store.upsert_subjects(subjects, source.name)
+                summary.pages += 1
+                summary.subjects += len(subjects)
+
+                for status in statuses.values():
+                    setattr(
+                        summary, status.value, getattr(summary, status.value) + 1
+                    )
+
+                if self.details is not None:
+                    await asyncio.gather(
+                        *(
+                            self._store_details(subject_id, summary)
+                            for subject_id, status in statuses.items()
+                            if status is not SubjectStatus.UNCHANGED
+                            or not self.store.has_details(subject_id)
+                        )
+                    )
+
+                if statuses and all(
+                    status is SubjectStatus.UNCHANGED
+                    for status in statuses.values()
+                ):
+                    unchanged_pages += 1
+                else:
+                    unchanged_pages = 0
+
+                if hasattr(content, "pager"):
+                    has_more, next_page = get_pager_info(content)[:2]
+                else:
+                    # Homepage lacks a pager - pages until one is empty
+                    has_more, next_page = bool(subjects), page + 1
+
+                if (
+                    self.unchanged_pages
+                    and unchanged_pages >= self.unchanged_pages
+                ):
+                    summary.stopped_early = has_more
+                    has_more = False
+
+                if not has_more:
+                    summary.completed = True
+                    self.store.set_checkpoint(
+                        source.name, source.first_page, True
+                    )
+                    break
+
+                page = next_page
+                self.store.set_checkpoint(source.name, page, False)
+
+        except Exception as e:
+            logger.warning(
+                f"Crawl of {source.name} interrupted at page {page} - {e!r}"
+            )
+            summary.error = e
+
+        summary.elapsed = time.perf_counter() - start
+        return summary
+
+    async def crawl(
+        self, progress: t.Callable[[SourceSummary], None] | None = None
+    ) -> CrawlSummary:
+        """Crawls every source - concurrently
+
+        Args:
+            progress (t.Callable[[SourceSummary], None] | None, optional): Called as each source completes. Defaults to None.
+
+        Returns:
+            CrawlSummary: Outcome of the crawl
+        """  # noqa: E501
+        start = time.perf_counter()
+        requests = self._requests
+
+        async def crawl_source(source: CrawlSource) -> SourceSummary:
+            summary = await self.crawl_source(source)
+
+            if progress is not None:
+                progress(summary)
+
+            return summary
+
+        summaries = await asyncio.gather(
+            *(crawl_source(source) for source in self.sources)
+        )
+        return CrawlSummary(
+            sources=list(summaries),
+            requests=self._requests - requests,
+            elapsed=time.perf_counter() - start,
+        )
@@ -9,6 +9,7 @@ import uuid
 from enum import Enum, IntEnum, StrEnum
 
 from moviebox_api.v1.constants import (
+    CACHE_DIR,
     CURRENT_WORKING_DIR,
     DEFAULT_CAPTION_LANGUAGE,
     DEFAULT_CHUNK_SIZE,
@@ -111,6 +112,9 @@ RETRY_STATUS_CODES: frozenset[int] = frozenset(
         504,
     }
 )
+"""Response status codes on which the next host of the pool is tried - unlike
+`v1.constants.RETRY_STATUS_CODES` a 403 is included since another host may
+not block the request"""
 BLOCKED_HOST_KEYWORDS: tuple[str, ...] = (
     "fzmovies",
     "vegamovies",
@@ -146,6 +150,14 @@ TRAILER_CONTENT_FRAGMENTS: tuple[str, ...] = (
     "clip",
 )
 SIGNATURE_BODY_MAX_BYTES: int = 102_400
+HOST_FAILURE_THRESHOLD: int = 3  # consecutive failures that open the circuit
+HOST_COOLDOWN_SECONDS: float = 30.0  # before an open host is probed again
+HOST_LATENCY_EWMA_ALPHA: float = 0.3  # weight of the latest latency sample
+HEDGE_DELAY_SECONDS: float = 0.5  # until enough latencies are sampled
+HEDGE_LATENCY_QUANTILE: float = 0.95  # of sampled latencies used as delay
+HEDGE_MIN_SAMPLES: int = 20
+HEDGE_MAX_SAMPLES: int = 200
+HEDGE_MAX_RATIO: float = 0.1  # of eligible requests that may be hedged
 SEARCH_PER_PAGE_LIMIT = 20
 RESULTS_PER_PAGE_AMOUNT = SEARCH_PER_PAGE_LIMIT
 
@@ -153,6 +165,28 @@ VALID_SUBJECT_ID_PATTERN = re.compile(r"^\d{17,21}$")
 
 DEFAULT_DUB_LANGUAGE_NAME_OR_CODE = "Original"
 
+DEFAULT_CATALOG_PATH = CACHE_DIR / "catalog.sqlite3"
+"""Database file of the local catalog mirror"""
+
+DEFAULT_CRAWL_CONCURRENCY = 4
+"""Requests a catalog crawl makes at once"""
+
+DEFAULT_CRAWL_RATE = 5.0
+"""Requests per second a catalog crawl makes at most"""
+
+DEFAULT_CRAWL_MAX_PAGES = 100
+"""Pages of a single source fetched per crawl - the rest on resuming"""
+
+DEFAULT_CRAWL_UNCHANGED_PAGES = 1
+"""Consecutive pages of already seen & unchanged subjects after which
+paging a source stops"""
+
+CATALOG_VOLATILE_FIELDS = frozenset(
+    {"ops", "seenStatus", "mySeeTime", "opItemId", "viewers", "corner"}
+)
+"""Subject fields varying between responses of the same subject - ignored
+when detecting changes"""
+
 
 class V2TabID(Enum):
     ALL = "All"
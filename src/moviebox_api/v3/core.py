@@ -1,6 +1,18 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from typing import Any
 
+from moviebox_api.v1.constants import (
+    DEFAULT_BATCH_SEARCH_CONCURRENCY,
+    DEFAULT_BATCH_SEARCH_MAX_PAGES,
+    DEFAULT_ITEMS_BUFFER_SIZE,
+)
+from moviebox_api.v1.pagination import aiter_items, aiter_pages, at_page
+from moviebox_api.v1.resolver import (
+    BatchSearchResults,
+    ProgressCallback,
+    TitleQuery,
+    resolve_titles,
+)
 from moviebox_api.v3._bases import BaseContentProviderAndHelper
 from moviebox_api.v3.constants import (
     DEFAULT_VERSION,
@@ -32,6 +44,7 @@ from moviebox_api.v3.models.downloadables import (
 )
 from moviebox_api.v3.models.homepage import RootHomepageModel
 from moviebox_api.v3.models.search import (
+    ResultsSubjectModel,
     RootSearchResultsModel,
     RootSearchResultsModelV2,
 )
@@ -137,6 +150,42 @@ class Search(BaseContentProviderAndHelper):
 
         super().__setattr__(name, value)
 
+    @classmethod
+    async def batch(
+        cls,
+        client_session: MovieBoxHttpClient,
+        queries: Iterable[TitleQuery],
+        subject_type: SubjectType = SubjectType.ALL,
+        concurrency: int = DEFAULT_BATCH_SEARCH_CONCURRENCY,
+        max_pages: int = DEFAULT_BATCH_SEARCH_MAX_PAGES,
+        per_page: int = RESULTS_PER_PAGE_AMOUNT,
+        progress: ProgressCallback | None = None,
+    ) -> BatchSearchResults:
+        """Resolves many titles to search results items concurrently over
+        `client_session` - authenticated once when entered.
+
+        Args:
+            client_session (MovieBoxHttpClient): MovieboxAPI http client session.
+            queries (Iterable[TitleQuery]): Titles or (title, release year) pairs.
+            subject_type (SubjectType, optional): Subject-type filter. Defaults to SubjectType.ALL.
+            concurrency (int, optional): Titles searched at once. Defaults to DEFAULT_BATCH_SEARCH_CONCURRENCY.
+            max_pages (int, optional): Pages to look through per title. Defaults to DEFAULT_BATCH_SEARCH_MAX_PAGES.
+            per_page (int, optional): Maximum number of items per page. Defaults to RESULTS_PER_PAGE_AMOUNT.
+            progress (ProgressCallback | None, optional): Called as each title completes. Defaults to None.
+
+        Returns:
+            BatchSearchResults: Resolved titles in the order of `queries` - failures carry their error
+        """  # noqa: E501
+        return await resolve_titles(
+            lambda query: cls(
+                client_session, query, subject_type, per_page=per_page
+            ),
+            queries,
+            concurrency=concurrency,
+            max_pages=max_pages,
+            progress=progress,
+        )
+
     def _create_payload(self) -> dict[str, str | int]:
         """Creates payload from the parameters declared.
 
@@ -249,23 +298,27 @@ class Search(BaseContentProviderAndHelper):
             )
 
     async def get_content_model_all(
-        self,
+        self, concurrency: int = 1
     ) -> AsyncIterator[RootSearchResultsModel]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model()
+        async def fetch(page: int) -> RootSearchResultsModel:
+            return await at_page(self, page).get_content_model()
 
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
             yield content_model
 
-            if content_model.pager.has_more:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> AsyncIterator[ResultsSubjectModel]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
 
 
 class SearchV2(BaseContentProviderAndHelper):
@@ -428,23 +481,27 @@ class SearchV2(BaseContentProviderAndHelper):
             )
 
     async def get_content_model_all(
-        self,
+        self, concurrency: int = 1
     ) -> AsyncIterator[RootSearchResultsModelV2]:
+        """Pages from this one on - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model()
+        async def fetch(page: int) -> RootSearchResultsModelV2:
+            return await at_page(self, page).get_content_model()
 
+        async for content_model in aiter_pages(fetch, self._page, concurrency):
             yield content_model
 
-            if content_model.pager.has_more:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
+    async def aiter_items(
+        self,
+        limit: int | None = None,
+        concurrency: int = 1,
+        buffer_size: int = DEFAULT_ITEMS_BUFFER_SIZE,
+    ) -> AsyncIterator[ResultsSubjectModel]:
+        """Items of the pages that follow - see `v1.pagination.aiter_items`"""
+        async for item in aiter_items(
+            self.get_content_model_all(concurrency), limit, buffer_size
+        ):
+            yield item
 
 
 class SeasonDetails(BaseContentProviderAndHelper):
@@ -691,24 +748,16 @@ class DownloadableVideoFilesDetail(BaseContentProviderAndHelper):
             )
 
     async def get_content_model_all(
-        self, subject_id: str
+        self, subject_id: str, concurrency: int = 1
     ) -> AsyncIterator[RootDownloadableFilesDetailModel]:
+        """Pages of `subject_id` files - see `v1.pagination.aiter_pages`"""
 
-        navigating = True
-
-        cursor = self
-
-        while navigating:
-            content_model = await cursor.get_content_model(subject_id)
+        async def fetch(page: int) -> RootDownloadableFilesDetailModel:
+            return await at_page(self, page, "page").get_content_model(subject_id)
 
+        async for content_model in aiter_pages(fetch, self.page, concurrency):
             yield content_model
 
-            if content_model.pager.has_more:
-                cursor = cursor.next_page(content_model)
-
-            else:
-                navigating = False
-
 
 DownloadableFilesDetail = DownloadableVideoFilesDetail
 
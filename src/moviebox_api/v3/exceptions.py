@@ -11,3 +11,7 @@ class ResultsNavigationError(MovieboxApiException): ...
 
 
 class MissingDubError(MovieboxApiException): ...
+
+
+class HostsExhaustedError(RuntimeError):
+    """Every host in the pool failed to respond"""
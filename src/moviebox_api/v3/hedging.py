@@ -0,0 +1,96 @@
+"""
+Hedged requests for latency-sensitive endpoints.
+
+When the primary host hasn't answered within ``HedgePolicy.get_delay()`` the
+same request, signed afresh for the other host, is sent to the next healthy
+host. Whichever answers first wins and the other one is cancelled.
+
+```python
+from moviebox_api.v3.hedging import HedgePolicy
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+
+async with MovieBoxHttpClient(hedge=HedgePolicy()) as client:
+    ...
+    print(client.hedge.stats)
+```
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+from statistics import quantiles
+
+from moviebox_api.v3.constants import (
+    HEDGE_DELAY_SECONDS,
+    HEDGE_LATENCY_QUANTILE,
+    HEDGE_MAX_RATIO,
+    HEDGE_MAX_SAMPLES,
+    HEDGE_MIN_SAMPLES,
+)
+from moviebox_api.v3.urls import (
+    EXT_CAPTIONS_PATH,
+    RESOURCE_PATH,
+    SEARCH_PATH,
+    SEARCH_PATH_V2,
+)
+
+HEDGED_PATHS: tuple[str, ...] = (
+    SEARCH_PATH,
+    SEARCH_PATH_V2,
+    RESOURCE_PATH,
+    EXT_CAPTIONS_PATH,
+)
+
+
+@dataclass
+class HedgeStats:
+    eligible: int = 0  # requests to hedged paths
+    hedged: int = 0  # requests for which a hedge was sent
+    hedge_wins: int = 0  # hedged requests answered first by the hedge
+    capped: int = 0  # hedges not sent due to ``max_ratio``
+
+    @property
+    def hedge_ratio(self) -> float:
+        return self.hedged / self.eligible if self.eligible else 0.0
+
+
+@dataclass
+class HedgePolicy:
+    delay: float | None = None  # fixed delay; learned from latencies if None
+    initial_delay: float = HEDGE_DELAY_SECONDS
+    quantile: float = HEDGE_LATENCY_QUANTILE
+    max_ratio: float = HEDGE_MAX_RATIO
+    min_samples: int = HEDGE_MIN_SAMPLES
+    paths: tuple[str, ...] = HEDGED_PATHS
+    stats: HedgeStats = field(default_factory=HedgeStats)
+    _latencies: deque[float] = field(
+        default_factory=lambda: deque(maxlen=HEDGE_MAX_SAMPLES), repr=False
+    )
+
+    def applies_to(self, path_and_query: str) -> bool:
+        path = path_and_query.split("?", 1)[0]
+        return path in self.paths
+
+    def get_delay(self) -> float:
+        """Fixed ``delay`` or the ``quantile`` of sampled latencies"""
+        if self.delay is not None:
+            return self.delay
+
+        if len(self._latencies) < self.min_samples:
+            return self.initial_delay
+
+        cut_points = quantiles(self._latencies, n=100)
+        return cut_points[min(max(round(self.quantile * 100), 1), 99) - 1]
+
+    def record_latency(self, latency: float) -> None:
+        self._latencies.append(latency)
+
+    def allow_hedge(self) -> bool:
+        """Whether another hedge keeps the ratio of hedged requests within
+        ``max_ratio`` - allowing a burst of one"""
+        if self.stats.hedged < self.max_ratio * self.stats.eligible + 1:
+            return True
+
+        self.stats.capped += 1
+        return False
@@ -0,0 +1,167 @@
+"""
+Per-host health tracking used by `MovieBoxHttpClient` to route requests.
+
+Each host in the pool has a circuit breaker:
+
+* ``CLOSED`` - host is healthy and used normally.
+* ``OPEN`` - host failed ``failure_threshold`` times in a row and is skipped
+  until ``cooldown`` seconds elapse.
+* ``HALF_OPEN`` - cooldown elapsed and a single probe request is let through.
+  Its success closes the circuit, its failure opens it again.
+
+Available hosts are ordered with the last good host first, then by an
+exponentially weighted moving average (EWMA) of their response latency.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+from moviebox_api.v3.constants import (
+    HOST_COOLDOWN_SECONDS,
+    HOST_FAILURE_THRESHOLD,
+    HOST_LATENCY_EWMA_ALPHA,
+)
+from moviebox_api.v3.logger import logger
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+
+@dataclass
+class HostHealth:
+    host: str
+    state: CircuitState = CircuitState.CLOSED
+    consecutive_failures: int = 0
+    opened_at: float = 0.0
+    latency: float | None = None  # EWMA in seconds
+    successes: int = 0
+    failures: int = 0
+    probing: bool = field(default=False, repr=False)
+
+
+class HostHealthTracker:
+    def __init__(
+        self,
+        hosts: list[str],
+        failure_threshold: int = HOST_FAILURE_THRESHOLD,
+        cooldown: float = HOST_COOLDOWN_SECONDS,
+        ewma_alpha: float = HOST_LATENCY_EWMA_ALPHA,
+    ) -> None:
+        self._hosts = {host: HostHealth(host) for host in hosts}
+        self._pool_index = {host: index for index, host in enumerate(hosts)}
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.ewma_alpha = ewma_alpha
+
+    def __repr__(self) -> str:
+        return f"<HostHealthTracker {list(self._hosts.values())}>"
+
+    def __getitem__(self, host: str) -> HostHealth:
+        return self._hosts[host]
+
+    def _is_cooling_down(self, health: HostHealth) -> bool:
+        return (
+            health.state is CircuitState.OPEN
+            and time.monotonic() - health.opened_at < self.cooldown
+        )
+
+    def _is_available(self, health: HostHealth) -> bool:
+        if health.state is CircuitState.CLOSED:
+            return True
+
+        if health.state is CircuitState.HALF_OPEN or health.probing:
+            return False
+
+        return not self._is_cooling_down(health)
+
+    def ordered_hosts(self, last_good: str | None = None) -> list[str]:
+        """
+        Hosts in the order they should be tried: available ones first (last
+        good host, then lowest latency, then pool order) followed by the
+        unavailable ones, longest open first.
+        """
+
+        def available_key(health: HostHealth):
+            return (
+                health.host != last_good,
+                health.latency is None,
+                health.latency or 0.0,
+                self._pool_index[health.host],
+            )
+
+        available, unavailable = [], []
+        for health in self._hosts.values():
+            if self._is_available(health):
+                available.append(health)
+            else:
+                unavailable.append(health)
+
+        available.sort(key=available_key)
+        unavailable.sort(key=lambda health: health.opened_at)
+        return [health.host for health in available + unavailable]
+
+    def acquire(self, host: str, force: bool = False) -> bool:
+        """
+        Whether a request may be sent to ``host`` now. Moves an open host whose
+        cooldown has elapsed to half-open and reserves its single probe.
+        ``force`` lets a request through regardless (last resort when every
+        circuit is open).
+        """
+        health = self._hosts[host]
+
+        if health.state is CircuitState.CLOSED:
+            return True
+
+        if not force and not self._is_available(health):
+            return False
+
+        health.state = CircuitState.HALF_OPEN
+        health.probing = True
+        logger.debug("Probing host %s", host)
+        return True
+
+    def release(self, host: str) -> None:
+        """Frees the probe reservation of a request that never completed"""
+        health = self._hosts[host]
+        if health.probing:
+            health.probing = False
+            health.state = CircuitState.OPEN
+
+    def record_success(self, host: str, latency: float) -> None:
+        health = self._hosts[host]
+        if health.state is not CircuitState.CLOSED:
+            logger.debug("Host %s recovered - closing circuit", host)
+
+        health.state = CircuitState.CLOSED
+        health.probing = False
+        health.consecutive_failures = 0
+        health.successes += 1
+        health.latency = (
+            latency
+            if health.latency is None
+            else self.ewma_alpha * latency
+            + (1 - self.ewma_alpha) * health.latency
+        )
+
+    def record_failure(self, host: str) -> None:
+        health = self._hosts[host]
+        health.consecutive_failures += 1
+        health.failures += 1
+
+        if (
+            health.state is CircuitState.HALF_OPEN
+            or health.consecutive_failures >= self.failure_threshold
+        ):
+            if health.state is not CircuitState.OPEN:
+                logger.debug("Opening circuit of host %s", host)
+
+            health.state = CircuitState.OPEN
+            health.opened_at = time.monotonic()
+
+        health.probing = False
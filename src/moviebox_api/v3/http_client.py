@@ -3,17 +3,28 @@ Async HTTP transport layer.
 
 Wraps ``httpx.AsyncClient`` and provides host-pool fallback so that if a
 host responds with a retryable status code the next host in the pool is tried
-automatically.
+automatically. Hosts are tried healthiest first - see ``host_health``.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
+import time
+from collections.abc import Awaitable, Callable
 from json import dumps
 from typing import Any
 
 import httpx
 
+from moviebox_api.v1.cache import ResponseCache
+from moviebox_api.v1.coalescer import RequestCoalescer
+from moviebox_api.v1.constants import AUTH_FAILURE_STATUS_CODES
+from moviebox_api.v1.helpers import resolve_http2
+from moviebox_api.v1.rate_limit import RateLimiter, get_default_rate_limiter
+from moviebox_api.v1.retry import RetryPolicy
+from moviebox_api.v1.token_store import TokenStore, get_default_token_store
 from moviebox_api.v3.constants import (
     AUTH_TOKEN,
     CLIENT_INFO,
@@ -23,10 +34,13 @@ from moviebox_api.v3.constants import (
     TabID,
 )
 from moviebox_api.v3.crypto import build_signed_headers
+from moviebox_api.v3.exceptions import HostsExhaustedError
+from moviebox_api.v3.hedging import HedgePolicy
 from moviebox_api.v3.helpers import (
     combine_url_path_with_params,
     process_api_response,
 )
+from moviebox_api.v3.host_health import CircuitState, HostHealthTracker
 from moviebox_api.v3.logger import logger
 from moviebox_api.v3.urls import DEFAULT_API_BASE, HOST_POOL, MAIN_PAGE_PATH
 
@@ -36,30 +50,64 @@ class MovieBoxHttpClient:
     Async HTTP client for the MovieBox API with:
 
     * Automatic host-pool fallback on retryable error codes.
+    * Per-host circuit breakers, sticky routing to the last good host and
+      latency-ordered fallback (``host_health``).
+    * Opt-in hedging of latency-sensitive requests (``hedge``).
+    * Backoff and retry once the whole pool has failed (``retry_policy``).
+    * Optional per-host client-side rate limiting (``rate_limiter``).
+    * Optional HTTP/2 multiplexing, falling back to HTTP/1.1 (``http2``).
     * Request signing (``X-Client-Token``, ``x-tr-signature``).
     * Transparent bearer-token refresh from ``x-user`` response headers.
+    * Optional on-disk persistence of the run-time token (``token_store``).
+    * Optional caching of parsed api responses (``cache``).
+    * Collapsing of concurrent identical api requests (``coalesce``).
     """
 
+    _token_store_key = "v3"
+
     def __init__(
         self,
         host_pool: list[str] = HOST_POOL,
         timeout: float = 20.0,
         follow_redirects: bool = True,
         auth_token: str | None = AUTH_TOKEN,
+        token_store: TokenStore | None = None,
+        cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        host_health: HostHealthTracker | None = None,
+        hedge: HedgePolicy | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        http2: bool | None = None,
         **httpx_client_kwargs,
     ) -> None:
         self._host_pool = host_pool
+        self.host_health = host_health or HostHealthTracker(host_pool)
+        self.hedge = hedge
+        self.retry_policy = (
+            RetryPolicy() if retry_policy is None else retry_policy
+        )
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
         self._active_base: str = DEFAULT_API_BASE
         self._runtime_token: str | None = auth_token
+        self._token_store = token_store or get_default_token_store()
+        self._token_from_store: bool = False
+        self._token_refresh_lock = asyncio.Lock()
+        self._cache = cache
+        self.coalescer: RequestCoalescer | None = (
+            RequestCoalescer() if coalesce else None
+        )
         self._client: httpx.AsyncClient | None = None
         self._timeout = timeout
         self._follow_redirects = follow_redirects
+        self._http2 = resolve_http2(http2)
         self._httpx_client_kwargs = httpx_client_kwargs
 
     async def __aenter__(self) -> MovieBoxHttpClient:
         self._client = httpx.AsyncClient(
             timeout=self._timeout,
             follow_redirects=self._follow_redirects,
+            http2=self._http2,
             **self._httpx_client_kwargs,
         )
         await self._init_client(force=False)  # users might define their own
@@ -117,9 +165,29 @@ class MovieBoxHttpClient:
             if self._runtime_token or AUTH_TOKEN:
                 return
 
+        if self._token_store is None:
+            await self._fetch_runtime_token()
+            return
+
+        if force:
+            await self._token_store.ainvalidate(self._token_store_key)
+
+        # Token fetched while holding the store's lock must not be
+        # invalidated through it on rejection - that would deadlock
+        self._token_from_store = False
+        auth_details = await self._token_store.aget_or_create(
+            self._token_store_key, self._fetch_runtime_token
+        )
+        self._runtime_token = auth_details["token"]
+        self._token_from_store = True
+
+    async def _fetch_runtime_token(self) -> dict[str, str]:
+        """Fetches landing page contents just to get the run-time token
+        from the ``x-user`` response headers"""
         self._runtime_token = None
 
-        _ = await self.get_from_api(
+        # Not through the response cache since x-user header is what we need
+        _, response = await self.get(
             MAIN_PAGE_PATH,
             params={
                 "page": 1,
@@ -127,9 +195,231 @@ class MovieBoxHttpClient:
                 "version": DEFAULT_VERSION,
             },
         )
+        process_api_response(response)
         assert self._runtime_token is not None, "Unable to fetch run-time token "
 
+        return {"token": self._runtime_token}
+
+    async def _handle_auth_failure(
+        self, response: httpx.Response, token: str | None, from_store: bool
+    ) -> bool:
+        """Stops other processes from reusing a persisted token that the
+        server has rejected and fetches a fresh one - once for concurrent
+        rejections of the same token.
+
+        Returns:
+            bool: Whether the request was rejected for its persisted `token`
+                and should be resent with the fresh one.
+        """
+        if (
+            response.status_code not in AUTH_FAILURE_STATUS_CODES
+            or not from_store
+        ):
+            return False
+
+        async with self._token_refresh_lock:
+            if self._runtime_token == token:
+                self._runtime_token = None
+                await self._init_client(force=True)
+
+        return True
+
+    async def _attempt(
+        self,
+        base: str,
+        *,
+        method: str,
+        path_and_query: str,
+        accept: str,
+        content_type: str,
+        body: str | None,
+        include_play_mode: bool,
+        refresh_rejected_token: bool = True,
+        **request_kwargs,
+    ) -> httpx.Response:
+        """
+        Send the request, signed for ``base``, and record the outcome in
+        ``host_health``. Transport errors are recorded then re-raised.
+
+        A request rejected for a persisted token is resent to ``base`` with a
+        fresh token - the host is not at fault so no failure is recorded.
+        """
+        url = f"{base}{path_and_query}"
+
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire(url)
+
+            # Signed after waiting for the turn since it's timestamped
+            token, from_store = self._effective_token, self._token_from_store
+            headers = self._signed_headers(
+                method, url, accept, content_type, body, include_play_mode
+            )
+            started_at = time.perf_counter()
+
+            if method.upper() == "GET":
+                response = await self._client.get(
+                    url, headers=headers, **request_kwargs
+                )
+            else:
+                response = await self._client.post(
+                    url,
+                    headers=headers,
+                    content=body.encode() if body else b"",
+                    **request_kwargs,
+                )
+
+        except httpx.TransportError as exc:
+            self.host_health.record_failure(base)
+            logger.debug("Host %s transport error: %s", base, exc)
+            raise
+
+        except BaseException:
+            self.host_health.release(base)
+            raise
+
+        latency = time.perf_counter() - started_at
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(url, response.status_code)
+
+        self._absorb_x_user(response.headers)
+
+        if refresh_rejected_token:
+            try:
+                token_rejected = await self._handle_auth_failure(
+                    response, token, from_store
+                )
+
+            except BaseException:
+                self.host_health.release(base)
+                raise
+
+            if token_rejected:
+                return await self._attempt(
+                    base,
+                    method=method,
+                    path_and_query=path_and_query,
+                    accept=accept,
+                    content_type=content_type,
+                    body=body,
+                    include_play_mode=include_play_mode,
+                    refresh_rejected_token=False,
+                    **request_kwargs,
+                )
+
+        if response.status_code in RETRY_STATUS_CODES:
+            self.host_health.record_failure(base)
+            logger.debug(
+                "Host %s returned %d - retrying.", base, response.status_code
+            )
+
+        else:
+            self.host_health.record_success(base, latency)
+            if self.hedge is not None and self.hedge.applies_to(path_and_query):
+                self.hedge.record_latency(latency)
+
+        return response
+
+    async def _hedged_attempt(
+        self,
+        attempt: Callable[[str], Awaitable[httpx.Response]],
+        tried: set[str],
+    ) -> tuple[str, httpx.Response] | None:
+        """
+        Send the request to the best host and, if it hasn't answered within
+        the hedge delay, to the next healthy host too. The first
+        non-retryable response wins and the other request is cancelled.
+
+        Returns the winning or else last ``(base_url, response)``, or None
+        when no response was received. Hosts tried are added to ``tried``.
+        """
+        hosts = [
+            host
+            for host in self.host_health.ordered_hosts(self._active_base)
+            if self.host_health[host].state is CircuitState.CLOSED
+        ]
+
+        if not hosts:
+            return None
+
+        def start(base: str) -> asyncio.Task:
+            tried.add(base)
+            task = asyncio.ensure_future(attempt(base))
+            bases[task] = base
+            return task
+
+        bases: dict[asyncio.Task, str] = {}
+        pending = {start(hosts[0])}
+        hedge_task: asyncio.Task | None = None
+        outcome: tuple[str, httpx.Response] | None = None
+
+        try:
+            done, pending = await asyncio.wait(
+                pending, timeout=self.hedge.get_delay()
+            )
+
+            if pending and len(hosts) > 1 and self.hedge.allow_hedge():
+                logger.debug("Hedging request to host %s", hosts[1])
+                self.hedge.stats.hedged += 1
+                hedge_task = start(hosts[1])
+                pending.add(hedge_task)
+
+            while True:
+                for task in done:
+                    exception = task.exception()
+                    if isinstance(exception, httpx.TransportError):
+                        continue
+
+                    elif exception is not None:
+                        raise exception
+
+                    outcome = bases[task], task.result()
+                    if outcome[1].status_code not in RETRY_STATUS_CODES:
+                        if task is hedge_task:
+                            self.hedge.stats.hedge_wins += 1
+                        return outcome
+
+                if not pending:
+                    return outcome
+
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+            if pending:
+                await asyncio.wait(pending)
+
     async def _request(
+        self,
+        method: str,
+        path_and_query: str,
+        **kwargs,
+    ) -> tuple[str, httpx.Response]:
+        """
+        Send the request across the host pool and, once every host has failed
+        transiently, retry it after a backoff as per ``retry_policy``.
+
+        Returns ``(winning_base_url, response)``.
+        """
+        winning_base = self._active_base
+
+        async def send() -> httpx.Response:
+            nonlocal winning_base
+            winning_base, response = await self._request_hosts(
+                method, path_and_query, **kwargs
+            )
+            return response
+
+        response = await self.retry_policy.asend(
+            method, path_and_query, send, retry_exceptions=(HostsExhaustedError,)
+        )
+        return winning_base, response
+
+    async def _request_hosts(
         self,
         method: str,
         path_and_query: str,
@@ -141,8 +431,11 @@ class MovieBoxHttpClient:
         **request_kwargs,
     ) -> tuple[str, httpx.Response]:
         """
-        Try each host in the pool in order and return the first response that
-        is NOT a retryable status code.
+        Try each available host, starting with the last good one, and return
+        the first response that is NOT a retryable status code. Hosts whose
+        circuit is open are skipped unless every circuit is open.
+
+        Requests to the paths of ``hedge`` policy are hedged first.
 
         Returns ``(winning_base_url, response)``.
         """
@@ -154,46 +447,58 @@ class MovieBoxHttpClient:
         last_exception: Exception = Exception
 
         last_base: str = self._active_base
+        attempt = functools.partial(
+            self._attempt,
+            method=method,
+            path_and_query=path_and_query,
+            accept=accept,
+            content_type=content_type,
+            body=body,
+            include_play_mode=include_play_mode,
+            **request_kwargs,
+        )
+        tried: set[str] = set()
 
-        for base in self._host_pool:
-            url = f"{base}{path_and_query}"
-            headers = self._signed_headers(
-                method, url, accept, content_type, body, include_play_mode
-            )
+        if self.hedge is not None and self.hedge.applies_to(path_and_query):
+            self.hedge.stats.eligible += 1
+            outcome = await self._hedged_attempt(attempt, tried)
+
+            if outcome is not None:
+                last_base, last_response = outcome
+
+                if last_response.status_code not in RETRY_STATUS_CODES:
+                    self._active_base = last_base
+                    return outcome
+
+        ordered_hosts = self.host_health.ordered_hosts(self._active_base)
+        attempted = bool(tried)
+
+        for base in ordered_hosts:
+            if base in tried or not self.host_health.acquire(
+                base, force=not attempted
+            ):
+                continue
+
+            attempted = True
 
             try:
-                if method.upper() == "GET":
-                    response = await self._client.get(
-                        url, headers=headers, **request_kwargs
-                    )
-                else:
-                    response = await self._client.post(
-                        url,
-                        headers=headers,
-                        content=body.encode() if body else b"",
-                        **request_kwargs,
-                    )
-
-                self._absorb_x_user(response.headers)
-                last_response = response
-                last_base = base
-
-                if response.status_code not in RETRY_STATUS_CODES:
-                    self._active_base = base
-                    return base, response
-
-                logger.debug(
-                    "Host %s returned %d - retrying.", base, response.status_code
-                )
+                response = await attempt(base)
 
             except httpx.TransportError as exc:
                 last_exception = exc
-                logger.debug("Host %s transport error: %s", base, exc)
+                continue
+
+            last_response = response
+            last_base = base
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                self._active_base = base
+                return base, response
 
         # All hosts failed; return whatever we got last
         self._active_base = last_base
         if last_response is None:
-            raise RuntimeError(
+            raise HostsExhaustedError(
                 f"All hosts exhausted for {path_and_query}. "
                 "Set logging level to debug to see the actual errors"
             ) from last_exception
@@ -259,24 +564,75 @@ class MovieBoxHttpClient:
             full_url = combine_url_path_with_params(full_url, params)
 
         assert self._client is not None
-        return await self._client.get(
+        if self.rate_limiter is None:
+            return await self._client.get(
+                full_url, headers=headers or {}, **request_kwargs
+            )
+
+        await self.rate_limiter.acquire(full_url)
+        response = await self._client.get(
             full_url, headers=headers or {}, **request_kwargs
         )
+        self.rate_limiter.update(full_url, response.status_code)
+        return response
+
+    async def _fetch_from_api(
+        self,
+        method: str,
+        send: Callable[..., Awaitable[tuple[str, httpx.Response]]],
+        path: str,
+        params: dict | None = None,
+        json: dict | None = None,
+        **kwargs,
+    ) -> dict:
+        """Sends the request using `send` and extract the `data` field from the
+        response - through the request coalescer and response cache when set"""
+
+        if params is not None:
+            kwargs["params"] = params
+
+        if json is not None:
+            kwargs["json"] = json
+
+        async def fetch() -> dict:
+            _, response = await send(path, **kwargs)
+            return process_api_response(response)
+
+        async def fetch_cached() -> dict:
+            if self._cache is None:
+                return await fetch()
+
+            return await self._cache.aget_or_fetch(
+                method, path, fetch, params=params, body=json
+            )
+
+        if self.coalescer is None:
+            return await fetch_cached()
+
+        return await self.coalescer.aget_or_fetch(
+            method, path, fetch_cached, params=params, body=json
+        )
 
-    async def get_from_api(self, *args, **kwargs) -> dict:
+    async def get_from_api(
+        self, path: str, *, params: dict = None, **kwargs
+    ) -> dict:
         """Fetch data from api and extract the `data` field from the response
 
         Returns:
             dict: Extracted data field value
         """
-        _, response = await self.get(*args, **kwargs)
-        return process_api_response(response)
+        return await self._fetch_from_api(
+            "GET", self.get, path, params=params, **kwargs
+        )
 
-    async def post_to_api(self, *args, **kwargs) -> dict:
+    async def post_to_api(
+        self, path: str, json: dict, *, params: dict = None, **kwargs
+    ) -> dict:
         """Sends data to api and extract the `data` field from the response
 
         Returns:
             dict: Extracted data field value
         """
-        _, response = await self.post(*args, **kwargs)
-        return process_api_response(response)
+        return await self._fetch_from_api(
+            "POST", self.post, path, params=params, json=json, **kwargs
+        )
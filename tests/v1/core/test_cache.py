@@ -0,0 +1,267 @@
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+from moviebox_api.v1 import TVSeriesDetails
+from moviebox_api.v1.cache import (
+    ItemDetailsCache,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from moviebox_api.v1.requests import Session
+from moviebox_api.v2 import Session as SessionV2
+from moviebox_api.v2.core import TVSeriesDetails as TVSeriesDetailsV2
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+from tests.v1 import project_dir
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+
+SEARCH_URL = "https://h5-api.aoneroom.com/wefeed-h5api-bff/subject/search"
+TRENDING_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/trending"
+DOWNLOAD_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/download"
+
+
+def make_handler(calls: Counter):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": {"items": [1, 2]}},
+            headers={"x-user": '{"token": "runtime-token"}'},
+        )
+
+    return handler
+
+
+def test_key_ignores_parameter_order():
+    assert ResponseCache.make_key(
+        "get", "https://h5.aoneroom.com/subject/filter?b=2", {"a": 1}
+    ) == ResponseCache.make_key(
+        "GET", "https://h5.aoneroom.com/subject/filter?a=1&b=2"
+    )
+    assert ResponseCache.make_key(
+        "POST", SEARCH_URL, body={"keyword": "a"}
+    ) != ResponseCache.make_key("POST", SEARCH_URL, body={"keyword": "b"})
+
+
+@pytest.mark.asyncio
+async def test_session_caches_api_responses():
+    calls = Counter()
+    cache = ResponseCache()
+
+    async with Session(
+        cache=cache, transport=httpx.MockTransport(make_handler(calls))
+    ) as session:
+        params = {"page": 0, "perPage": 18}
+        first = await session.get_from_api(TRENDING_URL, params=params)
+        first["items"].append(3)
+        second = await session.get_from_api(TRENDING_URL, params=params)
+
+        assert second == {"items": [1, 2]}
+        assert calls[httpx.URL(TRENDING_URL).path] == 1
+
+        await session.get_from_api(DOWNLOAD_URL, params={"subjectId": "1"})
+        await session.get_from_api(DOWNLOAD_URL, params={"subjectId": "1"})
+        assert calls[httpx.URL(DOWNLOAD_URL).path] == 2
+
+        with ResponseCache.bypass():
+            await session.get_from_api(TRENDING_URL, params=params)
+
+        assert calls[httpx.URL(TRENDING_URL).path] == 2
+
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.bypasses == 1
+    assert cache.stats.uncacheable == 2
+    assert cache.invalidate("/subject/trending") == 1
+
+
+def test_sqlite_backend_persists_entries(tmp_path):
+    backend = SQLiteCacheBackend(tmp_path / "responses.sqlite3")
+    backend.set("GET /subject/filter", '{"items": []}', ttl=60)
+    backend.set("GET /subject/trending", "{}", ttl=-1)
+    backend.close()
+
+    backend = SQLiteCacheBackend(tmp_path / "responses.sqlite3")
+    assert backend.get("GET /subject/filter") == '{"items": []}'
+    assert backend.get("GET /subject/trending") is None
+    assert len(backend) == 1
+    assert backend.purge_expired() == 1
+
+
+@pytest.mark.asyncio
+async def test_session_caches_in_empty_sqlite_backend(tmp_path):
+    calls = Counter()
+    backend = SQLiteCacheBackend(tmp_path / "responses.sqlite3")
+    cache = ResponseCache(backend)
+    assert cache.backend is backend
+
+    async with Session(
+        cache=cache, transport=httpx.MockTransport(make_handler(calls))
+    ) as session:
+        await session.get_from_api(TRENDING_URL, params={"page": 0})
+
+    assert len(backend) == 1
+
+
+@pytest.mark.asyncio
+async def test_cookied_and_cookieless_responses_are_kept_apart():
+    calls = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        data = {"items": [1, 2]} if "trending" in request.url.path else [APP_INFO]
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": data},
+            headers={"x-user": json.dumps(USER_INFO)},
+        )
+
+    async with Session(
+        cache=ResponseCache(), transport=httpx.MockTransport(handler)
+    ) as session:
+        params = {"page": 0}
+        await session.get_from_api(TRENDING_URL, params=params)
+        await session.get_with_cookies_from_api(TRENDING_URL, params=params)
+        await session.get_with_cookies_from_api(TRENDING_URL, params=params)
+
+    assert calls[httpx.URL(TRENDING_URL).path] == 2
+    assert ResponseCache.make_key(
+        "GET", TRENDING_URL, scope="cookies"
+    ) != ResponseCache.make_key("GET", TRENDING_URL)
+
+
+@pytest.mark.asyncio
+async def test_http_client_caches_signed_requests():
+    calls = Counter()
+    path = "/wefeed-mobile-bff/subject-api/search/v2"
+
+    async with MovieBoxHttpClient(
+        host_pool=["https://api6.aoneroom.com"],
+        auth_token=None,
+        cache=ResponseCache(),
+        transport=httpx.MockTransport(make_handler(calls)),
+    ) as client_session:
+        for _ in range(2):
+            await client_session.post_to_api(path, json={"keyword": "avatar"})
+
+    assert calls[path] == 1
+
+
+def test_item_details_cache_is_bounded_by_size(tmp_path):
+    details_cache = ItemDetailsCache(
+        max_bytes=20, backend=SQLiteCacheBackend(tmp_path / "details.db")
+    )
+    assert ItemDetailsCache.make_key(
+        "https://h5.aoneroom.com/detail/Avatar-WLDIi21IUBa?id=1", "v1"
+    ) == ItemDetailsCache.make_key("avatar-wldii21iuba", "v1")
+
+    details_cache.set("v1:a", ["a" * 10])
+    details_cache.set("v1:b", ["b" * 10])
+    assert details_cache.size <= 20
+    assert len(details_cache) == 1
+
+    # Evicted from memory but still persisted
+    assert details_cache.get("v1:a") == ["a" * 10]
+
+    details_cache.ttl = 0
+    details_cache.set("v1:c", ["c"])
+    assert details_cache.get("v1:c") is None
+
+
+def test_item_details_cache_keeps_models_with_values():
+    details_cache = ItemDetailsCache(max_bytes=20)
+
+    # Sized from the body the value was parsed from
+    details_cache.set("v1:a", ["a" * 30], size=15)
+    assert details_cache.size == 15
+
+    details_cache.set_model("v1:b", "model")
+    assert details_cache.get_model("v1:b") is None
+    details_cache.set_model("v1:a", "model")
+    assert details_cache.get_model("v1:a") == "model"
+
+    details_cache.set("v1:b", ["b"], size=10)
+    assert details_cache.get("v1:a") is None
+    assert details_cache.get_model("v1:a") is None
+
+
+@pytest.mark.asyncio
+async def test_item_details_are_shared_across_instances():
+    calls = Counter()
+    page_content = (
+        project_dir / "assets/data/shannara-chronicles.page"
+    ).read_text(encoding="utf-8")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        if request.url.path.startswith("/detail/"):
+            return httpx.Response(200, text=page_content)
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": [APP_INFO]},
+            headers={"x-user": json.dumps(USER_INFO)},
+        )
+
+    details_cache = ItemDetailsCache()
+    page_url = "/detail/the-shannara-chronicles-8MqAb6nBvC2"
+
+    async with Session(transport=httpx.MockTransport(handler)) as session:
+        for _ in range(3):
+            item_details = TVSeriesDetails(
+                page_url, session, details_cache=details_cache
+            )
+            extractor_model = (
+                await item_details.get_json_details_extractor_model()
+            )
+            assert extractor_model.seasons
+
+        models = [
+            await TVSeriesDetails(
+                page_url, session, details_cache=details_cache
+            ).get_content_model()
+            for _ in range(2)
+        ]
+
+    assert models[0] is models[1]  # Validated once
+    assert calls[page_url] == 1
+    assert details_cache.stats.hits == 4
+    assert details_cache.size == len(page_content)
+
+
+@pytest.mark.asyncio
+async def test_v2_item_details_models_are_shared_across_instances():
+    calls = Counter()
+    item_details = json.loads(
+        (project_dir / "assets/recons1/item-details.json").read_text()
+    )
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        if request.url.path.endswith("/detail"):
+            return httpx.Response(200, json=item_details)
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": [APP_INFO]},
+            headers={"x-user": json.dumps(USER_INFO)},
+        )
+
+    details_cache = ItemDetailsCache()
+    detail_path = item_details["data"]["subject"]["detailPath"]
+
+    async with SessionV2(transport=httpx.MockTransport(handler)) as session:
+        models = [
+            await TVSeriesDetailsV2(session, details_cache).get_content_model(
+                detail_path
+            )
+            for _ in range(2)
+        ]
+        content = await TVSeriesDetailsV2(session, details_cache).get_content(
+            detail_path
+        )
+
+    assert models[0] is models[1]
+    assert content["subject"]["title"] == models[0].subject.title
+    assert calls["/wefeed-h5api-bff/detail"] == 1
+    assert details_cache.stats.hits == 2
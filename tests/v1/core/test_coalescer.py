@@ -0,0 +1,88 @@
+import asyncio
+from collections import Counter
+
+import httpx
+import pytest
+
+from moviebox_api.v1.coalescer import RequestCoalescer
+from moviebox_api.v1.requests import Session
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+
+TRENDING_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/trending"
+
+
+def make_handler(calls: Counter):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        await asyncio.sleep(0.05)
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": {"items": [1, 2]}},
+            headers={"x-user": '{"token": "runtime-token"}'},
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_session_collapses_identical_requests():
+    calls = Counter()
+
+    async with Session(
+        transport=httpx.MockTransport(make_handler(calls))
+    ) as session:
+        contents = await asyncio.gather(
+            *(
+                session.get_from_api(TRENDING_URL, params={"page": page % 2})
+                for page in range(10)
+            )
+        )
+
+    assert calls[httpx.URL(TRENDING_URL).path] == 2
+    assert session.coalescer.stats.upstream == 2
+    assert session.coalescer.stats.collapsed == 8
+
+    contents[0]["items"].append(3)
+    assert all(content == {"items": [1, 2]} for content in contents[1:])
+
+
+@pytest.mark.asyncio
+async def test_http_client_collapses_identical_requests():
+    calls = Counter()
+    path = "/wefeed-mobile-bff/subject-api/search/v2"
+
+    async with MovieBoxHttpClient(
+        host_pool=["https://api6.aoneroom.com"],
+        auth_token=None,
+        transport=httpx.MockTransport(make_handler(calls)),
+    ) as client_session:
+        await asyncio.gather(
+            *(
+                client_session.post_to_api(path, json={"keyword": "avatar"})
+                for _ in range(5)
+            )
+        )
+
+    assert calls[path] == 1
+    assert client_session.coalescer.stats.collapsed == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_fail_others():
+    coalescer = RequestCoalescer()
+    release = asyncio.Event()
+
+    async def fetch() -> dict:
+        await release.wait()
+        return {"items": []}
+
+    first = asyncio.create_task(coalescer.aget_or_fetch("GET", "/a", fetch))
+    second = asyncio.create_task(coalescer.aget_or_fetch("GET", "/a", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    release.set()
+
+    assert await second == {"items": []}
+    assert first.cancelled()
+    assert not len(coalescer)
@@ -0,0 +1,174 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+from pydantic import BaseModel
+
+from moviebox_api.v1 import Session, Trending
+from moviebox_api.v1.models import SearchResultsPagerModel, TrendingResultsModel
+from moviebox_api.v1.pagination import aiter_items, aiter_pages
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+
+
+def make_page(page: int, last_page: int, total_count: int = 0) -> dict:
+    return {
+        "pager": {
+            "hasMore": page < last_page,
+            "nextPage": page + 1,
+            "page": page,
+            "perPage": 10,
+            "totalCount": total_count,
+        },
+        "subjectList": [],
+    }
+
+
+class PageFetcher:
+    def __init__(self, last_page: int, total_count: int = 0):
+        self.last_page = last_page
+        self.total_count = total_count
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fetched = []
+
+    async def __call__(self, page: int) -> TrendingResultsModel:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.fetched.append(page)
+        try:
+            await asyncio.sleep(0.01 * (page % 3))  # Out of order completion
+            return TrendingResultsModel(
+                **make_page(page, self.last_page, self.total_count)
+            )
+        finally:
+            self.in_flight -= 1
+
+
+async def collect_pages(fetch: PageFetcher, concurrency: int) -> list[int]:
+    return [
+        content.pager.page async for content in aiter_pages(fetch, 1, concurrency)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_pages_are_fetched_one_after_another_by_default():
+    fetch = PageFetcher(last_page=5, total_count=50)
+    assert await collect_pages(fetch, 1) == [1, 2, 3, 4, 5]
+    assert fetch.max_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_known_total_pages_are_fetched_concurrently_in_order():
+    fetch = PageFetcher(last_page=8, total_count=80)
+    assert await collect_pages(fetch, 4) == list(range(1, 9))
+    assert fetch.max_in_flight == 4
+    assert sorted(fetch.fetched) == list(range(1, 9))
+
+
+@pytest.mark.asyncio
+async def test_unknown_total_prefetches_one_page_ahead():
+    fetch = PageFetcher(last_page=5)
+    assert await collect_pages(fetch, 4) == [1, 2, 3, 4, 5]
+    assert fetch.max_in_flight == 1
+    assert fetch.fetched == [1, 2, 3, 4, 5]
+
+
+@pytest.mark.asyncio
+async def test_breaking_early_cancels_prefetched_pages():
+    fetch = PageFetcher(last_page=20, total_count=200)
+
+    async for content in aiter_pages(fetch, 1, 4):
+        if content.pager.page == 2:
+            break
+
+    await asyncio.sleep(0.05)
+    assert fetch.in_flight == 0
+    assert len(fetch.fetched) < 20
+
+
+@pytest.mark.asyncio
+async def test_trending_get_content_model_all_prefetches():
+    last_page = 6
+    in_flight = 0
+    max_in_flight = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        if "page" not in request.url.params:
+            return httpx.Response(
+                200,
+                json={"code": 0, "message": "ok", "data": [APP_INFO]},
+                headers={"x-user": json.dumps(USER_INFO)},
+            )
+
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        page = int(request.url.params["page"])
+        return httpx.Response(
+            200,
+            json={
+                "code": 0,
+                "message": "ok",
+                "data": make_page(page, last_page, total_count=60),
+            },
+        )
+
+    async with Session(transport=httpx.MockTransport(handler)) as session:
+        pages = [
+            content.pager
+            async for content in Trending(session, page=1).get_content_model_all(
+                concurrency=3
+            )
+        ]
+
+    assert all(isinstance(pager, SearchResultsPagerModel) for pager in pages)
+    assert [pager.page for pager in pages] == list(range(1, last_page + 1))
+    assert max_in_flight == 3
+
+
+class Item(BaseModel):
+    subjectId: str
+
+
+class ItemsPage(BaseModel):
+    pager: SearchResultsPagerModel
+    items: list[Item]
+
+
+async def iter_items_pages(last_page: int, fetched: list[int]):
+    for page in range(1, last_page + 1):
+        fetched.append(page)
+        # Last item of a page repeated on the next one
+        yield ItemsPage(
+            pager=make_page(page, last_page)["pager"],
+            items=[Item(subjectId=str(page * 10 + i)) for i in range(11)],
+        )
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_drops_duplicates_and_respects_limit():
+    fetched = []
+    items = [
+        item.subjectId
+        async for item in aiter_items(
+            iter_items_pages(5, fetched), limit=25, buffer_size=5
+        )
+    ]
+
+    assert items == [str(subject_id) for subject_id in range(10, 35)]
+    assert len(fetched) < 5
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_fetches_ahead_up_to_buffer_size():
+    fetched = []
+    items = aiter_items(iter_items_pages(50, fetched), buffer_size=15)
+
+    await anext(items)
+    await asyncio.sleep(0.01)
+    assert len(fetched) == 2
+
+    await items.aclose()
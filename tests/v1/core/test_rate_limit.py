@@ -0,0 +1,92 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from moviebox_api.v1.constants import EndpointClass
+from moviebox_api.v1.rate_limit import RateLimiter, TokenBucket
+from moviebox_api.v1.requests import Session
+from moviebox_api.v1.retry import RetryPolicy
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+
+TRENDING_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/trending"
+
+
+def ok_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"code": 0, "message": "ok", "data": {}},
+        headers={"x-user": '{"token": "runtime-token"}'},
+    )
+
+
+def test_urls_are_classified():
+    assert RateLimiter.classify(TRENDING_URL) is EndpointClass.API
+    assert (
+        RateLimiter.classify("https://h5.aoneroom.com/detail/avatar-WLDIi21IUBa")
+        is EndpointClass.PAGE
+    )
+    assert (
+        RateLimiter.classify("https://bcdnw.hakunaymatata.com/a/b.mp4?sign=1")
+        is EndpointClass.MEDIA
+    )
+
+
+@pytest.mark.asyncio
+async def test_bucket_paces_requests():
+    bucket = TokenBucket(rate=20, burst=1)
+    started_at = time.monotonic()
+
+    await asyncio.gather(*(bucket.acquire() for _ in range(5)))
+
+    assert time.monotonic() - started_at >= 0.19
+
+
+def test_bucket_adapts_to_throttling():
+    bucket = TokenBucket(rate=10)
+
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.rate == 2.5
+
+    for _ in range(1000):
+        bucket.recover()
+    assert bucket.rate == 10
+
+
+@pytest.mark.asyncio
+async def test_limiter_is_shared_across_instances():
+    rate_limiter = RateLimiter(rates={EndpointClass.API: 1000})
+
+    async with (
+        Session(
+            rate_limiter=rate_limiter, transport=httpx.MockTransport(ok_handler)
+        ) as session,
+        MovieBoxHttpClient(
+            host_pool=["https://api6.aoneroom.com"],
+            auth_token="token",
+            rate_limiter=rate_limiter,
+            transport=httpx.MockTransport(ok_handler),
+        ) as client_session,
+    ):
+        await session.get_from_api(TRENDING_URL)
+        await client_session.get_from_api("/wefeed-mobile-bff/tab-operating")
+
+    assert rate_limiter.stats.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_throttled_host_is_slowed_down():
+    rate_limiter = RateLimiter()
+
+    async with Session(
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(max_attempts=1),
+        transport=httpx.MockTransport(lambda request: httpx.Response(429)),
+    ) as session:
+        with pytest.raises(httpx.HTTPStatusError):
+            await session.get(TRENDING_URL)
+
+    assert rate_limiter.stats.throttled == 1
+    assert rate_limiter.get_bucket(TRENDING_URL).rate == 5
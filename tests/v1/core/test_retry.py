@@ -0,0 +1,119 @@
+from collections import Counter
+
+import httpx
+import pytest
+
+from moviebox_api.v1.requests import Session
+from moviebox_api.v1.retry import RetryPolicy, RetryStats
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+
+TRENDING_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/trending"
+RANKING_URL = "https://h5.aoneroom.com/wefeed-h5-bff/web/ranking-list/content"
+
+
+def make_flaky_handler(calls: Counter, failures: int):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        if calls[request.url.path] <= failures:
+            return httpx.Response(503, headers={"retry-after": "0"})
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": {}},
+            headers={"x-user": '{"token": "runtime-token"}'},
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_session_retries_transient_failures():
+    calls = Counter()
+
+    async with Session(
+        transport=httpx.MockTransport(make_flaky_handler(calls, failures=2))
+    ) as session:
+        assert await session.get_from_api(TRENDING_URL) == {}
+
+    assert calls[httpx.URL(TRENDING_URL).path] == 3
+    assert session.retry_policy.stats == RetryStats(retries=2, recovered=1)
+
+
+@pytest.mark.asyncio
+async def test_session_does_not_retry_auth_failures_or_when_disabled():
+    calls = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        return httpx.Response(
+            403 if request.url.path.endswith("/trending") else 503
+        )
+
+    async with Session(
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(backoff_base=0),
+    ) as session:
+        with pytest.raises(httpx.HTTPStatusError):
+            await session.get(TRENDING_URL)
+
+    async with Session(
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as session:
+        with pytest.raises(httpx.HTTPStatusError):
+            await session.get(RANKING_URL)
+
+    assert calls[httpx.URL(TRENDING_URL).path] == 1
+    assert calls[httpx.URL(RANKING_URL).path] == 1
+    assert session.retry_policy.stats == RetryStats()
+
+
+@pytest.mark.asyncio
+async def test_http_client_retries_exhausted_pool():
+    calls = Counter()
+    path = "/wefeed-mobile-bff/subject-api/search"
+    retry_policy = RetryPolicy(max_attempts=2)
+
+    async with MovieBoxHttpClient(
+        host_pool=["https://api6.aoneroom.com", "https://api5.aoneroom.com"],
+        auth_token="token",
+        retry_policy=retry_policy,
+        transport=httpx.MockTransport(make_flaky_handler(calls, failures=2)),
+    ) as client_session:
+        assert await client_session.post_to_api(path, json={}) == {}
+
+    assert calls[path] == 3
+    assert retry_policy.stats == RetryStats(retries=1, recovered=1)
+
+
+def test_only_idempotent_requests_are_retried():
+    retry_policy = RetryPolicy()
+
+    assert retry_policy.is_idempotent("get", TRENDING_URL)
+    assert retry_policy.is_idempotent(
+        "POST", "https://h5-api.aoneroom.com/wefeed-h5api-bff/subject/search"
+    )
+    assert not retry_policy.is_idempotent(
+        "POST", "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/download"
+    )
+
+
+def test_delay_is_jittered_or_set_by_server():
+    retry_policy = RetryPolicy(backoff_base=1, backoff_max=5)
+
+    assert all(0 <= retry_policy.get_delay(3) <= 4 for _ in range(100))
+    assert all(0 <= retry_policy.get_delay(10) <= 5 for _ in range(100))
+    assert (
+        retry_policy.get_delay(
+            1, httpx.Response(429, headers={"retry-after": "2"})
+        )
+        == 2
+    )
+    assert (
+        retry_policy.get_delay(
+            1,
+            httpx.Response(
+                429, headers={"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+            ),
+        )
+        == 0
+    )
@@ -0,0 +1,71 @@
+import json
+
+import httpx
+import pytest
+
+from moviebox_api.v1 import Search, Session
+from moviebox_api.v1.exceptions import ZeroSearchResultsError
+from tests.v1 import project_dir
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+
+SEARCH_RESULTS = json.loads(
+    (project_dir / "assets/recons/search/all-results.json").read_text()
+)["data"]
+
+
+def make_handler(searched_pages: list[tuple[str, int]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("/subject/search"):
+            return httpx.Response(
+                200,
+                json={"code": 0, "message": "ok", "data": [APP_INFO]},
+                headers={"x-user": json.dumps(USER_INFO)},
+            )
+
+        payload = json.loads(request.content)
+        keyword, page = payload["keyword"], payload["page"]
+        searched_pages.append((keyword, page))
+
+        if keyword == "missing":
+            return httpx.Response(404)
+
+        data = SEARCH_RESULTS | {
+            "pager": SEARCH_RESULTS["pager"]
+            | {"page": page, "nextPage": page + 1, "hasMore": page < 3}
+        }
+        return httpx.Response(
+            200, json={"code": 0, "message": "ok", "data": data}
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_batch_resolves_titles_in_order_with_errors():
+    searched_pages = []
+    progress = []
+
+    async with Session(
+        transport=httpx.MockTransport(make_handler(searched_pages))
+    ) as session:
+        results = await Search.batch(
+            session,
+            [("Titanic", 2018), "missing", ("Titanic", 1900), "Titanic"],
+            concurrency=2,
+            max_pages=2,
+            progress=lambda result, stats: progress.append(stats.completed),
+        )
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert results[0].item.releaseDate.year == 2018
+    assert results[0].pages == 1
+    assert isinstance(results[1].error, httpx.HTTPStatusError)
+    assert isinstance(results[2].error, ZeroSearchResultsError)
+    assert results[2].pages == 2
+    assert results[3].item.subjectId == SEARCH_RESULTS["items"][0]["subjectId"]
+
+    assert results.stats.resolved == 2
+    assert results.stats.failed == 2
+    assert results.stats.pages == 4
+    assert sorted(progress) == [1, 2, 3, 4]
+    assert searched_pages.count(("Titanic", 2)) == 1
@@ -0,0 +1,326 @@
+import asyncio
+import importlib.util
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+import moviebox_api.v2.requests
+from moviebox_api.v1.exceptions import UnsuccessfulResponseError
+from moviebox_api.v1.helpers import (
+    ApiItemsParser,
+    process_api_response,
+    resolve_http2,
+)
+from moviebox_api.v1.requests import Session
+from moviebox_api.v1.token_store import TokenStore
+from moviebox_api.v2.core import Homepage
+from tests.v1 import project_dir
+
+USER_INFO = {"token": "abc", "userId": "1", "userType": 0, "appType": 0}
+
+APP_INFO = {
+    "channelType": "CHANNEL_OWN",
+    "pkgName": "com.community.oneroom",
+    "url": "https://apk.aoneroom.com/moviebox.apk",
+    "versionCode": "50020052",
+    "versionName": "3.0.05.0711.03",
+}
+
+
+def ok_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={
+            "code": 0,
+            "message": "ok",
+            "data": {"cookie": request.headers.get("cookie")},
+        },
+        headers={"set-cookie": "account=expired; Path=/"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_reuses_cookieless_client():
+    async with Session(transport=httpx.MockTransport(ok_handler)) as session:
+        cookieless_client = session._cookieless_client
+
+        first = await session.get_from_api("https://h5.aoneroom.com/")
+        second = await session.get_from_api("https://h5.aoneroom.com/")
+
+        assert session._cookieless_client is cookieless_client
+        assert first["cookie"] is None
+        assert second["cookie"] is None
+        assert not cookieless_client.cookies
+
+    assert session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_get_sends_user_declared_cookies():
+    async with Session(
+        cookies={"lang": "en"}, transport=httpx.MockTransport(ok_handler)
+    ) as session:
+        await session.get_from_api("https://h5.aoneroom.com/")
+        content = await session.get_from_api("https://h5.aoneroom.com/")
+        assert content["cookie"] == "lang=en"
+
+
+def make_bootstrap_handler(calls: Counter):
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        if request.url.path.endswith("search-suggest"):
+            return httpx.Response(
+                200,
+                json={"code": 0, "message": "ok", "data": {}},
+                headers={"x-user": json.dumps(USER_INFO)},
+            )
+        if request.url.path.endswith("get-latest-app-pkgs"):
+            return httpx.Response(
+                200, json={"code": 0, "message": "ok", "data": [APP_INFO]}
+            )
+        return httpx.Response(200, json={"code": 0, "message": "ok", "data": {}})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_use_bootstraps_once():
+    calls = Counter()
+    transport = httpx.MockTransport(make_bootstrap_handler(calls))
+
+    async with Session(transport=transport) as session:
+        await asyncio.gather(
+            *(
+                session.post_to_api(
+                    "https://h5.aoneroom.com/search", json={"page": page}
+                )
+                for page in range(50)
+            )
+        )
+        assert session.user_info.token == USER_INFO["token"]
+        assert session.moviebox_app_info.versionCode == APP_INFO["versionCode"]
+
+    assert sum(calls.values()) == 52
+    assert calls["/wefeed-h5api-bff/subject/search-suggest"] == 1
+    assert calls["/wefeed-h5-bff/app/get-latest-app-pkgs"] == 1
+
+
+@pytest.mark.asyncio
+async def test_v2_concurrent_first_use_bootstraps_once():
+    calls = Counter()
+    transport = httpx.MockTransport(make_bootstrap_handler(calls))
+
+    async with moviebox_api.v2.requests.Session(transport=transport) as session:
+        await asyncio.gather(
+            *(
+                session.post_to_api(
+                    "https://h5.aoneroom.com/search", json={"page": page}
+                )
+                for page in range(50)
+            )
+        )
+
+    assert calls["/wefeed-h5api-bff/subject/search-suggest"] == 1
+    assert sum(calls.values()) == 51
+
+
+@pytest.mark.asyncio
+async def test_sessions_share_persisted_auth_details(tmp_path):
+    calls = Counter()
+    transport = httpx.MockTransport(make_bootstrap_handler(calls))
+    token_store = TokenStore(tmp_path / "tokens.json")
+
+    for _ in range(3):
+        async with Session(
+            transport=transport, token_store=token_store
+        ) as session:
+            await session.post_to_api("https://h5.aoneroom.com/search", json={})
+            assert session.user_info.token == USER_INFO["token"]
+            assert session._client.headers["Authorization"] == "Bearer abc"
+
+    assert calls["/wefeed-h5api-bff/subject/search-suggest"] == 1
+    assert token_store.get(Session._token_store_key) is not None
+
+
+@pytest.mark.asyncio
+async def test_rejected_auth_details_are_invalidated(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+    bootstrap_handler = make_bootstrap_handler(Counter())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/download":
+            return httpx.Response(401)
+        return bootstrap_handler(request)
+
+    async with Session(
+        transport=httpx.MockTransport(handler), token_store=token_store
+    ) as session:
+        await session.post_to_api("https://h5.aoneroom.com/search", json={})
+        assert token_store.get(Session._token_store_key) is not None
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await session.get_with_cookies("https://h5.aoneroom.com/download")
+
+        assert token_store.get(Session._token_store_key) is None
+
+
+def test_http2_falls_back_without_h2(monkeypatch):
+    monkeypatch.setenv("MOVIEBOX_HTTP2", "1")
+    assert resolve_http2(None) is (importlib.util.find_spec("h2") is not None)
+    assert resolve_http2(False) is False
+
+    monkeypatch.setattr(importlib.util, "find_spec", lambda name: None)
+    assert resolve_http2(True) is False
+    assert Session(http2=True)._http2 is False
+
+
+def test_api_items_parser_yields_items_per_chunk():
+    items = [{"subjectId": str(i), "title": f"Title {i}"} for i in range(50)]
+    document = {
+        "code": 0,
+        "message": "ok",
+        "data": {"pager": {"hasMore": True}, "items": items, "total": 1234567},
+    }
+    body = json.dumps(document, indent=1).encode()
+    parser = ApiItemsParser()
+    parsed = []
+
+    for start in range(0, len(body), 7):
+        parsed.append(parser.feed(body[start : start + 7]))
+
+    assert [item for chunk in parsed for item in chunk] == items
+    assert sum(1 for chunk in parsed if chunk) > 1
+    assert parser.close() == {
+        "code": 0,
+        "message": "ok",
+        "data": {"pager": {"hasMore": True}, "total": 1234567},
+    }
+
+
+def test_api_items_parser_decodes_each_value_once():
+    document = {
+        "code": 0,
+        "message": "ok",
+        "data": {
+            "blob": [{"title": 'a "[{" \\', "id": i} for i in range(2000)],
+            "items": [{"title": '}]" \\'}, "x", 1.5],
+        },
+    }
+    body = json.dumps(document).encode()
+
+    for chunk_size in (1, 3, 64):
+        parser = ApiItemsParser()
+        decoder = parser._json_decoder
+        decoded = []
+
+        def raw_decode(text, index):
+            decoded.append(index)
+            return json.JSONDecoder.raw_decode(decoder, text, index)
+
+        decoder.raw_decode = raw_decode
+        items = []
+
+        for start in range(0, len(body), chunk_size):
+            items += parser.feed(body[start : start + chunk_size])
+
+        assert items == document["data"]["items"]
+        assert parser.close()["data"]["blob"] == document["data"]["blob"]
+        assert len(decoded) < 20
+
+
+def test_api_items_parser_rejects_unsuccessful_response():
+    parser = ApiItemsParser()
+    with pytest.raises(UnsuccessfulResponseError):
+        parser.feed(b'{"code": 403, "message": "denied", "data": {"items": [1]')
+
+
+def test_unsuccessful_response_body_is_truncated():
+    body = json.dumps({"code": 1, "message": "x" * 100_000}).encode()
+    response = httpx.Response(
+        200, content=body, headers={"content-type": "application/json"}
+    )
+
+    with pytest.raises(UnsuccessfulResponseError) as error:
+        process_api_response(response)
+
+    assert len(str(error.value)) < 2_000
+
+
+@pytest.mark.asyncio
+async def test_aiter_items_from_api_streams_items():
+    items = [{"subjectId": str(i)} for i in range(1000)]
+
+    async def stream_body():
+        body = json.dumps(
+            {"code": 0, "message": "ok", "data": {"items": items}}
+        ).encode()
+        for start in range(0, len(body), 1024):
+            yield body[start : start + 1024]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=stream_body(),
+            headers={"content-type": "application/json; charset=utf-8"},
+        )
+
+    async with Session(transport=httpx.MockTransport(handler)) as session:
+        parsed = [
+            item
+            async for item in session.aiter_items_from_api(
+                "https://h5.aoneroom.com/wefeed-h5-bff/web/subject/list"
+            )
+        ]
+
+    assert parsed == items
+
+
+@pytest.mark.asyncio
+async def test_homepage_streams_content_items():
+    body = (project_dir / "assets/recons/home.json").read_bytes()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    async with moviebox_api.v2.requests.Session(
+        transport=httpx.MockTransport(handler)
+    ) as session:
+        categories = [
+            category async for category in Homepage(session).aiter_content_items()
+        ]
+
+    assert len(categories) == len(json.loads(body)["data"]["operatingList"])
+    assert categories[0].title == "Banner_Africa"
+
+
+@pytest.mark.asyncio
+async def test_persisted_cookies_keep_their_domain(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+    bootstrap_handler = make_bootstrap_handler(Counter())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = bootstrap_handler(request)
+        if request.url.path.endswith("get-latest-app-pkgs"):
+            response.headers["set-cookie"] = (
+                "account=123; Domain=.aoneroom.com; Path=/"
+            )
+        return response
+
+    transport = httpx.MockTransport(handler)
+
+    for _ in range(2):
+        async with Session(
+            transport=transport, token_store=token_store
+        ) as session:
+            await session.post_to_api("https://h5.aoneroom.com/search", json={})
+            (cookie,) = [
+                cookie
+                for cookie in session._client.cookies.jar
+                if cookie.name == "account"
+            ]
+            assert cookie.domain == ".aoneroom.com"
+            assert cookie.path == "/"
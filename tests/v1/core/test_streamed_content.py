@@ -0,0 +1,55 @@
+import json
+
+import httpx
+import pytest
+
+from moviebox_api.v1 import Session, TVSeriesDetails
+from moviebox_api.v1.extractor import JsonDetailsExtractorModel
+from tests.v1 import project_dir
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+
+PAGE_CONTENT = (project_dir / "assets/data/shannara-chronicles.page").read_bytes()
+CHUNK_SIZE = 16 * 1024
+
+
+def make_page_handler(sent_chunks: list[int], tail: bytes = b""):
+    content = PAGE_CONTENT + tail
+
+    async def stream_page():
+        for start in range(0, len(content), CHUNK_SIZE):
+            sent_chunks.append(start)
+            yield content[start : start + CHUNK_SIZE]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/detail/"):
+            return httpx.Response(200, content=stream_page())
+
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": [APP_INFO]},
+            headers={"x-user": json.dumps(USER_INFO)},
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_page_fetch_stops_after_json_script():
+    sent_chunks = []
+    tail = b"<div></div>" * 100_000
+
+    async with Session(
+        transport=httpx.MockTransport(make_page_handler(sent_chunks, tail))
+    ) as session:
+        item_details = TVSeriesDetails(
+            "/detail/the-shannara-chronicles-8MqAb6nBvC2", session, stream=True
+        )
+        extractor_model = await item_details.get_json_details_extractor_model()
+        content = await item_details.get_html_content()
+
+    assert type(content) is bytes
+    assert len(content) < len(PAGE_CONTENT) + CHUNK_SIZE
+    assert len(sent_chunks) < (len(PAGE_CONTENT) + len(tail)) / CHUNK_SIZE / 2
+    assert extractor_model.seasons == (
+        JsonDetailsExtractorModel(PAGE_CONTENT.decode()).seasons
+    )
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from moviebox_api.v1 import Search, SearchSuggestion, Session
+from moviebox_api.v1.models import SearchResultsModel, SuggestedItemsModel
+from moviebox_api.v1.title_index import TitleIndex, normalize_title
+from tests.v1 import project_dir
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+
+SEARCH_RESULTS = json.loads(
+    (project_dir / "assets/recons/search/all-results.json").read_text()
+)["data"]
+
+
+def make_index(tmp_path) -> TitleIndex:
+    index = TitleIndex(tmp_path / "titles.json")
+    index.add_from(SearchResultsModel(**SEARCH_RESULTS))
+    return index
+
+
+def test_normalize_title():
+    assert normalize_title("Pokémon: The Series S2") == [
+        "pokemon",
+        "the",
+        "series",
+    ]
+
+
+def test_lookup_by_prefix_and_misspelling(tmp_path):
+    index = make_index(tmp_path)
+    title = SEARCH_RESULTS["items"][0]["title"]
+    first_word = normalize_title(title)[0]
+
+    assert len(index) == len(SEARCH_RESULTS["items"])
+    assert title in [entry.title for entry in index.lookup(first_word[:3])]
+
+    misspelt = first_word[:-2] + first_word[-1] + first_word[-2]
+    assert title in [entry.title for entry in index.lookup(misspelt)]
+    assert not index.lookup(misspelt, fuzzy=False)
+    assert not index.lookup("zzzzqqqq")
+
+
+def test_save_and_load(tmp_path):
+    index = make_index(tmp_path)
+    index.save()
+    loaded = TitleIndex.load(index.path)
+
+    assert loaded.entries == index.entries
+    assert loaded.lookup("tit") == index.lookup("tit")
+    assert not TitleIndex.load(tmp_path / "missing.json")
+
+
+def make_handler(requested: list[str]):
+    async def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+
+        if path.endswith("/web/subject/search-suggest"):
+            requested.append(path)
+            await asyncio.sleep(0.01)
+            data = {
+                "items": [{"type": 1, "subject": None, "word": "Remote Word"}],
+                "keyword": json.loads(request.content)["keyword"],
+                "ops": "",
+            }
+
+        elif path.endswith("/subject/search"):
+            requested.append(path)
+            data = SEARCH_RESULTS
+
+        else:
+            return httpx.Response(
+                200,
+                json={"code": 0, "message": "ok", "data": [APP_INFO]},
+                headers={"x-user": json.dumps(USER_INFO)},
+            )
+
+        return httpx.Response(
+            200, json={"code": 0, "message": "ok", "data": data}
+        )
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_suggestions_answered_locally_then_refreshed(tmp_path):
+    requested = []
+    index = TitleIndex(tmp_path / "titles.json")
+
+    async with Session(
+        transport=httpx.MockTransport(make_handler(requested))
+    ) as session:
+        search = Search(session, "titanic", title_index=index)
+        await search.get_content_model()
+        assert len(index) == len(SEARCH_RESULTS["items"])
+
+        suggestion = SearchSuggestion(session, title_index=index)
+        title = SEARCH_RESULTS["items"][0]["title"]
+        contents = await suggestion.get_content_model(title[:4])
+
+        assert isinstance(contents, SuggestedItemsModel)
+        assert title in [item.word for item in contents.items]
+        assert requested.count("/wefeed-h5-bff/web/subject/search-suggest") == 0
+
+        await asyncio.gather(*suggestion._refresh_tasks)
+        assert index.lookup("remote wo")[0].title == "Remote Word"
+
+        # Unknown to the index - answered remotely
+        contents = await suggestion.get_content_model("qqq")
+        assert contents.items[0].word == "Remote Word"
+
+        local_items = await Search(
+            session, title[:4], title_index=index
+        ).get_local_items(refresh=False)
+        assert title in [entry.title for entry in local_items]
@@ -0,0 +1,75 @@
+import json
+
+import httpx
+import pytest
+
+from moviebox_api.v1 import Session, TVSeriesDetails
+from moviebox_api.v1.extractor import (
+    DetailsExtractionError,
+    JsonDetailsExtractor,
+    aextract_many,
+    extract_many,
+)
+from moviebox_api.v1.extractor.batch import shutdown_extraction_pool
+from moviebox_api.v1.extractor.models.json import ItemJsonDetailsModel
+from tests.v1.core.test_session import APP_INFO, USER_INFO
+from tests.v1.extractors import (
+    MOVIE_CONTENT_PATH,
+    TV_SERIES_CONTENT_PATH,
+    read_content,
+)
+
+
+@pytest.fixture(scope="module")
+def pages():
+    yield [
+        read_content(TV_SERIES_CONTENT_PATH),
+        read_content(MOVIE_CONTENT_PATH),
+        read_content(TV_SERIES_CONTENT_PATH),
+    ]
+    shutdown_extraction_pool()
+
+
+def test_extract_many_preserves_order(pages):
+    assert extract_many(pages, workers=2) == [
+        JsonDetailsExtractor.extract(page) for page in pages
+    ]
+
+
+def test_extract_many_returns_exceptions(pages):
+    details = extract_many(
+        ["<html></html>", pages[0]], workers=0, return_exceptions=True
+    )
+    assert isinstance(details[0], DetailsExtractionError)
+    assert details[1] == JsonDetailsExtractor.extract(pages[0])
+
+
+@pytest.mark.asyncio
+async def test_aextract_many_models_details(pages):
+    details = await aextract_many(pages, model=True)
+    assert all(isinstance(item, ItemJsonDetailsModel) for item in details)
+    assert details[1].resData.subject.title != details[0].resData.subject.title
+
+
+@pytest.mark.asyncio
+async def test_json_details_extractor_model_offloads_parsing(pages):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.startswith("/detail/"):
+            return httpx.Response(200, text=pages[0])
+        return httpx.Response(
+            200,
+            json={"code": 0, "message": "ok", "data": [APP_INFO]},
+            headers={"x-user": json.dumps(USER_INFO)},
+        )
+
+    async with Session(transport=httpx.MockTransport(handler)) as session:
+        item_details = TVSeriesDetails("/detail/merlin-sMxCiIO6fZ9", session)
+        extractor_model = await item_details.get_json_details_extractor_model(
+            offload=True
+        )
+
+    # Modelled on the pool
+    assert "details" in extractor_model.__dict__
+    assert extractor_model.seasons == (
+        JsonDetailsExtractor(pages[0]).get_details_extractor_model().seasons
+    )
@@ -1,6 +1,15 @@
 import pytest
 
-from moviebox_api.v1.extractor._core import JsonDetailsExtractor
+from moviebox_api.v1.extractor._core import (
+    JsonDetailsExtractor,
+    JsonDetailsExtractorModel,
+)
+from moviebox_api.v1.extractor.helpers import (
+    NuxtPayload,
+    find_json_script,
+    resolve_nuxt_payload,
+    souper,
+)
 from tests.v1.extractors import (
     content_names,
     content_paths,
@@ -21,3 +30,53 @@ def test_extract_whole_data(content_path):
     assert type(extractor.seasons) is list
     assert type(extractor.stars) is list
     assert type(extractor.page_details) is dict
+
+
+@pytest.mark.parametrize(content_names, content_paths)
+def test_sliced_json_script_matches_souped_one(content_path):
+    content = read_content(content_path)
+    souped_script = souper(content).find("script", {"type": "application/json"})
+    assert find_json_script(content) == souped_script.text
+    assert JsonDetailsExtractor.extract(content.encode()) == (
+        JsonDetailsExtractor.extract(content)
+    )
+
+
+def test_nuxt_payload_references_are_resolved_once():
+    data = [
+        ["ShallowReactive", 1],
+        {"a": 2, "b": 2, "c": 3},
+        ["Reactive", 4],
+        {"c": 3},
+        1,
+    ]
+    resolved = resolve_nuxt_payload(data)
+    assert resolved["a"] == ["Reactive", 1]
+    assert resolved["a"] is resolved["b"]
+    assert resolved["c"]["c"] is resolved["c"]  # cycle
+    assert resolve_nuxt_payload([["Set"]]) is None
+
+
+@pytest.mark.parametrize(content_names, content_paths)
+def test_only_accessed_details_are_resolved(content_path):
+    content = read_content(content_path)
+    details = JsonDetailsExtractor.extract(content)
+    extractor = JsonDetailsExtractor(content)
+
+    assert extractor.seasons == details["resData"]["resource"]["seasons"]
+    assert len(extractor.payload._resolved) < len(extractor.payload.data) / 2
+
+    modelled = JsonDetailsExtractorModel(content)
+    assert (
+        modelled.resource
+        == JsonDetailsExtractorModel.extract(content).resData.resource
+    )
+    assert "details" not in modelled.__dict__
+
+
+def test_nuxt_node_resolves_on_access():
+    payload = NuxtPayload([{"a": 1, "b": 2}, [3, "literal"], {"c": 3}, 4])
+    assert payload.root.a[0] == 4
+    assert payload.root["a"][1] == "literal"
+    assert payload.root.b.resolve() == {"c": 4}
+    assert list(payload._resolved) == [2, 3]
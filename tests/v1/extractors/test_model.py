@@ -1,8 +1,13 @@
+from collections import Counter
+
 import pytest
 from pydantic import BaseModel
 
+from moviebox_api.v1.extractor import _core
 from moviebox_api.v1.extractor._core import (
+    JsonDetailsExtractor,
     JsonDetailsExtractorModel,
+    TagDetailsExtractor,
     TagDetailsExtractorModel,
 )
 from tests.v1.extractors import (
@@ -39,3 +44,32 @@ def test_tag_details_extractor_model(content_path):
 
     assert isinstance(extractor.extract_reviews()[0], BaseModel)
     assert isinstance(extractor.extract_others(), BaseModel)
+
+
+@pytest.mark.parametrize(content_names, content_paths)
+def test_page_is_parsed_once(content_path, monkeypatch):
+    content = read_content(content_path)
+    calls = Counter()
+
+    def counted(name, function):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(_core, "souper", counted("souper", _core.souper))
+    monkeypatch.setattr(_core, "loads", counted("loads", _core.loads))
+
+    json_extractor = JsonDetailsExtractor(content)
+    json_model = json_extractor.get_details_extractor_model()
+    repr(json_extractor)
+    json_model.details, json_model.resource, json_extractor.details
+
+    tag_extractor = TagDetailsExtractor(content)
+    tag_model = tag_extractor.get_details_extractor_model()
+    repr(tag_extractor)
+    tag_extractor.details, tag_model.details, tag_model.extract_headers()
+
+    assert calls == Counter(souper=1, loads=1)
+    assert tag_extractor.extract_all() is tag_extractor.details
@@ -66,3 +66,12 @@ def test_extract_all(content_path):
 
     assert isinstance(extracted_details, dict)
     assert extracted_details.get("basics") is not None
+
+
+@pytest.mark.parametrize(content_names, content_paths)
+def test_scoped_parsing_extracts_same_details(content_path):
+    content = read_content(content_path)
+    assert (
+        TagDetailsExtractor(content, scoped=True).extract_all()
+        == TagDetailsExtractor(content, "html.parser", scoped=False).extract_all()
+    )
@@ -0,0 +1,140 @@
+import json
+
+import pytest
+
+from moviebox_api.v1.models import SearchResultsModel
+from moviebox_api.v2.types import FilterParams
+from moviebox_api.v3.catalog import (
+    CatalogCrawler,
+    CatalogStore,
+    CrawlSource,
+    SubjectDetails,
+)
+from moviebox_api.v3.models.details import SeasonsModel
+from moviebox_api.v3.models.downloadables import RootCaptionFileMetadata
+from tests.v1 import project_dir
+
+SEARCH_RESULTS = json.loads(
+    (project_dir / "assets/recons/search/all-results.json").read_text()
+)["data"]
+
+SEASONS = json.loads(
+    (project_dir / "assets/recons2/season-info-series.json").read_text()
+)
+
+CAPTIONS = json.loads(
+    (project_dir / "assets/recons2/caption-movie.json").read_text()
+)
+
+PER_PAGE = 8
+
+LAST_PAGE = len(SEARCH_RESULTS["items"]) // PER_PAGE
+
+
+class Listing:
+    """Paginated provider serving the recorded search results items"""
+
+    def __init__(self, items: list[dict], fail_at: int | None = None):
+        self._page = 1
+        self.items = items
+        self.fail_at = fail_at
+        self.fetched = []
+
+    async def get_content_model(self) -> SearchResultsModel:
+        self.fetched.append(self._page)
+
+        if self._page == self.fail_at:
+            raise ConnectionError("Connection dropped")
+
+        start = (self._page - 1) * PER_PAGE
+        return SearchResultsModel(
+            pager={
+                "hasMore": self._page < LAST_PAGE,
+                "nextPage": self._page + 1,
+                "page": self._page,
+                "perPage": PER_PAGE,
+                "totalCount": len(self.items),
+            },
+            items=self.items[start : start + PER_PAGE],
+        )
+
+
+class DetailsFetcher:
+    def __init__(self):
+        self.fetched = []
+
+    async def fetch(self, subject_id: str, throttle) -> SubjectDetails:
+        async with throttle():
+            self.fetched.append(subject_id)
+
+        return SubjectDetails(
+            seasons=SeasonsModel.model_validate(
+                SEASONS | {"subjectId": subject_id}
+            ),
+            captions=RootCaptionFileMetadata.model_validate(
+                CAPTIONS | {"subjectId": subject_id}
+            ),
+        )
+
+
+async def crawl(store: CatalogStore, listing: Listing, details=None):
+    return await CatalogCrawler(
+        store, [CrawlSource("listing", listing)], details=details, rate=None
+    ).crawl()
+
+
+@pytest.mark.asyncio
+async def test_crawl_stores_subjects_then_stops_at_unchanged(tmp_path):
+    items = [dict(item) for item in SEARCH_RESULTS["items"]]
+    details = DetailsFetcher()
+
+    with CatalogStore(tmp_path / "catalog.sqlite3") as store:
+        summary = await crawl(store, Listing(items), details)
+
+        assert summary.pages == LAST_PAGE
+        assert summary.new == len(store) == len(items)
+        assert summary.sources[0].completed
+        assert len(details.fetched) == len(items)
+        assert store.count("seasons") == len(items) * len(SEASONS["seasons"])
+        assert store.count("captions") == len(items) * len(
+            CAPTIONS["extCaptions"]
+        )
+        assert summary.requests == LAST_PAGE + len(items)
+
+        items[1] = items[1] | {"title": "Renamed"}
+        listing = Listing(items)
+        details.fetched.clear()
+        summary = await crawl(store, listing, details)
+
+        assert listing.fetched == [1, 2]
+        assert summary.updated == 1
+        assert details.fetched == [items[1]["subjectId"]]
+        assert store.get_subject(items[1]["subjectId"])["title"] == "Renamed"
+        assert summary.sources[0].stopped_early
+        assert "up to date" in summary.report()
+
+
+@pytest.mark.asyncio
+async def test_interrupted_crawl_resumes_from_checkpoint(tmp_path):
+    items = SEARCH_RESULTS["items"]
+
+    with CatalogStore(tmp_path / "catalog.sqlite3") as store:
+        summary = await crawl(store, Listing(items, fail_at=2))
+
+        assert isinstance(summary.sources[0].error, ConnectionError)
+        assert store.get_checkpoint("listing").next_page == 2
+        assert len(store) == PER_PAGE
+
+        listing = Listing(items)
+        summary = await crawl(store, listing)
+
+        assert listing.fetched == [2, 3]
+        assert summary.sources[0].resumed_from == 2
+        assert len(store) == len(items)
+        assert store.get_checkpoint("listing").completed
+
+
+def test_filter_params_sweep():
+    sweep = FilterParams.sweep(genre=["Action", "Drama"], year=["2024", "2025"])
+    assert len(sweep) == 4
+    assert FilterParams(genre="Drama", year="2025") in sweep
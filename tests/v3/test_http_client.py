@@ -0,0 +1,213 @@
+import asyncio
+import json
+from collections import Counter
+
+import httpx
+import pytest
+
+from moviebox_api.v1.token_store import TokenStore
+from moviebox_api.v3.hedging import HedgePolicy, HedgeStats
+from moviebox_api.v3.host_health import CircuitState, HostHealthTracker
+from moviebox_api.v3.http_client import MovieBoxHttpClient
+from moviebox_api.v3.urls import MAIN_PAGE_PATH, SEARCH_PATH
+
+HOST_POOL = ["https://api6.aoneroom.com", "https://api5.aoneroom.com"]
+
+
+def ok_response(token: str = "runtime-token") -> httpx.Response:
+    return httpx.Response(
+        200,
+        json={"code": 0, "message": "ok", "data": {}},
+        headers={"x-user": json.dumps({"token": token})},
+    )
+
+
+@pytest.mark.asyncio
+async def test_runtime_token_is_persisted_and_reused(tmp_path):
+    calls = Counter()
+    token_store = TokenStore(tmp_path / "tokens.json")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.path] += 1
+        return ok_response()
+
+    for _ in range(3):
+        async with MovieBoxHttpClient(
+            host_pool=HOST_POOL,
+            auth_token=None,
+            token_store=token_store,
+            transport=httpx.MockTransport(handler),
+        ) as client_session:
+            assert client_session._runtime_token == "runtime-token"
+
+    assert calls[MAIN_PAGE_PATH] == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_runtime_token_is_invalidated(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+    token_store.set(MovieBoxHttpClient._token_store_key, {"token": "stale"})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("Authorization") == "Bearer stale":
+            return httpx.Response(401)
+        return ok_response()
+
+    async with MovieBoxHttpClient(
+        host_pool=HOST_POOL,
+        auth_token=None,
+        token_store=token_store,
+        transport=httpx.MockTransport(handler),
+    ) as client_session:
+        assert client_session._runtime_token == "stale"
+        _, response = await client_session.get("/wefeed-mobile-bff/anything")
+        assert response.status_code == 200
+
+    assert token_store.get(MovieBoxHttpClient._token_store_key) == {
+        "token": "runtime-token"
+    }
+
+
+@pytest.mark.asyncio
+async def test_blocked_persisted_token_is_replaced_without_failover(tmp_path):
+    calls = Counter()
+    token_store = TokenStore(tmp_path / "tokens.json")
+    token_store.set(MovieBoxHttpClient._token_store_key, {"token": "stale"})
+    host_health = HostHealthTracker(HOST_POOL, failure_threshold=1)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.host, request.url.path] += 1
+        if request.headers.get("Authorization") == "Bearer stale":
+            return httpx.Response(403)
+        return ok_response("fresh-token")
+
+    async with MovieBoxHttpClient(
+        host_pool=HOST_POOL,
+        auth_token=None,
+        token_store=token_store,
+        host_health=host_health,
+        transport=httpx.MockTransport(handler),
+    ) as client_session:
+        base, response = await client_session.get("/wefeed-mobile-bff/anything")
+        assert (base, response.status_code) == (HOST_POOL[0], 200)
+        assert client_session._runtime_token == "fresh-token"
+
+    assert token_store.get(MovieBoxHttpClient._token_store_key) == {
+        "token": "fresh-token"
+    }
+    assert calls == {
+        ("api6.aoneroom.com", "/wefeed-mobile-bff/anything"): 2,
+        ("api6.aoneroom.com", MAIN_PAGE_PATH): 1,
+    }
+    assert all(
+        host_health[host].state is CircuitState.CLOSED for host in HOST_POOL
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_stick_to_last_good_host():
+    calls = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.url.host] += 1
+        if request.url.host == "api6.aoneroom.com":
+            raise httpx.ConnectError("down", request=request)
+        return ok_response()
+
+    async with MovieBoxHttpClient(
+        host_pool=HOST_POOL,
+        auth_token="token",
+        transport=httpx.MockTransport(handler),
+    ) as client_session:
+        for _ in range(5):
+            base, _ = await client_session.get("/wefeed-mobile-bff/anything")
+            assert base == HOST_POOL[1]
+
+    assert calls == {"api6.aoneroom.com": 1, "api5.aoneroom.com": 5}
+
+
+def test_host_circuit_opens_and_recovers():
+    tracker = HostHealthTracker(HOST_POOL, failure_threshold=2, cooldown=60)
+
+    for _ in range(2):
+        tracker.record_failure(HOST_POOL[0])
+
+    assert tracker[HOST_POOL[0]].state is CircuitState.OPEN
+    assert tracker.ordered_hosts(HOST_POOL[0]) == [HOST_POOL[1], HOST_POOL[0]]
+    assert not tracker.acquire(HOST_POOL[0])
+
+    tracker.cooldown = 0
+    assert tracker.acquire(HOST_POOL[0])
+    assert tracker[HOST_POOL[0]].state is CircuitState.HALF_OPEN
+    assert not tracker.acquire(HOST_POOL[0])  # single probe
+
+    tracker.record_success(HOST_POOL[0], latency=0.5)
+    tracker.record_success(HOST_POOL[1], latency=0.1)
+    assert tracker[HOST_POOL[0]].state is CircuitState.CLOSED
+    assert tracker.ordered_hosts() == [HOST_POOL[1], HOST_POOL[0]]
+
+
+@pytest.mark.asyncio
+async def test_slow_host_is_hedged():
+    signatures = {}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        signatures[request.url.host] = request.headers["x-tr-signature"]
+        if request.url.host == "api6.aoneroom.com":
+            await asyncio.sleep(5)
+        return ok_response()
+
+    hedge = HedgePolicy(delay=0.05)
+
+    async with MovieBoxHttpClient(
+        host_pool=HOST_POOL,
+        auth_token="token",
+        hedge=hedge,
+        transport=httpx.MockTransport(handler),
+    ) as client_session:
+        base, _ = await client_session.post(SEARCH_PATH, json={"keyword": "a"})
+        assert base == HOST_POOL[1]
+
+        # Sticks to the winner
+        base, _ = await client_session.post(SEARCH_PATH, json={"keyword": "b"})
+        assert base == HOST_POOL[1]
+
+    assert signatures[HOST_POOL[0][8:]] != signatures[HOST_POOL[1][8:]]
+    assert hedge.stats == HedgeStats(eligible=2, hedged=1, hedge_wins=1)
+
+
+def test_hedge_rate_is_capped():
+    hedge = HedgePolicy(max_ratio=0.1)
+    hedge.stats.eligible = 1
+    assert hedge.allow_hedge()
+
+    hedge.stats.hedged = 2
+    hedge.stats.eligible = 5
+    assert not hedge.allow_hedge()
+    assert hedge.stats.capped == 1
+
+    for latency in range(1, 101):
+        hedge.record_latency(latency / 100)
+    assert hedge.get_delay() == pytest.approx(0.95, abs=0.01)
+
+
+@pytest.mark.asyncio
+async def test_rejected_token_refetch_does_not_deadlock(tmp_path):
+    token_store = TokenStore(tmp_path / "tokens.json")
+    token_store.set(MovieBoxHttpClient._token_store_key, {"token": "stored"})
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(401)
+
+    async with MovieBoxHttpClient(
+        host_pool=HOST_POOL,
+        auth_token=None,
+        token_store=token_store,
+        transport=httpx.MockTransport(handler),
+    ) as client_session:
+        assert client_session._token_from_store
+
+        with pytest.raises(Exception) as exc_info:
+            await asyncio.wait_for(client_session._init_client(force=True), 5)
+
+        assert not isinstance(exc_info.value, TimeoutError)